@@ -2,7 +2,7 @@ import functools
 import os
 import shutil
 from typing import Any
-from typing import List, Tuple
+from typing import Tuple
 from typing import Union, Callable
 
 import numpy as np
@@ -16,7 +16,7 @@ from sobol_seq import i4_sobol_generate
 
 def generate_sobol_positions(
     num_points: int, box_dims: Tuple[float, float, float]
-) -> Tuple[List[float], List[float], List[float]]:
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
     Generate Sobol sequence points within a given 3D box.
 
@@ -24,8 +24,8 @@ def generate_sobol_positions(
     :type num_points: int
     :param box_dims: Dimensions of the box (x_dim, y_dim, z_dim).
     :type box_dims: Tuple[float, float, float]
-    :return: Three lists of x, y, and z coordinates.
-    :rtype: Tuple[List[float], List[float], List[float]]
+    :return: Three arrays of x, y, and z coordinates.
+    :rtype: Tuple[np.ndarray, np.ndarray, np.ndarray]
     """
 
     # Generate the Sobol sequence for the desired number of points [0,1]
@@ -34,10 +34,9 @@ def generate_sobol_positions(
     )  # Assume the function is imported as needed
 
     # Transform the Sobol sequence to match the dimensions of the box
-    for i in range(3):
-        sobol_points[:, i] *= box_dims[i]
+    sobol_points *= box_dims
 
-    return list(sobol_points[:, 0]), list(sobol_points[:, 1]), list(sobol_points[:, 2])
+    return sobol_points[:, 0], sobol_points[:, 1], sobol_points[:, 2]
 
 
 def clear_folder(folder_path: Union[str, os.PathLike]) -> None:
@@ -99,6 +98,36 @@ def split_number(number_str: str, right_part_length: int) -> tuple:
     return left_part, right_part
 
 
+def fix_mol_block(mol_block: str) -> str:
+    """
+    Fix the contents of a Molecular Structure File (MOL file) by making specific modifications.
+
+    :param mol_block: The contents of the MOL file (e.g., from Chem.MolToMolBlock).
+    :type mol_block: str
+    :return: The fixed contents.
+    :rtype: str
+    """
+    fixed_lines = []
+    for line in mol_block.splitlines(keepends=True):
+        line_split = line.split()
+        if len(line_split) == 10:
+            left_part, right_part = split_number(
+                number_str=line_split[0], right_part_length=3
+            )
+            line_split[0] = " ".join([left_part, right_part])
+            fixed_lines.append(" ".join(line_split) + "\n")
+        elif len(line_split) == 3:
+            left_part, right_part = split_number(
+                number_str=line_split[0], right_part_length=3
+            )
+            line_split[0] = " ".join([left_part, right_part])
+            fixed_lines.append(" " + " ".join(line_split) + "\n")
+        else:
+            # Atom (16 fields), bond (4 fields) and any other lines are kept as they are
+            fixed_lines.append(line)
+    return "".join(fixed_lines)
+
+
 def fix_mol_file(file: str) -> None:
     """
     Fix a Molecular Structure File (MOL file) by making specific modifications.
@@ -107,42 +136,16 @@ def fix_mol_file(file: str) -> None:
     :type file: str
     :return: None
     """
-    nbr_of_atoms: int = 0
-    nbr_of_bonds: int = 0
-
     # Get the full path of the input file
     full_path: str = os.path.abspath(file)
-    # Get the directory name from the full path
-    directory_name: str = os.path.dirname(full_path)
-    # Create the full path for the output file
-    write_file_path: str = os.path.join(directory_name, "fixed.mol")
-
-    with open(file=full_path, mode="r") as read_file, open(
-        write_file_path, "w"
-    ) as write_file:
-        for line in read_file:
-            line_split = line.split()
-            if len(line_split) == 10:
-                left_part, right_part = split_number(
-                    number_str=line_split[0], right_part_length=3
-                )
-                line_split[0] = " ".join([left_part, right_part])
-                write_file.write(" ".join(line_split) + "\n")
-            elif len(line_split) == 16:
-                nbr_of_atoms += 1
-                write_file.write(line)
-            elif len(line_split) == 4:
-                nbr_of_bonds += 1
-                write_file.write(line)
-            elif len(line_split) == 3:
-                nbr_of_bonds += 1
-                left_part, right_part = split_number(
-                    number_str=line_split[0], right_part_length=3
-                )
-                line_split[0] = " ".join([left_part, right_part])
-                write_file.write(" " + " ".join(line_split) + "\n")
-            else:
-                write_file.write(line)
+    # Create the full path for the output file (next to, and named after, the input
+    # file, so several files in the same directory can be fixed concurrently)
+    write_file_path: str = f"{full_path}.fixed"
+
+    with open(file=full_path, mode="r") as read_file:
+        mol_block = read_file.read()
+    with open(write_file_path, "w") as write_file:
+        write_file.write(fix_mol_block(mol_block))
 
     # Replace the original MOL file with the fixed file
     os.replace(write_file_path, full_path)
@@ -174,115 +177,276 @@ def translate_molecule(mol_obj: Any, x: float, y: float, z: float) -> None:
         conformer.SetAtomPosition(i, new_position)
 
 
-def extract_atom_positions_from_mol_obj_list(
-    mol_obj_list: List[Any],
-) -> Tuple[List[float], List[float], List[float]]:
+@jit(nopython=True, parallel=True, fastmath=True, cache=True)
+def compute_total_lj_potential(
+    xyz: np.ndarray,
+    box_dimensions: np.ndarray,
+    rcut: float,
+    epsilon: float = 1.0,
+    sigma: float = 1.0,
+) -> float:
     """
-    Extract x, y, and z atomic coordinates from a list of molecule objects.
+    Compute the total Lennard-Jones potential energy of a system of particles.
 
-    :param mol_obj_list: A list of molecule objects.
-    :type mol_obj_list: List[Any]
-    :return: Lists of x, y, and z coordinates for all atoms in all molecules.
-    :rtype: Tuple[List[float], List[float], List[float]]
+    :param xyz: (N, 3) array with the coordinates of the particles.
+    :type xyz: np.ndarray
+    :param box_dimensions: Dimensions of the periodic box, as a 3-element array.
+    :type box_dimensions: np.ndarray
+    :param rcut: Cutoff distance for interactions.
+    :type rcut: float
+    :param epsilon: The depth of the potential well, defaults to 1.0.
+    :type epsilon: float, optional
+    :param sigma: The finite distance where the inter-particle potential is zero, defaults to 1.0.
+    :type sigma: float, optional
+    :return: The total Lennard-Jones potential energy of the system.
+    :rtype: float
     """
 
-    atoms_pos_x, atoms_pos_y, atoms_pos_z = [], [], []
-
-    # Loop through each molecule object in the list
-    for mol in mol_obj_list:
-        conf = mol.GetConformer()
+    n_particles = xyz.shape[0]
+    rcut2 = rcut * rcut
+    sig6 = sigma**6
+    lx, ly, lz = box_dimensions[0], box_dimensions[1], box_dimensions[2]
+    total_potential_energy = 0.0
 
-        # Loop through each atom in the molecule
-        for atom in mol.GetAtoms():
-            pos = conf.GetAtomPosition(atom.GetIdx())
-            atoms_pos_x.append(pos.x)
-            atoms_pos_y.append(pos.y)
-            atoms_pos_z.append(pos.z)
+    # Parallel loop over the first particle of each pair
+    for i in prange(n_particles):
+        xi, yi, zi = xyz[i, 0], xyz[i, 1], xyz[i, 2]
+        for j in range(i + 1, n_particles):
+            # Minimum-image separation under periodic boundary conditions
+            dx = xi - xyz[j, 0]
+            dy = yi - xyz[j, 1]
+            dz = zi - xyz[j, 2]
+            dx -= lx * np.rint(dx / lx)
+            dy -= ly * np.rint(dy / ly)
+            dz -= lz * np.rint(dz / lz)
+
+            # Compare squared distances, so no square root is needed
+            r2 = dx * dx + dy * dy + dz * dz
+            if r2 < rcut2:
+                s6 = sig6 / (r2 * r2 * r2)
+                total_potential_energy += 4.0 * epsilon * (s6 * s6 - s6)
 
-    return atoms_pos_x, atoms_pos_y, atoms_pos_z
+    return total_potential_energy
 
 
-@jit(nopython=True)
-def lennard_jones_potential(
-    rij: float, epsilon: float = 1.0, sigma: float = 1.0
+@jit(nopython=True, parallel=True, fastmath=True, cache=True)
+def compute_total_lj_potential_fp32(
+    x: np.ndarray,
+    y: np.ndarray,
+    z: np.ndarray,
+    box_dimensions: np.ndarray,
+    rcut: float,
+    epsilon: float = 1.0,
+    sigma: float = 1.0,
 ) -> float:
     """
-    Calculate the Lennard-Jones potential between two particles separated by a distance rij.
+    Single-precision variant of compute_total_lj_potential for large systems.
+
+    Coordinates are passed as separate contiguous float32 arrays, so that the inner
+    loop over pairs can be vectorized with twice as many lanes as in double precision.
+    Each particle's pair energies are summed in float32 and added to a float64 total.
 
-    :param rij: The separation distance between two particles.
-    :type rij: float
+    :param x, y, z: Contiguous float32 arrays with the coordinates of the particles.
+    :param box_dimensions: Dimensions of the periodic box, as a 3-element array.
+    :type box_dimensions: np.ndarray
+    :param rcut: Cutoff distance for interactions.
+    :type rcut: float
     :param epsilon: The depth of the potential well, defaults to 1.0.
     :type epsilon: float, optional
     :param sigma: The finite distance where the inter-particle potential is zero, defaults to 1.0.
     :type sigma: float, optional
-    :return: The Lennard-Jones potential energy.
+    :return: The total Lennard-Jones potential energy of the system.
     :rtype: float
     """
 
-    return 4.0 * epsilon * ((sigma / rij) ** 12 - (sigma / rij) ** 6)
+    n_particles = x.shape[0]
+    rcut2 = np.float32(rcut * rcut)
+    sig6 = np.float32(sigma**6)
+    four_epsilon = np.float32(4.0 * epsilon)
+    lx = np.float32(box_dimensions[0])
+    ly = np.float32(box_dimensions[1])
+    lz = np.float32(box_dimensions[2])
+    inv_lx = np.float32(1.0) / lx
+    inv_ly = np.float32(1.0) / ly
+    inv_lz = np.float32(1.0) / lz
+    total_potential_energy = 0.0
 
+    # Parallel loop over the first particle of each pair
+    for i in prange(n_particles):
+        xi, yi, zi = x[i], y[i], z[i]
+        particle_energy = np.float32(0.0)
+        for j in range(i + 1, n_particles):
+            # Minimum-image separation under periodic boundary conditions
+            dx = xi - x[j]
+            dy = yi - y[j]
+            dz = zi - z[j]
+            dx -= lx * np.rint(dx * inv_lx)
+            dy -= ly * np.rint(dy * inv_ly)
+            dz -= lz * np.rint(dz * inv_lz)
+
+            r2 = dx * dx + dy * dy + dz * dz
+            if r2 < rcut2:
+                s6 = sig6 / (r2 * r2 * r2)
+                particle_energy += four_epsilon * (s6 * s6 - s6)
+        total_potential_energy += particle_energy
 
-@jit(nopython=True)
-def compute_distance(
-    x1: float,
-    y1: float,
-    z1: float,
-    x2: float,
-    y2: float,
-    z2: float,
-    box_dimensions: Tuple[float, float, float],
-) -> float:
+    return total_potential_energy
+
+
+# Offsets of a cell and its 13 "forward" neighbours. Together with the 13 opposite
+# offsets (covered when the neighbour visits this cell) they span all 27 cells.
+_HALF_SHELL_OFFSETS = np.array(
+    [(0, 0, 0)]
+    + [
+        (ox, oy, oz)
+        for oz in (-1, 0, 1)
+        for oy in (-1, 0, 1)
+        for ox in (-1, 0, 1)
+        if (oz, oy, ox) > (0, 0, 0)
+    ],
+    dtype=np.int64,
+)
+
+
+def count_lj_cells(box_dimensions: np.ndarray, rcut: float) -> np.ndarray:
     """
-    Compute the distance between two points with periodic boundary conditions.
+    Return the number of linked cells per box dimension for a given cutoff.
 
-    :param x1, y1, z1: Coordinates of the first point.
-    :param x2, y2, z2: Coordinates of the second point.
-    :param box_dimensions: Dimensions of the periodic box.
-    :type box_dimensions: Tuple[float, float, float]
-    :return: The distance between the two points.
-    :rtype: float
+    Cells are at least rcut wide, so every interacting pair lies in the same or in
+    neighbouring cells.
+
+    :param box_dimensions: Dimensions of the periodic box, as a 3-element array.
+    :type box_dimensions: np.ndarray
+    :param rcut: Cutoff distance for interactions.
+    :type rcut: float
+    :return: Number of cells along x, y and z.
+    :rtype: np.ndarray
     """
+    box_dimensions = np.asarray(box_dimensions, dtype=np.float64)
+    return np.floor(box_dimensions / rcut).astype(np.int64)
 
-    dx = x1 - x2
-    dy = y1 - y2
-    dz = z1 - z2
 
-    # Apply periodic boundary conditions
-    dx = dx - box_dimensions[0] * np.round(dx / box_dimensions[0])
-    dy = dy - box_dimensions[1] * np.round(dy / box_dimensions[1])
-    dz = dz - box_dimensions[2] * np.round(dz / box_dimensions[2])
+def build_cell_list(
+    xyz: np.ndarray, box_dimensions: np.ndarray, n_cells: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Bin particles into a periodic grid of linked cells.
+
+    :param xyz: (N, 3) array with the coordinates of the particles.
+    :type xyz: np.ndarray
+    :param box_dimensions: Dimensions of the periodic box, as a 3-element array.
+    :type box_dimensions: np.ndarray
+    :param n_cells: Number of cells along x, y and z (see count_lj_cells).
+    :type n_cells: np.ndarray
+    :return: CSR-style (cell_start, sorted_atom_idx): the particles of cell c are
+        sorted_atom_idx[cell_start[c]:cell_start[c + 1]]. Cells are numbered
+        cx + ncx * (cy + ncy * cz).
+    :rtype: Tuple[np.ndarray, np.ndarray]
+    """
+    box_dimensions = np.asarray(box_dimensions, dtype=np.float64)
+
+    # Wrap positions into the box and compute each particle's cell
+    wrapped = np.mod(xyz, box_dimensions)
+    cell_xyz = np.minimum(
+        (wrapped / (box_dimensions / n_cells)).astype(np.int64), n_cells - 1
+    )
+    cell_index = cell_xyz[:, 0] + n_cells[0] * (
+        cell_xyz[:, 1] + n_cells[1] * cell_xyz[:, 2]
+    )
+
+    sorted_atom_idx = np.argsort(cell_index, kind="stable")
+    cell_start = np.zeros(int(np.prod(n_cells)) + 1, dtype=np.int64)
+    atoms_per_cell = np.bincount(cell_index, minlength=len(cell_start) - 1)
+    np.cumsum(atoms_per_cell, out=cell_start[1:])
+    return cell_start, sorted_atom_idx
+
+
+@jit(nopython=True, parallel=True, fastmath=True, cache=True)
+def _lj_cell_list_kernel(
+    xyz, box_dimensions, n_cells, cell_start, sorted_atom_idx, rcut, epsilon, sigma
+):
+    ncx, ncy, ncz = n_cells[0], n_cells[1], n_cells[2]
+    rcut2 = rcut * rcut
+    sig6 = sigma**6
+    lx, ly, lz = box_dimensions[0], box_dimensions[1], box_dimensions[2]
+    total_potential_energy = 0.0
 
-    # Calculate squared distance
-    r_squared = dx**2 + dy**2 + dz**2
+    # Parallel loop over cells; each cell pairs with itself and its forward neighbours
+    for c in prange(ncx * ncy * ncz):
+        cx = c % ncx
+        cy = (c // ncx) % ncy
+        cz = c // (ncx * ncy)
+        cell_energy = 0.0
+        for k in range(_HALF_SHELL_OFFSETS.shape[0]):
+            nx = (cx + _HALF_SHELL_OFFSETS[k, 0]) % ncx
+            ny = (cy + _HALF_SHELL_OFFSETS[k, 1]) % ncy
+            nz = (cz + _HALF_SHELL_OFFSETS[k, 2]) % ncz
+            neighbour = nx + ncx * (ny + ncy * nz)
+            for a in range(cell_start[c], cell_start[c + 1]):
+                i = sorted_atom_idx[a]
+                xi, yi, zi = xyz[i, 0], xyz[i, 1], xyz[i, 2]
+                # Within the cell itself, only count each pair once
+                first = a + 1 if neighbour == c else cell_start[neighbour]
+                for b in range(first, cell_start[neighbour + 1]):
+                    j = sorted_atom_idx[b]
+                    dx = xi - xyz[j, 0]
+                    dy = yi - xyz[j, 1]
+                    dz = zi - xyz[j, 2]
+                    dx -= lx * np.rint(dx / lx)
+                    dy -= ly * np.rint(dy / ly)
+                    dz -= lz * np.rint(dz / lz)
+                    r2 = dx * dx + dy * dy + dz * dz
+                    if r2 < rcut2:
+                        s6 = sig6 / (r2 * r2 * r2)
+                        cell_energy += 4.0 * epsilon * (s6 * s6 - s6)
+        total_potential_energy += cell_energy
 
-    return np.sqrt(r_squared)
+    return total_potential_energy
 
 
-@jit(nopython=True, parallel=True)
-def compute_total_lj_potential(x, y, z, box_dimensions, rcut: float) -> float:
+def compute_total_lj_potential_cell_list(
+    xyz: np.ndarray,
+    box_dimensions: np.ndarray,
+    rcut: float,
+    epsilon: float = 1.0,
+    sigma: float = 1.0,
+) -> float:
     """
-    Compute the total Lennard-Jones potential energy of a system of particles.
+    Compute the total Lennard-Jones potential energy using a linked-cell list.
+
+    Only particles in the same or neighbouring cells are paired, which makes the cost
+    linear in the number of particles at uniform density. The box must be at least
+    three cutoffs long in every dimension (see count_lj_cells); otherwise the all-pairs
+    compute_total_lj_potential is used.
 
-    :param x, y, z: Lists containing the coordinates of the particles.
-    :param box_dimensions: Dimensions of the periodic box.
-    :type box_dimensions: Tuple[float, float, float]
+    :param xyz: (N, 3) array with the coordinates of the particles.
+    :type xyz: np.ndarray
+    :param box_dimensions: Dimensions of the periodic box, as a 3-element array.
+    :type box_dimensions: np.ndarray
     :param rcut: Cutoff distance for interactions.
     :type rcut: float
+    :param epsilon: The depth of the potential well, defaults to 1.0.
+    :type epsilon: float, optional
+    :param sigma: The finite distance where the inter-particle potential is zero, defaults to 1.0.
+    :type sigma: float, optional
     :return: The total Lennard-Jones potential energy of the system.
     :rtype: float
     """
-
-    n_particles = len(x)
-    total_potential_energy = 0.0
-
-    # Parallel loop over all pairs of particles
-    for i in prange(n_particles):
-        for j in prange(i + 1, n_particles):
-            r = compute_distance(x[i], y[i], z[i], x[j], y[j], z[j], box_dimensions)
-            if r < rcut:
-                total_potential_energy += lennard_jones_potential(r)
-
-    return total_potential_energy
+    n_cells = count_lj_cells(box_dimensions, rcut)
+    if n_cells.min() < 3:
+        return compute_total_lj_potential(xyz, box_dimensions, rcut, epsilon, sigma)
+
+    cell_start, sorted_atom_idx = build_cell_list(xyz, box_dimensions, n_cells)
+    return _lj_cell_list_kernel(
+        xyz,
+        np.asarray(box_dimensions, dtype=np.float64),
+        n_cells,
+        cell_start,
+        sorted_atom_idx,
+        float(rcut),
+        float(epsilon),
+        float(sigma),
+    )
 
 
 def add_molecules_by_type(
@@ -1,7 +1,21 @@
+import functools
+import io
+import itertools
+import shutil
 import textwrap
+import types
 import inputs
 import scymol.backend.lammps_functions as lf
-from typing import List, Tuple
+from typing import (
+    Any,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+    Union,
+)
 
 dict_of_variables = {
     "R": "0.00198722",
@@ -98,16 +112,177 @@ std_list_avetime_properties_mda = [
     "v_zlo",
 ]
 
+# Pre-joined forms of the default property lists, used when callers pass the
+# default lists themselves.
+_THERMO_STYLE_MDA_JOINED = " ".join(list_thermo_style_mda)
+_AVETIME_PROPS_MDA_JOINED = " ".join(std_list_avetime_properties_mda)
+
 lammps_simulation_stages = inputs.lammps_stages_and_methods
 
+# Shared wrapper for stage/substage descriptions (76 characters per line).
+_WRAPPER = textwrap.TextWrapper(width=76)
+
+
+@functools.lru_cache(maxsize=256)
+def _wrap_cached(description: str) -> Tuple[str, ...]:
+    """
+    Wrap a stage description with the shared TextWrapper, memoizing the result.
+
+    Args:
+        description (str): The description to be wrapped.
+
+    Returns:
+        Tuple[str, ...]: The wrapped lines.
+    """
+    return tuple(_WRAPPER.wrap(description))
+
+
+# Template shared by every comment block in the script (stage titles, substage
+# titles and plain comments): a heading line and an optional body between rules.
+_RULE = "#" + "-" * 79
+_TITLE_BLOCK_TEMPLATE = f"{_RULE}\n# {{heading}}\n{{body}}{_RULE}"
+
+
+def _render_title_block(heading: str, description: str) -> str:
+    """
+    Render a title comment block with a wrapped description.
+
+    Args:
+        heading (str): The heading line (without the leading '# ').
+        description (str): The description, wrapped to 76 characters per line.
+
+    Returns:
+        str: The comment block, without a trailing newline.
+    """
+    body = "".join(f"# {line}\n" for line in _wrap_cached(description))
+    return _TITLE_BLOCK_TEMPLATE.format(heading=heading, body=body)
+
+
+@functools.lru_cache(maxsize=None)
+def _rho_average_vars(fix_id: str) -> Tuple[Tuple[str, str, str], ...]:
+    """
+    Return the variable definitions for the time-averaged box bounds of a fix.
+
+    Args:
+        fix_id (str): The identifier of the fix/ave/time averaging the box bounds.
+
+    Returns:
+        Tuple[Tuple[str, str, str], ...]: (var_name, var_expression, var_style) for
+            the six averaged bounds followed by the cubic edge length 'lcubic'.
+    """
+    bounds = tuple(
+        (f"{axis}{side}ave", f"f_{fix_id}[{index}]", "equal")
+        for index, (axis, side) in enumerate(
+            itertools.product("xyz", ("lo", "hi")), start=1
+        )
+    )
+    lcubic = (
+        "lcubic",
+        "abs(((v_xhiave-v_xloave)*(v_yhiave-v_yloave)*(v_zhiave-v_zloave))^(1/3))",
+        "equal",
+    )
+    return bounds + (lcubic,)
+
+
+@functools.lru_cache(maxsize=1)
+def _default_variables_block() -> str:
+    """
+    Return the definitions of the default variables as one formatted block.
+
+    Returns:
+        str: One 'variable <name> equal <expression>' line per entry of
+            dict_of_variables, joined by newlines.
+    """
+    return "\n".join(
+        lf.format_line(f"variable {name} equal {expr}")
+        for name, expr in dict_of_variables.items()
+    )
+
+
+# LAMMPS keyword for a boolean flag, indexed by the flag itself.
+_YESNO = ("no", "yes")
+
+_VALID_UNIT_STYLES = frozenset(
+    {"lj", "real", "metal", "si", "cgs", "electron", "micro", "nano"}
+)
+
+
+def _format_float(value: float) -> str:
+    """
+    Format a number for the LAMMPS script without losing any of its digits.
+
+    Args:
+        value (float): The number to format.
+
+    Returns:
+        str: The shortest text that reads back as the same double (repr), with a
+            trailing '.0' dropped, e.g. '300' for 300.0 and '1234567.25' as is.
+    """
+    text = repr(float(value))
+    return text[:-2] if text.endswith(".0") else text
+
 
 class LammpsCommands:
-    def __init__(self):
-        self.script = []
-        self.dict_of_variables = dict_of_variables
-        self.list_thermo_style_mda = list_thermo_style_mda
-        self.std_list_dump_properties = std_list_dump_properties
-        self.std_list_avetime_properties_mda = std_list_avetime_properties_mda
+    # Shared, read-only defaults. add_variable() gives an instance its own copy
+    # of dict_of_variables the first time it defines a variable.
+    dict_of_variables = types.MappingProxyType(dict_of_variables)
+    list_thermo_style_mda = list_thermo_style_mda
+    std_list_dump_properties = std_list_dump_properties
+    std_list_avetime_properties_mda = std_list_avetime_properties_mda
+
+    def __init__(self, sink: Optional[TextIO] = None):
+        """
+        Initialize a LammpsCommands instance.
+
+        Args:
+            sink (TextIO, optional): An open text file to stream the script into. If given,
+                every add_* call writes straight to it and the script is never held in
+                memory. By default the script is accumulated in an in-memory buffer.
+        """
+        self._sink = sink
+        self.script = io.StringIO() if sink is None else sink
+        # Bound once: every add_* call ends up here, so skip the attribute lookups.
+        self._write = self.script.write
+
+    def _write_line(self, line: str) -> None:
+        """
+        Write a single line (or pre-formatted block) to the script buffer or sink.
+
+        Args:
+            line (str): The text to be written. A newline is appended after it.
+        """
+        self._write(line + "\n")
+
+    def get_script(self) -> str:
+        """
+        Return the LAMMPS script assembled so far.
+
+        Returns:
+            str: The full contents of the script buffer.
+
+        Raises:
+            RuntimeError: If the script is being streamed to a sink.
+        """
+        if self._sink is not None:
+            raise RuntimeError("The LAMMPS script was streamed to a sink and is not buffered.")
+        return self.script.getvalue()
+
+    def emit_to(self, file_like: TextIO) -> None:
+        """
+        Copy the buffered LAMMPS script into an open text file.
+
+        Args:
+            file_like (TextIO): The file to write the script into.
+
+        Raises:
+            RuntimeError: If the script is being streamed to a sink.
+
+        The buffer is copied in chunks, so no second full copy of the script is built.
+        """
+        if self._sink is not None:
+            raise RuntimeError("The LAMMPS script was streamed to a sink and is not buffered.")
+        self.script.seek(0)
+        shutil.copyfileobj(self.script, file_like)
 
     def add_simulation_title(self, number: int, title: str, description: str) -> None:
         """
@@ -119,23 +294,11 @@ class LammpsCommands:
             description (str): Description of the stage.
 
         This function constructs a comment block for a LAMMPS simulation stage and
-        appends it to the script.
+        writes it to the script.
         """
-        # Wrap the description to fit within 76 characters per line
-        wrapped_description = textwrap.wrap(description, width=76)
-
-        # Prefix each line with '# ' to create a comment block
-        wrapped_description = ["# " + line for line in wrapped_description]
-
-        # Construct the text to be added to the script
-        text_to_return = f"#-------------------------------------------------------------------------------\n"
-        text_to_return += f"# LAMMPS Stage {number}: {title}\n"
-        for line in wrapped_description:
-            text_to_return += line + "\n"
-        text_to_return += f"#-------------------------------------------------------------------------------"
-
-        # Append the constructed text to the script list
-        self.script.append(text_to_return)
+        self._write_line(
+            _render_title_block(f"LAMMPS Stage {number}: {title}", description)
+        )
 
     def add_substage_title(
         self, numbering: Tuple[int, int], title: str, description: str
@@ -149,23 +312,37 @@ class LammpsCommands:
             description (str): Description of the substage.
 
         This function constructs a comment block for a substage in a LAMMPS simulation
-        and appends it to the script.
+        and writes it to the script.
         """
-        # Wrap the description to fit within 76 characters per line
-        wrapped_description = textwrap.wrap(description, width=76)
+        self._write_line(
+            _render_title_block(
+                f"Substage {numbering[0]}.{numbering[1]}: {title}", description
+            )
+        )
 
-        # Prefix each line with '# ' to create a comment block
-        wrapped_description = ["# " + line for line in wrapped_description]
+    @staticmethod
+    def _format_comment(
+        comment: str,
+        prepend_new_line: bool = False,
+        append_new_line: bool = False,
+    ) -> str:
+        """
+        Build a comment block for the LAMMPS script.
 
-        # Construct the text to be added to the script
-        text_to_return = f"#-------------------------------------------------------------------------------\n"
-        text_to_return += f"# Substage {numbering[0]}.{numbering[1]}: {title}\n"
-        for line in wrapped_description:
-            text_to_return += line + "\n"
-        text_to_return += f"#-------------------------------------------------------------------------------"
+        Args:
+            comment (str): The comment text.
+            prepend_new_line (bool, optional): Whether to prepend a newline before the comment.
+                Default is False.
+            append_new_line (bool, optional): Whether to append a newline after the comment.
+                Default is False.
 
-        # Append the constructed text to the script list
-        self.script.append(text_to_return)
+        Returns:
+            str: The comment block, without a trailing newline.
+        """
+        prepend_nl = "\n" if prepend_new_line else ""
+        append_nl = "\n" if append_new_line else ""
+        block = _TITLE_BLOCK_TEMPLATE.format(heading=comment, body="")
+        return f"{prepend_nl}{block}{append_nl}"
 
     def add_comment(
         self,
@@ -183,14 +360,15 @@ class LammpsCommands:
             append_new_line (bool, optional): Whether to append a newline after the comment.
                 Default is False.
 
-        This function constructs a comment block and appends it to the script.
+        This function constructs a comment block and writes it to the script.
         """
-        prepend_nl = "\n" if prepend_new_line else ""
-        append_nl = "\n" if append_new_line else ""
-        text_to_return = f"{prepend_nl}#-------------------------------------------------------------------------------\n"
-        text_to_return += f"# {comment}\n"
-        text_to_return += f"#-------------------------------------------------------------------------------{append_nl}"
-        self.script.append(text_to_return)
+        self._write_line(
+            self._format_comment(
+                comment=comment,
+                prepend_new_line=prepend_new_line,
+                append_new_line=append_new_line,
+            )
+        )
 
     def add_logfile(self, numbering: Tuple[int, int], substage_type: str) -> None:
         """
@@ -203,7 +381,7 @@ class LammpsCommands:
         This function appends a logfile line to the LAMMPS script using the provided
         substage numbering and type.
         """
-        self.script.append(
+        self._write_line(
             lf.format_line(f"log  {numbering[0]}.{numbering[1]}-{substage_type}.out\n")
         )
 
@@ -216,36 +394,51 @@ class LammpsCommands:
 
         This function appends custom code lines to the LAMMPS script.
         """
-        for custom_line in lst_custom_code_lines:
-            self.script.append(lf.format_line(custom_line))
+        self.add_many_custom_code(lst_custom_code_lines)
+
+    def add_many_custom_code(self, lines: Iterable[str]) -> None:
+        """
+        Add many custom code lines to the LAMMPS script in a single write.
+
+        Args:
+            lines (Iterable[str]): Custom code lines to be added. Each line is formatted
+                with format_line before being written.
+        """
+        fmt = lf.format_line
+        self.script.writelines(f"{fmt(line)}\n" for line in lines)
 
     # def add_read_previous_dump_file(self, absolute_path_with_file: str):
-    #     self.script.append(lf.format_line(f"read_dump  {absolute_path_with_file} x y z box yes\n"))
+    #     self._write_line(lf.format_line(f"read_dump  {absolute_path_with_file} x y z box yes\n"))
 
     def add_set_timestep(self, set_timestep_to: float) -> None:
         """
         Set the timestep in the LAMMPS script.
 
         Args:
-            set_timestep_to (float): The timestep value to set.
+            set_timestep_to (float): The timestep value to set. LAMMPS expects an integer
+                step, so the value is truncated with int().
 
         This function appends a line to set the timestep in the LAMMPS script.
         """
-        self.script.append(lf.format_line(f"reset_timestep  {set_timestep_to}"))
+        self._write_line(lf.format_line(f"reset_timestep  {int(set_timestep_to)}"))
 
-    def add_thermo_style(self, style_option: str, lst_properties: List[str]) -> None:
+    def add_thermo_style(
+        self, style_option: str, lst_properties: Sequence[str]
+    ) -> None:
         """
         Set the thermo style in the LAMMPS script.
 
         Args:
             style_option (str): The style option for thermo_style.
-            lst_properties (List[str]): List of properties to include in thermo_style.
+            lst_properties (Sequence[str]): Properties (list or tuple) to include in thermo_style.
 
         This function appends a line to set the thermo_style in the LAMMPS script.
         """
-        self.script.append(
-            lf.format_line(f"thermo_style {style_option} {' '.join(lst_properties)}")
-        )
+        if lst_properties is self.list_thermo_style_mda:
+            properties = _THERMO_STYLE_MDA_JOINED
+        else:
+            properties = " ".join(lst_properties)
+        self._write_line(lf.format_line(f"thermo_style {style_option} {properties}"))
 
     def add_set_nthermo(self, nthermo: int) -> None:
         """
@@ -256,7 +449,7 @@ class LammpsCommands:
 
         This function appends a line to set the 'nthermo' value in the LAMMPS script.
         """
-        self.script.append(lf.format_line(f"nthermo  {nthermo}"))
+        self._write_line(lf.format_line(f"nthermo  {nthermo}"))
 
     def add_fix_npt(
         self,
@@ -286,15 +479,17 @@ class LammpsCommands:
             pres_ncontrol (int): Number of control steps for pressure.
             drag (float): Drag coefficient for temperature control.
             nreset (int): Frequency at which velocities are reset.
-            lst_of_additional_commands (List[str]): List of additional commands to include.
+            lst_of_additional_commands (List[str]): List of additional commands to include (space-separated).
 
         This function appends a fix npt command to the LAMMPS script for temperature and pressure control.
         """
-        self.script.append(
+        extra = " ".join(lst_of_additional_commands)
+        self._write_line(
             lf.format_line(
-                f"fix  {fix_id} {fix_subset} npt temp {temp_initial} {temp_final} {temp_ncontrol} "
-                f"iso {pres_initial} {pres_final} {pres_ncontrol} drag {drag} nreset {nreset} "
-                f"{''.join(lst_of_additional_commands)}"
+                f"fix  {fix_id} {fix_subset} npt "
+                f"temp {_format_float(temp_initial)} {_format_float(temp_final)} {temp_ncontrol} "
+                f"iso {_format_float(pres_initial)} {_format_float(pres_final)} {pres_ncontrol} "
+                f"drag {_format_float(drag)} nreset {nreset} {extra}"
             )
         )
 
@@ -320,14 +515,16 @@ class LammpsCommands:
             temp_ncontrol (int): Number of control steps for temperature.
             drag (float): Drag coefficient for temperature control.
             nreset (int): Frequency at which velocities are reset.
-            lst_of_additional_commands (List[str]): List of additional commands to include.
+            lst_of_additional_commands (List[str]): List of additional commands to include (space-separated).
 
         This function appends a fix nvt command to the LAMMPS script for temperature control.
         """
-        self.script.append(
+        extra = " ".join(lst_of_additional_commands)
+        self._write_line(
             lf.format_line(
-                f"fix  {fix_id} {fix_subset} nvt temp {temp_initial} {temp_final} {temp_ncontrol} "
-                f"drag {drag} nreset {nreset} {''.join(lst_of_additional_commands)}"
+                f"fix  {fix_id} {fix_subset} nvt "
+                f"temp {_format_float(temp_initial)} {_format_float(temp_final)} {temp_ncontrol} "
+                f"drag {_format_float(drag)} nreset {nreset} {extra}"
             )
         )
 
@@ -345,14 +542,13 @@ class LammpsCommands:
             fix_id (str): Unique identifier for the fix command.
             fix_subset (str): Subset of atoms or groups to apply the fix to.
             nreset (int): Frequency at which velocities are reset.
-            lst_of_additional_commands (List[str]): List of additional commands to include.
+            lst_of_additional_commands (List[str]): List of additional commands to include (space-separated).
 
         This function appends a fix nve command to the LAMMPS script for constant energy (NVE) simulation.
         """
-        self.script.append(
-            lf.format_line(
-                f"fix  {fix_id} {fix_subset} nve nreset {nreset} {''.join(lst_of_additional_commands)}"
-            )
+        extra = " ".join(lst_of_additional_commands)
+        self._write_line(
+            lf.format_line(f"fix  {fix_id} {fix_subset} nve nreset {nreset} {extra}")
         )
 
     def add_fix_minimize(
@@ -373,9 +569,10 @@ class LammpsCommands:
 
         This function appends a minimize command to the LAMMPS script for energy and force minimization.
         """
-        self.script.append(
+        self._write_line(
             lf.format_line(
-                f"minimize  {tol_energy} {tol_force} {max_iterations} {max_evaluations}"
+                f"minimize  {_format_float(tol_energy)} {_format_float(tol_force)} "
+                f"{max_iterations} {max_evaluations}"
             )
         )
 
@@ -389,7 +586,7 @@ class LammpsCommands:
 
         This function appends a restart command to the LAMMPS script to read a restart file.
         """
-        self.script.append(
+        self._write_line(
             lf.format_line(f"restart  {nsteps} {absolute_path_with_file}")
         )
 
@@ -400,7 +597,7 @@ class LammpsCommands:
         style_option: str,
         ndump: int,
         absolute_path_with_file: str,
-        properties: List[str],
+        properties: Union[List[str], str],
     ) -> None:
         """
         Add a dump command to the LAMMPS script for outputting simulation data.
@@ -411,14 +608,16 @@ class LammpsCommands:
             style_option (str): Style option for the dump command.
             ndump (int): Frequency at which data is dumped.
             absolute_path_with_file (str): Absolute path and filename for the dump file.
-            properties (List[str]): List of properties to include in the dump.
+            properties (Union[List[str], str]): List of properties to include in the dump, or
+                the same properties already joined into a space-separated string.
 
         This function appends a dump command to the LAMMPS script for outputting simulation data.
         """
-        self.script.append(
+        props = properties if isinstance(properties, str) else " ".join(properties)
+        self._write_line(
             lf.format_line(
                 f"dump  {dump_id} {dump_subset} {style_option} {ndump} {absolute_path_with_file} "
-                f"{' '.join(properties)}"
+                f"{props}"
             )
         )
 
@@ -431,7 +630,7 @@ class LammpsCommands:
 
         This function appends a line to set the timestep in the LAMMPS script.
         """
-        self.script.append(lf.format_line(f"timestep  {timestep}"))
+        self._write_line(lf.format_line(f"timestep  {_format_float(timestep)}"))
 
     def add_run_command(self, nsteps: int) -> None:
         """
@@ -442,7 +641,7 @@ class LammpsCommands:
 
         This function appends a run command to the LAMMPS script to perform simulation steps.
         """
-        self.script.append(lf.format_line(f"run  {nsteps}"))
+        self._write_line(lf.format_line(f"run  {nsteps}"))
 
     def add_undump(self, dump_id: str) -> None:
         """
@@ -453,7 +652,7 @@ class LammpsCommands:
 
         This function appends an undump command to the LAMMPS script to remove a previously defined dump.
         """
-        self.script.append(lf.format_line(f"undump  {dump_id}"))
+        self._write_line(lf.format_line(f"undump  {dump_id}"))
 
     def add_unfix(self, fix_id: str) -> None:
         """
@@ -464,7 +663,7 @@ class LammpsCommands:
 
         This function appends an unfix command to the LAMMPS script to remove a previously defined fix.
         """
-        self.script.append(lf.format_line(f"unfix  {fix_id}"))
+        self._write_line(lf.format_line(f"unfix  {fix_id}"))
 
     def add_velocities(
         self,
@@ -488,9 +687,9 @@ class LammpsCommands:
 
         This function appends a velocity command to the LAMMPS script to set atom velocities.
         """
-        self.script.append(
+        self._write_line(
             lf.format_line(
-                f"velocity  {velocities_subset} create {temp} {random_seed} dist {dist_type} "
+                f"velocity  {velocities_subset} create {_format_float(temp)} {random_seed} dist {dist_type} "
                 f"mom {momentum} rot {rotation}"
             )
         )
@@ -504,7 +703,7 @@ class LammpsCommands:
 
         This function appends a line to set the minimization style in the LAMMPS script.
         """
-        self.script.append(lf.format_line(f"min_style  {style}"))
+        self._write_line(lf.format_line(f"min_style  {style}"))
 
     def add_min_modify(self, dmax: float) -> None:
         """
@@ -515,7 +714,7 @@ class LammpsCommands:
 
         This function appends a line to modify minimization settings in the LAMMPS script.
         """
-        self.script.append(lf.format_line(f"min_modify  dmax {dmax}"))
+        self._write_line(lf.format_line(f"min_modify  dmax {dmax:.6g}"))
 
     def add_variable(
         self, var_name: str, var_expression, var_style: str = "equal"
@@ -530,11 +729,53 @@ class LammpsCommands:
 
         This function appends a variable definition to the LAMMPS script and stores it in a dictionary.
         """
-        self.script.append(
+        self._write_line(
             lf.format_line(f"variable {var_name} {var_style} {var_expression}")
         )
+        if not isinstance(self.dict_of_variables, dict):
+            self.dict_of_variables = dict(self.dict_of_variables)
         self.dict_of_variables[var_name] = var_expression
 
+    def add_variables(self, triples: Iterable[Tuple[str, Any, str]]) -> None:
+        """
+        Add several variable definitions to the LAMMPS script.
+
+        Args:
+            triples (Iterable[Tuple[str, Any, str]]): (var_name, var_expression, var_style)
+                for each variable, in the order they should be written.
+
+        Equivalent to calling add_variable for every triple, but the definitions are
+        written to the script as a single block.
+        """
+        if not isinstance(self.dict_of_variables, dict):
+            self.dict_of_variables = dict(self.dict_of_variables)
+        fmt = lf.format_line
+        setv = self.dict_of_variables.__setitem__
+        lines = []
+        for name, expr, style in triples:
+            lines.append(fmt(f"variable {name} {style} {expr}"))
+            setv(name, expr)
+        if lines:
+            self._write_line("\n".join(lines))
+
+    def add_declared_variables(self) -> None:
+        """
+        Write an 'equal'-style definition for every variable in dict_of_variables.
+
+        The whole block is written at once. While the instance still uses the shared
+        default variables, the block is rendered only once per process.
+        """
+        if self.dict_of_variables is LammpsCommands.dict_of_variables:
+            block = _default_variables_block()
+        else:
+            fmt = lf.format_line
+            block = "\n".join(
+                fmt(f"variable {name} equal {expr}")
+                for name, expr in self.dict_of_variables.items()
+            )
+        if block:
+            self._write_line(block)
+
     def add_echo(self, echo_style: str) -> None:
         """
         Set the echo style in the LAMMPS script.
@@ -544,7 +785,7 @@ class LammpsCommands:
 
         This function appends a line to set the echo style in the LAMMPS script.
         """
-        self.script.append(lf.format_line(f"echo  {echo_style}"))
+        self._write_line(lf.format_line(f"echo  {echo_style}"))
 
     def add_units(self, units_style: str) -> None:
         """
@@ -554,27 +795,14 @@ class LammpsCommands:
             units_style (str): The style of units to be used.
 
         Raises:
-            Exception: If the provided units_style is not a valid LAMMPS unit style.
+            ValueError: If the provided units_style is not a valid LAMMPS unit style.
 
         This function appends a line to set the units style in the LAMMPS script.
         """
-        valid_unit_styles = [
-            "lj",
-            "real",
-            "metal",
-            "si",
-            "cgs",
-            "electron",
-            "micro",
-            "nano",
-        ]
-
-        if units_style not in valid_unit_styles:
-            raise Exception(f"'{units_style}' is not a valid LAMMPS unit style.")
+        if units_style not in _VALID_UNIT_STYLES:
+            raise ValueError(f"'{units_style}' is not a valid LAMMPS unit style.")
 
-        self.script.append(lf.format_line(f"units  {units_style}"))
-
-    from typing import Tuple
+        self._write_line(lf.format_line(f"units  {units_style}"))
 
     def add_boundary(self, boundary_style: Tuple[str, str, str]) -> None:
         """
@@ -585,7 +813,7 @@ class LammpsCommands:
 
         This function appends a line to set the boundary conditions in the LAMMPS script.
         """
-        self.script.append(lf.format_line(f"boundary  {' '.join(boundary_style)}"))
+        self._write_line(lf.format_line(f"boundary  {' '.join(boundary_style)}"))
 
     def add_pair_style(self, pair_style: str) -> None:
         """
@@ -596,7 +824,7 @@ class LammpsCommands:
 
         This function appends a line to set the pair style in the LAMMPS script.
         """
-        self.script.append(lf.format_line(f"pair_style  {pair_style}"))
+        self._write_line(lf.format_line(f"pair_style  {pair_style}"))
 
     def add_kspace_style(self, kspace_style: str) -> None:
         """
@@ -607,7 +835,7 @@ class LammpsCommands:
 
         This function appends a line to set the kspace style in the LAMMPS script.
         """
-        self.script.append(lf.format_line(f"kspace_style  {kspace_style}"))
+        self._write_line(lf.format_line(f"kspace_style  {kspace_style}"))
 
     def add_pair_modify(self, pair_modify: str) -> None:
         """
@@ -618,7 +846,7 @@ class LammpsCommands:
 
         This function appends a line to modify the pair interaction settings in the LAMMPS script.
         """
-        self.script.append(lf.format_line(f"pair_modify  {pair_modify}"))
+        self._write_line(lf.format_line(f"pair_modify  {pair_modify}"))
 
     def add_bond_style(self, bond_style: str) -> None:
         """
@@ -629,7 +857,7 @@ class LammpsCommands:
 
         This function appends a line to set the bond style in the LAMMPS script.
         """
-        self.script.append(lf.format_line(f"bond_style  {bond_style}"))
+        self._write_line(lf.format_line(f"bond_style  {bond_style}"))
 
     def add_angle_style(self, angle_style: str) -> None:
         """
@@ -640,7 +868,7 @@ class LammpsCommands:
 
         This function appends a line to set the angle style in the LAMMPS script.
         """
-        self.script.append(lf.format_line(f"angle_style  {angle_style}"))
+        self._write_line(lf.format_line(f"angle_style  {angle_style}"))
 
     def add_dihedral_style(self, dihedral_style: str) -> None:
         """
@@ -651,7 +879,7 @@ class LammpsCommands:
 
         This function appends a line to set the dihedral style in the LAMMPS script.
         """
-        self.script.append(lf.format_line(f"dihedral_style  {dihedral_style}"))
+        self._write_line(lf.format_line(f"dihedral_style  {dihedral_style}"))
 
     def add_improper_style(self, improper_style: str) -> None:
         """
@@ -662,7 +890,7 @@ class LammpsCommands:
 
         This function appends a line to set the improper style in the LAMMPS script.
         """
-        self.script.append(lf.format_line(f"improper_style  {improper_style}"))
+        self._write_line(lf.format_line(f"improper_style  {improper_style}"))
 
     def add_special_bonds(self, special_bonds: str) -> None:
         """
@@ -673,7 +901,7 @@ class LammpsCommands:
 
         This function appends a line to set the special bonds in the LAMMPS script.
         """
-        self.script.append(lf.format_line(f"special_bonds  {special_bonds}"))
+        self._write_line(lf.format_line(f"special_bonds  {special_bonds}"))
 
     def add_box(self, box: str) -> None:
         """
@@ -684,7 +912,7 @@ class LammpsCommands:
 
         This function appends a box definition to the LAMMPS script.
         """
-        self.script.append(lf.format_line(f"add_box  {box}"))
+        self._write_line(lf.format_line(f"add_box  {box}"))
 
     def add_read_data(self, absolute_path_with_file: str) -> None:
         """
@@ -695,7 +923,7 @@ class LammpsCommands:
 
         This function appends a read_data command to the LAMMPS script to read data from a file.
         """
-        self.script.append(lf.format_line(f"read_data  {absolute_path_with_file}"))
+        self._write_line(lf.format_line(f"read_data  {absolute_path_with_file}"))
 
     def add_include(self, absolute_path_with_file: str) -> None:
         """
@@ -706,7 +934,7 @@ class LammpsCommands:
 
         This function appends an include command to the LAMMPS script to include a file.
         """
-        self.script.append(lf.format_line(f"include  {absolute_path_with_file}"))
+        self._write_line(lf.format_line(f"include  {absolute_path_with_file}"))
 
     def add_neighbor(self, neighbor_style: str) -> None:
         """
@@ -717,7 +945,7 @@ class LammpsCommands:
 
         This function appends a line to set the neighbor settings in the LAMMPS script.
         """
-        self.script.append(lf.format_line(f"neighbor  {neighbor_style}"))
+        self._write_line(lf.format_line(f"neighbor  {neighbor_style}"))
 
     def add_neigh_modify(self, delay: int, nevery: int, check: bool) -> None:
         """
@@ -730,10 +958,9 @@ class LammpsCommands:
 
         This function appends a line to modify the neighbor settings in the LAMMPS script.
         """
-        check_value = "yes" if check else "no"
-        self.script.append(
+        self._write_line(
             lf.format_line(
-                f"neighbor  delay {delay} every {nevery} check {check_value}"
+                f"neighbor  delay {delay} every {nevery} check {_YESNO[bool(check)]}"
             )
         )
 
@@ -746,8 +973,7 @@ class LammpsCommands:
 
         This function appends a line to modify the thermo settings in the LAMMPS script.
         """
-        flush_value = "yes" if flush else "no"
-        self.script.append(lf.format_line(f"thermo_modify  flush {flush_value}"))
+        self._write_line(lf.format_line(f"thermo_modify  flush {_YESNO[bool(flush)]}"))
 
     def add_thermo(self, nthermo: int) -> None:
         """
@@ -758,7 +984,7 @@ class LammpsCommands:
 
         This function appends a line to set the thermo output frequency in the LAMMPS script.
         """
-        self.script.append(lf.format_line(f"thermo  {nthermo}"))
+        self._write_line(lf.format_line(f"thermo  {nthermo}"))
 
     def add_fix_ave_time(
         self,
@@ -767,7 +993,7 @@ class LammpsCommands:
         nevery: int,
         nrepeat: int,
         nfreq: int,
-        list_of_properties: list,
+        list_of_properties: Union[list, str],
         absolute_path_with_file: str,
     ) -> None:
         """
@@ -779,23 +1005,31 @@ class LammpsCommands:
             nevery (int): The frequency of the fix.
             nrepeat (int): Number of times the fix is applied.
             nfreq (int): Number of times to accumulate data.
-            list_of_properties (list): List of properties to be calculated and output.
+            list_of_properties (Union[list, str]): List of properties to be calculated and
+                output, or the same properties already joined into a space-separated string.
             absolute_path_with_file (str): Absolute path to the output file (can be empty).
 
         This function appends an ave/time fix command to the LAMMPS script.
         """
+        if list_of_properties is self.std_list_avetime_properties_mda:
+            properties = _AVETIME_PROPS_MDA_JOINED
+        elif isinstance(list_of_properties, str):
+            properties = list_of_properties
+        else:
+            properties = " ".join(list_of_properties)
+
         if absolute_path_with_file == "":
-            self.script.append(
+            self._write_line(
                 lf.format_line(
                     f"fix {fix_id} {fix_subset} ave/time {nevery} {nrepeat} {nfreq} "
-                    f"{' '.join(list_of_properties)}"
+                    f"{properties}"
                 )
             )
         else:
-            self.script.append(
+            self._write_line(
                 lf.format_line(
                     f"fix {fix_id} {fix_subset} ave/time {nevery} {nrepeat} {nfreq} "
-                    f"{' '.join(list_of_properties)} file {absolute_path_with_file}"
+                    f"{properties} file {absolute_path_with_file}"
                 )
             )
 
@@ -808,9 +1042,7 @@ class LammpsCommands:
 
         This function appends a line to set the atom style in the LAMMPS script.
         """
-        self.script.append(lf.format_line(f"atom_style  {atom_style}"))
-
-    from typing import List
+        self._write_line(lf.format_line(f"atom_style  {atom_style}"))
 
     def add_change_box(self, lst_of_new_box_dims: List[str]) -> None:
         """
@@ -821,20 +1053,17 @@ class LammpsCommands:
 
         This function appends commands to change the box dimensions in the LAMMPS script.
         """
-        lst_of_new_box_dims = [str(i) for i in lst_of_new_box_dims]
-        self.add_comment(
-            comment=f'Set dimensions of the box to {" ".join(lst_of_new_box_dims)}.',
+        dims = [str(i) for i in lst_of_new_box_dims]
+        header = self._format_comment(
+            comment=f'Set dimensions of the box to {" ".join(dims)}.',
             prepend_new_line=True,
         )
-        self.script.append(
-            lf.format_line(
-                f"change_box all x final {lst_of_new_box_dims[0]} {lst_of_new_box_dims[1]} "
-                f"y final {lst_of_new_box_dims[2]} {lst_of_new_box_dims[3]} "
-                f"z final {lst_of_new_box_dims[4]} {lst_of_new_box_dims[5]} "
-                f" remap units box"
-            )
+        body = lf.format_line(
+            f"change_box all x final {dims[0]} {dims[1]} "
+            f"y final {dims[2]} {dims[3]} "
+            f"z final {dims[4]} {dims[5]} remap units box"
         )
-        self.script.append("\n")
+        self._write_line(f"{header}\n{body}\n")
 
     def add_read_dump(
         self,
@@ -852,17 +1081,15 @@ class LammpsCommands:
 
         This function appends commands to read a dump file and update particle positions in the LAMMPS script.
         """
-        self.add_comment(
+        header = self._format_comment(
             comment=f"Read previous dump file {absolute_path_with_file} and update particle positions.",
             prepend_new_line=True,
         )
-        self.script.append(
-            lf.format_line(
-                f"read_dump {absolute_path_with_file} {which_trajectory} "
-                f"x y z box {box_option}"
-            )
+        body = lf.format_line(
+            f"read_dump {absolute_path_with_file} {which_trajectory} "
+            f"x y z box {box_option}"
         )
-        self.script.append("\n")
+        self._write_line(f"{header}\n{body}\n")
 
     def add_custom_change_box(
         self, fix_id, boxdims_changeto_style="Last trajectory", setcubic=False
@@ -877,75 +1104,54 @@ class LammpsCommands:
 
         This function appends commands to customize the change of simulation box dimensions in the LAMMPS script.
         """
-        if boxdims_changeto_style == "Last trajectory" and not setcubic:
-            return
-        elif boxdims_changeto_style == "Last trajectory" and setcubic:
-            self.add_variable(
-                var_name="lcubic",
-                var_expression="abs(((xhi-xlo)*(yhi-ylo)*(zhi-zlo))^(1/3))",
-            )
-            self.add_change_box(
-                lst_of_new_box_dims=[
-                    "0",
-                    "${lcubic}",
-                    "0",
-                    "${lcubic}",
-                    "0",
-                    "${lcubic}",
-                ]
-            )
-        elif boxdims_changeto_style == "Computed ρ(average)" and setcubic:
-            self.add_variable(var_name="xloave", var_expression=f"f_{fix_id}[1]")
-            self.add_variable(var_name="xhiave", var_expression=f"f_{fix_id}[2]")
-            self.add_variable(var_name="yloave", var_expression=f"f_{fix_id}[3]")
-            self.add_variable(var_name="yhiave", var_expression=f"f_{fix_id}[4]")
-            self.add_variable(var_name="zloave", var_expression=f"f_{fix_id}[5]")
-            self.add_variable(var_name="zhiave", var_expression=f"f_{fix_id}[6]")
-            self.add_variable(
-                var_name="lcubic",
-                var_expression="abs(((v_xhiave-v_xloave)*(v_yhiave-v_yloave)*(v_zhiave-v_zloave))^(1/3))",
-            )
-
-            self.add_change_box(
-                lst_of_new_box_dims=[
-                    "${xloave}",
-                    "${xhiave}",
-                    "${yloave}",
-                    "${yhiave}",
-                    "${zloave}",
-                    "${zhiave}",
-                ]
-            )
-            self.add_change_box(
-                lst_of_new_box_dims=[
-                    "0",
-                    "${lcubic}",
-                    "0",
-                    "${lcubic}",
-                    "0",
-                    "${lcubic}",
-                ]
-            )
-
-        elif boxdims_changeto_style == "Computed ρ(average)" and not setcubic:
-            self.add_variable(var_name="xloave", var_expression=f"f_{fix_id}[1]")
-            self.add_variable(var_name="xhiave", var_expression=f"f_{fix_id}[2]")
-            self.add_variable(var_name="yloave", var_expression=f"f_{fix_id}[3]")
-            self.add_variable(var_name="yhiave", var_expression=f"f_{fix_id}[4]")
-            self.add_variable(var_name="zloave", var_expression=f"f_{fix_id}[5]")
-            self.add_variable(var_name="zhiave", var_expression=f"f_{fix_id}[6]")
-            self.add_variable(
-                var_name="lcubic",
-                var_expression="abs(((v_xhiave-v_xloave)*(v_yhiave-v_yloave)*(v_zhiave-v_zloave))^(1/3))",
-            )
-
-            self.add_change_box(
-                lst_of_new_box_dims=[
-                    "${xloave}",
-                    "${xhiave}",
-                    "${yloave}",
-                    "${yhiave}",
-                    "${zloave}",
-                    "${zhiave}",
-                ]
-            )
+        action = _CHANGE_BOX_ACTIONS.get((boxdims_changeto_style, bool(setcubic)))
+        if action is not None:
+            action(self, fix_id)
+
+
+# New box bounds used by add_custom_change_box.
+_CUBIC_BOX_DIMS = ("0", "${lcubic}", "0", "${lcubic}", "0", "${lcubic}")
+_AVERAGE_BOX_DIMS = (
+    "${xloave}",
+    "${xhiave}",
+    "${yloave}",
+    "${yhiave}",
+    "${zloave}",
+    "${zhiave}",
+)
+
+
+def _change_box_last_cubic(commands: LammpsCommands, fix_id: str) -> None:
+    """
+    Make the box of the last trajectory cubic, keeping its volume.
+    """
+    commands.add_variable(
+        var_name="lcubic",
+        var_expression="abs(((xhi-xlo)*(yhi-ylo)*(zhi-zlo))^(1/3))",
+    )
+    commands.add_change_box(lst_of_new_box_dims=_CUBIC_BOX_DIMS)
+
+
+def _change_box_average(commands: LammpsCommands, fix_id: str) -> None:
+    """
+    Set the box to the bounds averaged by the fix 'fix_id'.
+    """
+    commands.add_variables(_rho_average_vars(fix_id))
+    commands.add_change_box(lst_of_new_box_dims=_AVERAGE_BOX_DIMS)
+
+
+def _change_box_average_cubic(commands: LammpsCommands, fix_id: str) -> None:
+    """
+    Set the box to the bounds averaged by the fix 'fix_id', then make it cubic.
+    """
+    _change_box_average(commands, fix_id)
+    commands.add_change_box(lst_of_new_box_dims=_CUBIC_BOX_DIMS)
+
+
+# add_custom_change_box actions, keyed by (boxdims_changeto_style, setcubic). Keeping
+# the last trajectory's box as it is needs no commands, so it has no entry.
+_CHANGE_BOX_ACTIONS = {
+    ("Last trajectory", True): _change_box_last_cubic,
+    ("Computed ρ(average)", False): _change_box_average,
+    ("Computed ρ(average)", True): _change_box_average_cubic,
+}
@@ -1,4 +1,6 @@
+import functools
 import math
+import numpy as np
 from file_read_backwards import FileReadBackwards
 
 
@@ -45,24 +47,30 @@ def parse_trajectory(header: list[str], data: list[str]) -> dict:
     # Extract attribute names from the last line of the header
     attributes = header[-1].split()[2:]  # Ignore 'ITEM:' and 'ATOMS'
 
-    # Initialize an empty list for each attribute
-    trajectory_data = {attr: [] for attr in attributes}
-
-    # Parse each line in the data block
-    for line in data:
-        values = line.split()
-        for attr, value in zip(attributes, values):
-            # Convert numerical values to the appropriate type
-            try:
-                num_value = float(value)
-                if num_value.is_integer():
-                    num_value = int(num_value)
-                value = num_value
-            except ValueError:
-                raise Exception(
-                    f"Value {value} from attribute {attr} could not be converted into a number."
-                )
-            trajectory_data[attr].append(value)
+    # Parse the whole data block at once into an (atoms, attributes) array
+    try:
+        values = (
+            np.loadtxt(data, dtype=np.float64, ndmin=2)
+            if data
+            else np.empty((0, len(attributes)))
+        )
+    except ValueError as e:
+        raise Exception(f"Trajectory data could not be converted into numbers: {e}")
+
+    trajectory_data = {}
+    for attr, column in zip(attributes, values.T):
+        # Convert numerical values to the appropriate type (whole columns of integral
+        # values, such as ids and types, become lists of int)
+        if np.all(np.isfinite(column)) and np.all(column == np.floor(column)):
+            trajectory_data[attr] = column.astype(np.int64).tolist()
+        else:
+            trajectory_data[attr] = [
+                int(value) if value.is_integer() else value for value in column.tolist()
+            ]
+
+    # Attributes without a column in the data block
+    for attr in attributes[len(trajectory_data) :]:
+        trajectory_data[attr] = []
 
     return {"header": parse_header(header=header), "data": trajectory_data}
 
@@ -145,10 +153,14 @@ def read_avetime_dump_file(file_name: str) -> dict:
     return data_dict
 
 
+@functools.lru_cache(maxsize=4096)
 def format_line(line: str, first_column_padding: int = 20) -> str:
     """
     Format a line of text with a specified padding for the first column.
 
+    The result is memoized, since most LAMMPS directives (units, styles, unfix,
+    undump, ...) are formatted with the same arguments over and over again.
+
     Args:
         line (str): The input line of text to be formatted.
         first_column_padding (int, optional): The number of spaces to pad the first column.
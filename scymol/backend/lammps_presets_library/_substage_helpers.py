@@ -0,0 +1,42 @@
+import functools
+from typing import Any, Callable
+
+
+def substage(title: str, describe: Callable[[Any], str]) -> Callable:
+    """
+    Decorate a preset's run() method so that it is emitted as a numbered substage.
+
+    Before the decorated method runs, the wrapper resets the timestep (if the preset
+    has a non-None 'set_timestep' attribute) and writes the substage title block. After
+    it returns, the substage counter of the stage is incremented.
+
+    Args:
+        title (str): The title of the substage.
+        describe (Callable[[Any], str]): Called with the preset instance to build the
+            description shown under the title.
+
+    Returns:
+        Callable: The decorator to apply to run().
+    """
+
+    def decorator(run: Callable[[Any], None]) -> Callable[[Any], None]:
+        @functools.wraps(run)
+        def wrapper(self) -> None:
+            stage_instance = self.stage_instance
+            lammps_commands_instance = self.lammps_commands_instance
+
+            set_timestep = getattr(self, "set_timestep", None)
+            if set_timestep is not None:
+                lammps_commands_instance.add_set_timestep(set_timestep_to=set_timestep)
+
+            lammps_commands_instance.add_substage_title(
+                title=title,
+                numbering=(stage_instance.stage_nbr, stage_instance.substage_nbr),
+                description=describe(self),
+            )
+            run(self)
+            stage_instance.substage_nbr += 1
+
+        return wrapper
+
+    return decorator
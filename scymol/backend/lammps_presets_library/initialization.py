@@ -1,5 +1,24 @@
+import string
 from typing import Optional, Tuple
 
+from scymol.backend.lammps_presets_library._substage_helpers import substage
+
+# Force-field and topology section of the initialization substage. Only the
+# boundary conditions vary between runs; every line is formatted by
+# add_many_custom_code.
+_INIT_TEMPLATE = string.Template(
+    "boundary $bx $by $bz\n"
+    "atom_style full\n"
+    "pair_style lj/cut 12.0\n"
+    "pair_modify mix arithmetic\n"
+    "bond_style harmonic\n"
+    "angle_style harmonic\n"
+    "dihedral_style fourier\n"
+    "improper_style cvff\n"
+    "special_bonds amber\n"
+    "read_data structure.data"
+)
+
 
 class StandardInitializationSubstage:
     def __init__(
@@ -23,41 +42,22 @@ class StandardInitializationSubstage:
         self.units_style = units_style
         self.boundary_style = boundary_style
 
+    @substage(title="Initialization", describe=lambda self: "Initialize LAMMPS run.")
     def run(self) -> None:
         """
         Run the standard initialization substage.
         """
-        title = "Initialization"
-        numbering = (self.stage_instance.stage_nbr, self.stage_instance.substage_nbr)
-        description = "Initialize LAMMPS run."
-
-        self.lammps_commands_instance.add_substage_title(
-            title=title, numbering=numbering, description=description
-        )
-
         self.lammps_commands_instance.add_units(units_style=self.units_style)
-        self.lammps_commands_instance.add_boundary(boundary_style=self.boundary_style)
-        self.lammps_commands_instance.add_atom_style(atom_style="full")
-        self.lammps_commands_instance.add_pair_style(pair_style="lj/cut 12.0")
-        self.lammps_commands_instance.add_pair_modify(pair_modify="mix arithmetic")
-        self.lammps_commands_instance.add_bond_style(bond_style="harmonic")
-        self.lammps_commands_instance.add_angle_style(angle_style="harmonic")
-        self.lammps_commands_instance.add_dihedral_style(dihedral_style="fourier")
-        self.lammps_commands_instance.add_improper_style(improper_style="cvff")
-        self.lammps_commands_instance.add_special_bonds(special_bonds="amber")
-        self.lammps_commands_instance.add_read_data(
-            absolute_path_with_file="structure.data"
+        bx, by, bz = self.boundary_style
+        self.lammps_commands_instance.add_many_custom_code(
+            _INIT_TEMPLATE.substitute(bx=bx, by=by, bz=bz).splitlines()
         )
         self.lammps_commands_instance.add_comment(
             comment="Declaring variables:", prepend_new_line=True
         )
-        for key, value in self.lammps_commands_instance.dict_of_variables.items():
-            self.lammps_commands_instance.add_variable(
-                var_name=key, var_expression=value
-            )
+        self.lammps_commands_instance.add_declared_variables()
         self.lammps_commands_instance.add_thermo_style(
             style_option="custom",
             lst_properties=self.lammps_commands_instance.list_thermo_style_mda,
         )
         self.lammps_commands_instance.add_thermo_modify(flush=True)
-        self.stage_instance.substage_nbr += 1
@@ -1,9 +1,34 @@
 from typing import Optional
 
+from scymol.backend.lammps_presets_library._substage_helpers import substage
+
 
 class StandardMinimizationSubstage:
+    # Thermo output used while minimizing (force norms instead of temperatures).
+    _MIN_THERMO_PROPS = (
+        "step",
+        "fmax",
+        "fnorm",
+        "press",
+        "vol",
+        "v_sysdensity",
+        "v_sxx",
+        "v_syy",
+        "v_szz",
+        "v_syz",
+        "v_sxz",
+        "v_sxy",
+        "pe",
+        "v_cella",
+        "v_cellb",
+        "v_cellc",
+        "v_cellalpha",
+        "v_cellbeta",
+        "v_cellgamma",
+    )
+
     def __init__(
-        self, stage_instance, lammps_commands_instance, set_timestep: int = 0
+        self, stage_instance, lammps_commands_instance, set_timestep: Optional[int] = 0
     ) -> None:
         """
         Initialize the StandardMinimizationSubstage.
@@ -11,54 +36,25 @@ class StandardMinimizationSubstage:
         Args:
             stage_instance: The instance of the stage.
             lammps_commands_instance: The instance of lammps_commands.
-            set_timestep (int, optional): Timestep value. Default is 0.
+            set_timestep (Optional[int], optional): Value to reset the timestep counter to before
+                the substage, or None to leave it unchanged. Default is 0, since the
+                frontend does not forward a reset value for minimizations.
         """
         self.stage_instance = stage_instance
         self.set_timestep = set_timestep
         self.last_lammpstrj_file = f"{self.stage_instance.stage_nbr}.{self.stage_instance.substage_nbr}_minimization.lammpstrj"
         self.lammps_commands_instance = lammps_commands_instance
 
+    @substage(title="Minimization", describe=lambda self: "Initialize LAMMPS run.")
     def run(self) -> None:
         """
         Run the standard minimization substage.
         """
-        if self.set_timestep is not None:
-            self.lammps_commands_instance.add_set_timestep(
-                set_timestep_to=self.set_timestep
-            )
-
-        title = "Minimization"
-        numbering = (self.stage_instance.stage_nbr, self.stage_instance.substage_nbr)
-        description = "Initialize LAMMPS run."
-        self.lammps_commands_instance.add_substage_title(
-            title=title, numbering=numbering, description=description
-        )
-
         self.lammps_commands_instance.add_min_style(style="cg")
         self.lammps_commands_instance.add_min_modify(dmax=0.05)
         self.lammps_commands_instance.add_thermo_style(
             style_option="custom",
-            lst_properties=[
-                "step",
-                "fmax",
-                "fnorm",
-                "press",
-                "vol",
-                "v_sysdensity",
-                "v_sxx",
-                "v_syy",
-                "v_szz",
-                "v_syz",
-                "v_sxz",
-                "v_sxy",
-                "pe",
-                "v_cella",
-                "v_cellb",
-                "v_cellc",
-                "v_cellalpha",
-                "v_cellbeta",
-                "v_cellgamma",
-            ],
+            lst_properties=self._MIN_THERMO_PROPS,
         )
 
         properties = self.lammps_commands_instance.std_list_dump_properties
@@ -77,4 +73,3 @@ class StandardMinimizationSubstage:
         )
 
         self.lammps_commands_instance.add_undump(dump_id="minrun")
-        self.stage_instance.substage_nbr += 1
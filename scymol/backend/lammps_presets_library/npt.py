@@ -1,5 +1,7 @@
 from typing import Optional
 
+from scymol.backend.lammps_presets_library._substage_helpers import substage
+
 
 class StandardNptStage:
     def __init__(
@@ -20,7 +22,7 @@ class StandardNptStage:
         ndump: int = 1000,
         timestep: float = 1,
         nrun: int = 100_000,
-        set_timestep: int = 0,
+        set_timestep: Optional[int] = None,
         boxdims_changeto: str = "Last trajectory",
         set_cubic: bool = False,
     ) -> None:
@@ -44,7 +46,8 @@ class StandardNptStage:
             ndump (int, optional): Dump frequency. Default is 1000.
             timestep (float, optional): Timestep value. Default is 1.
             nrun (int, optional): Number of simulation steps. Default is 100000.
-            set_timestep (int, optional): Set timestep. Default is 0.
+            set_timestep (Optional[int], optional): Value to reset the timestep counter to before
+                the substage, or None to leave it unchanged. Default is None.
             boxdims_changeto (str, optional): Box dimension change method. Default is 'Last trajectory'.
             set_cubic (bool, optional): Set cubic. Default is False.
         """
@@ -67,7 +70,13 @@ class StandardNptStage:
         self.set_timestep = set_timestep
         self.boxdims_changeto = boxdims_changeto
         self.set_cubic = set_cubic
+        self._description = (
+            f"Run {self.nrun} steps with a timestep of {self.timestep}. "
+            f"T from {self.temp_initial} to {self.temp_final}. "
+            f"Pressure from {self.pres_initial} to {self.pres_final}."
+        )
 
+    @substage(title="NPT-dynamics", describe=lambda self: self._description)
     def run(self) -> None:
         """
         Run the standard NPT stage.
@@ -78,22 +87,6 @@ class StandardNptStage:
         self.stage_instance.last_lammpstrj_file = f"{file_npt}.lammpstrj"
         self.stage_instance.last_instantaneous_file = f"{file_npt}_instantaneous.out"
 
-        if self.set_timestep is not None:
-            self.lammps_commands_instance.add_set_timestep(
-                set_timestep_to=self.set_timestep
-            )
-
-        title = "NPT-dynamics"
-        numbering = (self.stage_instance.stage_nbr, self.stage_instance.substage_nbr)
-        description = (
-            f"Run {self.nrun} steps with a timestep of {self.timestep}. "
-            f"T from {self.temp_initial} to {self.temp_final}. "
-            f"Pressure from {self.pres_initial} to {self.pres_final}."
-        )
-        self.lammps_commands_instance.add_substage_title(
-            title=title, numbering=numbering, description=description
-        )
-
         self.lammps_commands_instance.add_thermo_style(
             style_option="custom",
             lst_properties=self.lammps_commands_instance.list_thermo_style_mda,
@@ -155,5 +148,3 @@ class StandardNptStage:
         self.lammps_commands_instance.add_unfix(fix_id="2")
         self.lammps_commands_instance.add_unfix(fix_id="3")
         self.lammps_commands_instance.add_undump(dump_id="1")
-
-        self.stage_instance.substage_nbr += 1
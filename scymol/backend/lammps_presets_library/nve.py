@@ -1,3 +1,8 @@
+from typing import Optional
+
+from scymol.backend.lammps_presets_library._substage_helpers import substage
+
+
 class StandardNveStage:
     def __init__(
         self,
@@ -10,7 +15,7 @@ class StandardNveStage:
         ndump: int = 1000,
         timestep: float = 1,
         nrun: int = 100_000,
-        set_timestep: int = 0,
+        set_timestep: Optional[int] = None,
     ) -> None:
         """
         Initialize the StandardNveStage.
@@ -25,7 +30,8 @@ class StandardNveStage:
             ndump (int, optional): Dump frequency. Default is 1000.
             timestep (float, optional): Timestep value. Default is 1.
             nrun (int, optional): Number of simulation steps. Default is 100000.
-            set_timestep (int, optional): Set timestep. Default is 0.
+            set_timestep (Optional[int], optional): Value to reset the timestep counter to before
+                the substage, or None to leave it unchanged. Default is None.
         """
         self.stage_instance = stage_instance  # Instance of Stage class
         self.lammps_commands_instance = lammps_commands_instance
@@ -37,7 +43,9 @@ class StandardNveStage:
         self.timestep = timestep
         self.nrun = nrun
         self.set_timestep = set_timestep
+        self._description = f"Run {self.nrun} steps with a timestep of {self.timestep}."
 
+    @substage(title="NVE-dynamics", describe=lambda self: self._description)
     def run(self) -> None:
         """
         Run the standard NVE stage.
@@ -48,18 +56,6 @@ class StandardNveStage:
         self.stage_instance.last_lammpstrj_file = f"{file_nve}.lammpstrj"
         self.stage_instance.last_instantaneous_file = f"{file_nve}_instantaneous.out"
 
-        if self.set_timestep is not None:
-            self.lammps_commands_instance.add_set_timestep(
-                set_timestep_to=self.set_timestep
-            )
-
-        title = "NVE-dynamics"
-        numbering = (self.stage_instance.stage_nbr, self.stage_instance.substage_nbr)
-        description = f"Run {self.nrun} steps with a timestep of {self.timestep}."
-        self.lammps_commands_instance.add_substage_title(
-            title=title, numbering=numbering, description=description
-        )
-
         self.lammps_commands_instance.add_thermo_style(
             style_option="custom",
             lst_properties=self.lammps_commands_instance.list_thermo_style_mda,
@@ -102,4 +98,3 @@ class StandardNveStage:
         self.lammps_commands_instance.add_unfix(fix_id="1")
         self.lammps_commands_instance.add_unfix(fix_id="2")
         self.lammps_commands_instance.add_undump(dump_id="1")
-        self.stage_instance.substage_nbr += 1
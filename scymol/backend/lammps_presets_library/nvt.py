@@ -1,5 +1,24 @@
+import string
 from typing import Optional
 
+from scymol.backend.lammps_presets_library._substage_helpers import substage
+
+# Body of the NVT substage, from the thermo output to the cleanup of its fixes and
+# dump. Every line is formatted by add_many_custom_code.
+_NVT_TEMPLATE = string.Template(
+    "thermo_style custom $thermo_properties\n"
+    "fix 1 all nvt temp $temp_initial $temp_final $temp_ncontrol "
+    "drag $drag nreset $nreset mtk yes\n"
+    "fix 2 all ave/time $nevery $nrepeat $nfreq $avetime_properties "
+    "file $instantaneous_file\n"
+    "dump 1 all custom $ndump $lammpstrj_file $dump_properties\n"
+    "timestep $timestep\n"
+    "run $nrun\n"
+    "unfix 1\n"
+    "unfix 2\n"
+    "undump 1"
+)
+
 
 class StandardNvtStage:
     def __init__(
@@ -17,7 +36,7 @@ class StandardNvtStage:
         ndump: int = 1000,
         timestep: float = 1,
         nrun: int = 100_000,
-        set_timestep: int = 0,
+        set_timestep: Optional[int] = None,
     ) -> None:
         """
         Initialize the StandardNvtStage.
@@ -36,7 +55,8 @@ class StandardNvtStage:
             ndump (int, optional): Dump frequency. Default is 1000.
             timestep (float, optional): Timestep value. Default is 1.
             nrun (int, optional): Number of simulation steps. Default is 100000.
-            set_timestep (int, optional): Set timestep. Default is 0.
+            set_timestep (Optional[int], optional): Value to reset the timestep counter to before
+                the substage, or None to leave it unchanged. Default is None.
         """
         self.stage_instance = stage_instance  # Instance of Stage class
         self.lammps_commands_instance = (
@@ -54,7 +74,12 @@ class StandardNvtStage:
         self.timestep = timestep
         self.nrun = nrun
         self.set_timestep = set_timestep
+        self._description = (
+            f"Run {self.nrun} steps with a timestep of {self.timestep}. "
+            f"T from {self.temp_initial} to {self.temp_final}."
+        )
 
+    @substage(title="NVT-dynamics", describe=lambda self: self._description)
     def run(self) -> None:
         """
         Run the standard NVT stage.
@@ -65,65 +90,25 @@ class StandardNvtStage:
         self.stage_instance.last_lammpstrj_file = f"{file_nvt}.lammpstrj"
         self.stage_instance.last_instantaneous_file = f"{file_nvt}_instantaneous.out"
 
-        if self.set_timestep is not None:
-            self.lammps_commands_instance.add_set_timestep(
-                set_timestep_to=self.set_timestep
-            )
-
-        title = "NVT-dynamics"
-        numbering = (self.stage_instance.stage_nbr, self.stage_instance.substage_nbr)
-        description = (
-            f"Run {self.nrun} steps with a timestep of {self.timestep}. "
-            f"T from {self.temp_initial} to {self.temp_final}."
-        )
-        self.lammps_commands_instance.add_substage_title(
-            title=title, numbering=numbering, description=description
-        )
-
-        self.lammps_commands_instance.add_thermo_style(
-            style_option="custom",
-            lst_properties=self.lammps_commands_instance.list_thermo_style_mda,
-        )
-
-        additional_commands = ["mtk yes"]
-        self.lammps_commands_instance.add_fix_nvt(
-            fix_id="1",
-            fix_subset="all",
-            temp_initial=self.temp_initial,
-            temp_final=self.temp_final,
+        lammps_commands_instance = self.lammps_commands_instance
+        block = _NVT_TEMPLATE.substitute(
+            thermo_properties=" ".join(lammps_commands_instance.list_thermo_style_mda),
+            temp_initial=f"{self.temp_initial:.6g}",
+            temp_final=f"{self.temp_final:.6g}",
             temp_ncontrol=self.temp_ncontrol,
-            drag=self.drag,
+            drag=f"{self.drag:.6g}",
             nreset=self.nreset,
-            lst_of_additional_commands=additional_commands,
-        )
-
-        properties = self.lammps_commands_instance.std_list_avetime_properties_mda
-        self.lammps_commands_instance.add_fix_ave_time(
-            fix_id="2",
-            fix_subset="all",
             nevery=self.nevery,
             nrepeat=self.nrepeat,
             nfreq=self.nfreq,
-            list_of_properties=properties,
-            absolute_path_with_file=self.stage_instance.last_instantaneous_file,
-        )
-
-        self.lammps_commands_instance.add_dump(
-            dump_id="1",
-            dump_subset="all",
-            style_option="custom",
+            avetime_properties=" ".join(
+                lammps_commands_instance.std_list_avetime_properties_mda
+            ),
+            instantaneous_file=self.stage_instance.last_instantaneous_file,
             ndump=self.ndump,
-            absolute_path_with_file=self.stage_instance.last_lammpstrj_file,
-            properties=self.lammps_commands_instance.std_list_dump_properties,
+            lammpstrj_file=self.stage_instance.last_lammpstrj_file,
+            dump_properties=" ".join(lammps_commands_instance.std_list_dump_properties),
+            timestep=f"{self.timestep:.6g}",
+            nrun=self.nrun,
         )
-
-        self.lammps_commands_instance.add_timestep(timestep=self.timestep)
-        self.lammps_commands_instance.add_run_command(nsteps=self.nrun)
-
-        self._cleanup()
-
-    def _cleanup(self) -> None:
-        self.lammps_commands_instance.add_unfix(fix_id="1")
-        self.lammps_commands_instance.add_unfix(fix_id="2")
-        self.lammps_commands_instance.add_undump(dump_id="1")
-        self.stage_instance.substage_nbr += 1
+        lammps_commands_instance.add_many_custom_code(block.splitlines())
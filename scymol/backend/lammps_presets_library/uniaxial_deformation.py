@@ -1,3 +1,6 @@
+from typing import Optional
+
+
 class StandardDeformationStage:
     def __init__(
         self,
@@ -17,7 +20,7 @@ class StandardDeformationStage:
         ndump: int = 1000,
         timestep: float = 1,
         nrun: int = 100_000,
-        set_timestep: int = 0,
+        set_timestep: Optional[int] = None,
         wallskin: float = 2.0,
     ) -> None:
         """
@@ -40,7 +43,8 @@ class StandardDeformationStage:
             ndump (int, optional): Dump frequency. Default is 1000.
             timestep (float, optional): Timestep value. Default is 1.
             nrun (int, optional): Number of simulation steps. Default is 100000.
-            set_timestep (int, optional): Set timestep. Default is 0.
+            set_timestep (Optional[int], optional): Value to reset the timestep counter to before
+                the substage, or None to leave it unchanged. Default is None.
             wallskin (float, optional): Wall skin thickness. Default is 2.0.
         """
         self.stage_instance = stage_instance
@@ -1,3 +1,6 @@
+from scymol.backend.lammps_presets_library._substage_helpers import substage
+
+
 class StandardVelocitiesStage:
     def __init__(
         self,
@@ -31,22 +34,16 @@ class StandardVelocitiesStage:
         self.dist_type = dist_type
         self.momentum = momentum
         self.rotation = rotation
+        self._description = (
+            f"Initialize velocities to {self.temp} (seed {self.random_seed}) "
+            f"using a {self.dist_type} distribution."
+        )
 
+    @substage(title="Velocities", describe=lambda self: self._description)
     def run(self) -> None:
         """
         Run the standard velocities initialization stage.
         """
-        title = "Velocities"
-        numbering = (self.stage_instance.stage_nbr, self.stage_instance.substage_nbr)
-        description = (
-            f"Initialize velocities to {self.temp} (seed {self.random_seed}) "
-            f"using a {self.dist_type} distribution."
-        )
-
-        self.lammps_commands_instance.add_substage_title(
-            title=title, numbering=numbering, description=description
-        )
-
         self.lammps_commands_instance.add_velocities(
             velocities_subset=self.velocities_subset,
             temp=self.temp,
@@ -55,4 +52,3 @@ class StandardVelocitiesStage:
             momentum=self.momentum,
             rotation=self.rotation,
         )
-        self.stage_instance.substage_nbr += 1
@@ -17,7 +17,7 @@ from scymol.backend.lammps_presets_library.initialization import (
 )
 from scymol.backend.lammps_presets_library.nve import StandardNveStage
 from scymol.backend.lammps_commands import LammpsCommands
-from typing import Dict, Any, Tuple, Optional
+from typing import Dict, Any, List, Tuple, Optional
 
 
 class LammpsStages:
@@ -29,6 +29,7 @@ class LammpsStages:
         last_instantaneous_file: str = None,
         stage_nbr: int = None,
         logfile: str = None,
+        working_dir: str = "",
         **kwargs,
     ):
         """
@@ -39,6 +40,8 @@ class LammpsStages:
             last_instantaneous_file (str, optional): The path to the last instantaneous data file.
             stage_nbr (int, optional): The stage number.
             logfile (str, optional): Name of the log file.
+            working_dir (str, optional): The directory where the stage's files are written and
+                LAMMPS is run. Defaults to the current working directory.
             **kwargs: Additional keyword arguments.
 
         Attributes:
@@ -50,6 +53,7 @@ class LammpsStages:
             last_instantaneous_data (Any): Parsed instantaneous data (initialized to None).
             last_lammpstrj_data (Any): Parsed trajectory data (initialized to None).
             lammps_input_script_file (str): The path to the LAMMPS input script file (initialized to None).
+            working_dir (str): The directory where the stage's files are written and LAMMPS is run.
 
         Note:
             The `**kwargs` parameter allows you to pass additional parameters as keyword arguments,
@@ -65,6 +69,8 @@ class LammpsStages:
         self.last_instantaneous_data = None
         self.last_lammpstrj_data = None
         self.lammps_input_script_file = None
+        self.working_dir = working_dir
+        self._last_trajectory: Optional[Tuple[List[str], List[str]]] = None
 
     def call_methods(self, stage: Dict[str, Any]) -> None:
         """
@@ -116,8 +122,8 @@ class LammpsStages:
         Returns:
             None
         """
-        with open(lammps_input_script_file, "w") as f:
-            f.write("\n".join(self.lammps_commands_instance.script))
+        with open(os.path.join(self.working_dir, lammps_input_script_file), "w") as f:
+            self.lammps_commands_instance.emit_to(f)
         self.lammps_input_script_file = lammps_input_script_file
 
     def standard_initialization_substage(self, **params: Any) -> None:
@@ -246,6 +252,8 @@ class LammpsStages:
         """
         Run a LAMMPS simulation using the specified number of CPU cores.
 
+        The command is executed in the stage's working directory.
+
         Args:
             run_command (str): The command that is going to be executed (e.g., "mpiexec -n 4 lmp -in stage_1.in")
 
@@ -261,7 +269,12 @@ class LammpsStages:
         cmd = run_command.split(" ")
 
         # Run the command and capture the error message if there is one
-        proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        proc = subprocess.run(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=self.working_dir or None,
+        )
 
         # Capture the standard output from LAMMPS
         lammps_out = proc.stdout.decode()
@@ -301,14 +314,26 @@ class LammpsStages:
             raise FileNotFoundError("Last LAMMPS trajectory file is not specified.")
 
         # Read the last trajectory from the specified file
-        header, data = lf.get_last_trajectory(file_name=self.last_lammpstrj_file)
+        header, data = self._read_last_trajectory()
+
+        # Write the last trajectory into 'last.lammpstrj' file, with the timestep reset
+        with open(file=os.path.join(self.working_dir, "last.lammpstrj"), mode="w") as f:
+            f.write("\n".join([header[0], "0", *header[2:], *data]))
+
+    def _read_last_trajectory(self) -> Tuple[List[str], List[str]]:
+        """
+        Read the header and data lines of the last trajectory in 'last_lammpstrj_file'.
 
-        # Modify the timestep in the header
-        header[1] = "0"
+        The lines are read once and reused by write_last_trajectory and parse_last_trajectory.
 
-        # Write the last trajectory into 'last.lammpstrj' file
-        with open(file="last.lammpstrj", mode="w") as f:
-            f.write("\n".join(header + data))
+        Returns:
+            Tuple[List[str], List[str]]: The header and data lines of the last trajectory.
+        """
+        if self._last_trajectory is None:
+            self._last_trajectory = lf.get_last_trajectory(
+                file_name=os.path.join(self.working_dir, self.last_lammpstrj_file)
+            )
+        return self._last_trajectory
 
     def parse_last_trajectory(self) -> Tuple[Optional[Any], Optional[Any]]:
         """
@@ -322,9 +347,8 @@ class LammpsStages:
         if self.last_lammpstrj_file is None:
             raise FileNotFoundError("Last LAMMPS trajectory file is not specified.")
 
-        # Assuming header and data are needed to parse trajectory information,
-        # so get them again here. Consider more efficient methods if needed.
-        header, data = lf.get_last_trajectory(file_name=self.last_lammpstrj_file)
+        # Header and data lines of the last trajectory (read by write_last_trajectory)
+        header, data = self._read_last_trajectory()
 
         # Parsing trajectory information:
         self.last_lammpstrj_data = lf.parse_trajectory(header=header, data=data)
@@ -334,7 +358,7 @@ class LammpsStages:
             self.last_instantaneous_data = None
         else:
             self.last_instantaneous_data = lf.read_avetime_dump_file(
-                file_name=self.last_instantaneous_file
+                file_name=os.path.join(self.working_dir, self.last_instantaneous_file)
             )
 
         return self.last_lammpstrj_data, self.last_instantaneous_data
@@ -1,8 +1,27 @@
-import datetime
+import atexit
 import functools
 import os
+import time
 import warnings
-from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+
+# Log directories already created by create_log_file in this process.
+_ensured_dirs: Set[str] = set()
+
+# Whether a UserWarning from warnings.warn reaches stderr, i.e. the first filter that
+# applies to it (as set up at import) does not ignore it.
+_WARNINGS_SHOWN = next(
+    (
+        action != "ignore"
+        for action, _message, category, _module, _lineno in warnings.filters
+        if issubclass(UserWarning, category)
+    ),
+    True,
+)
+
+# (second since the epoch, formatted timestamp) of the last get_log_file_name call.
+_last_timestamp: Tuple[int, str] = (-1, "")
 
 
 def get_log_file_name(suffix: str = "log.txt") -> str:
@@ -15,8 +34,14 @@ def get_log_file_name(suffix: str = "log.txt") -> str:
     Returns:
         str: A string representing the log file name with a timestamp.
     """
-    now = datetime.datetime.now()
-    timestamp = now.strftime("%Y-%m-%d_%H-%M-%S")
+    global _last_timestamp
+
+    # Reuse the formatted timestamp when called again within the same second.
+    now = int(time.time())
+    second, timestamp = _last_timestamp
+    if second != now:
+        timestamp = time.strftime("%Y-%m-%d_%H-%M-%S", time.localtime(now))
+        _last_timestamp = (now, timestamp)
     log_file_name = f"{timestamp}_{suffix}"
     return log_file_name
 
@@ -32,28 +57,145 @@ def create_log_file(logdir: str = "", constant: bool = False) -> str:
     Returns:
         str: The absolute path to the created log file.
     """
-    # Convert logdir to a Path object for better path handling
-    logdir_path = Path(logdir)
-
     # Choose log file name based on whether constant is True or False
     if not constant:
-        logfile_name = logdir_path / get_log_file_name(suffix="log.txt")
+        logfile_name = os.path.join(logdir, get_log_file_name(suffix="log.txt"))
     else:
-        logfile_name = logdir_path / "log.txt"
+        logfile_name = os.path.join(logdir, "log.txt")
+
+    # Ensure the directory exists (once per directory and process)
+    if logdir and logdir not in _ensured_dirs:
+        os.makedirs(logdir, exist_ok=True)
+        _ensured_dirs.add(logdir)
+
+    # Create and clear the log file. The directory may have been removed since it
+    # was first ensured, in which case it is created again.
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    try:
+        fd = os.open(logfile_name, flags, 0o644)
+    except FileNotFoundError:
+        os.makedirs(logdir, exist_ok=True)
+        fd = os.open(logfile_name, flags, 0o644)
+    os.close(fd)
+    return os.path.abspath(logfile_name)
+
+
+class Logger:
+    """
+    Append messages to a log file through a file descriptor that stays open between calls.
+
+    The descriptor is opened lazily with O_APPEND. By default every message reaches the
+    file as soon as it is logged, which keeps the log readable while a job is still
+    running; messages written with flush=False are held back and written together with
+    the next flushed message in a single call.
+    """
 
-    # Ensure the directory exists
-    logfile_name.parent.mkdir(parents=True, exist_ok=True)
+    def __init__(self, logfile: str) -> None:
+        """
+        Initialize a Logger for a log file. The file is opened on the first message.
+
+        Args:
+            logfile (str): The path to the log file.
+        """
+        self.logfile = logfile
+        self._fd: Optional[int] = None
+        self._pending: List[bytes] = []
+
+    def write(self, message: str, warning: bool = False, flush: bool = True) -> None:
+        """
+        Write a timestamped message to the log file and to stdout.
+
+        Args:
+            message (str): The message to be written to the log file.
+            warning (bool, optional): If True, raise a warning with the message. Defaults to False.
+            flush (bool, optional): If False, the message is only written to the log file with
+                the next flushed message. Defaults to True.
+        """
+        timestamp = time.strftime("%Y-%m-%d_%H:%M:%S", time.localtime())
+        log_message = f"{timestamp} | {message}"
+
+        self._pending.append(f"{log_message}\n".encode())
+        if flush:
+            self.flush()
+
+        # A warning that is not filtered out already reaches stderr, so the message is
+        # only printed to stdout when it is not shown as a warning.
+        if warning and _WARNINGS_SHOWN:
+            warnings.warn(log_message)
+        else:
+            print(log_message, flush=True)
+
+    def flush(self) -> None:
+        """
+        Write the messages held back by the Logger to the log file.
+        """
+        if not self._pending:
+            return
+        if self._fd is None:
+            self._fd = os.open(
+                self.logfile, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+            )
+        os.write(self._fd, b"".join(self._pending))
+        self._pending.clear()
+
+    def close(self) -> None:
+        """
+        Write the pending messages and close the log file descriptor, if it is open.
+        """
+        self.flush()
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+# Open loggers, keyed by log file path.
+_loggers: Dict[str, Logger] = {}
+
+
+def get_logger(logfile: str) -> Logger:
+    """
+    Return the Logger for a log file, creating it on first use.
 
-    # Get the absolute path of the log file
-    absolute_path = logfile_name.resolve()
+    Args:
+        logfile (str): The path to the log file.
 
-    # Create and clear the log file
-    with open(absolute_path, "w") as log_file:
-        log_file.write("")  # Clear the contents of the file by writing an empty string
-    return str(absolute_path)
+    Returns:
+        Logger: The Logger writing to logfile.
+    """
+    logger = _loggers.get(logfile)
+    if logger is None:
+        logger = _loggers[logfile] = Logger(logfile)
+    return logger
 
 
-def print_to_log(logfile: str, message: str, warning: bool = False) -> None:
+@atexit.register
+def _close_loggers() -> None:
+    """
+    Close every open Logger when the interpreter exits.
+    """
+    for logger in _loggers.values():
+        logger.close()
+    _loggers.clear()
+
+
+def close_logger(logfile: str) -> None:
+    """
+    Close the Logger for a log file, if one is open.
+
+    Must be called before the log file is deleted or moved, so that later messages
+    are written to a freshly opened file instead of the unlinked one.
+
+    Args:
+        logfile (str): The path to the log file.
+    """
+    logger = _loggers.pop(logfile, None)
+    if logger is not None:
+        logger.close()
+
+
+def print_to_log(
+    logfile: str, message: str, warning: bool = False, flush: bool = True
+) -> None:
     """
     Print a message to a log file with timestamp and optionally raise a warning.
 
@@ -61,19 +203,10 @@ def print_to_log(logfile: str, message: str, warning: bool = False) -> None:
         logfile (str): The path to the log file where the message will be written.
         message (str): The message to be written to the log file.
         warning (bool, optional): If True, raise a warning with the message. Defaults to False.
+        flush (bool, optional): If False, the message is only written to the log file with the
+            next flushed message for the same file. Defaults to True.
 
     Returns:
         None
     """
-    now = datetime.datetime.now()
-    timestamp = now.strftime("%Y-%m-%d_%H:%M:%S")
-
-    log_message = f"{timestamp} | {message}"
-
-    with open(logfile, "a") as log_file:
-        log_file.write(log_message + "\n")
-
-    if warning:
-        warnings.warn(log_message)
-
-    print(log_message, flush=True)
+    get_logger(logfile).write(message, warning=warning, flush=flush)
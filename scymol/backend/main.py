@@ -1,18 +1,85 @@
 import argparse
-import copy
-import importlib
+import importlib.resources
 import json
 import os
 import shutil
 import time
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from typing import Dict, Optional, Tuple
+
+import numba
+import numpy as np
 
 import scymol.backend.backend_static_functions as backend_static_functions
 import scymol.backend.inputs as inputs
 import scymol.backend.log_functions as log_functions
 from scymol.backend.lammps_stages import LammpsStages
 from scymol.backend.mixture import Mixture
+from scymol.backend.molecule import Molecule
 from scymol.backend.pysimm_system import PysimmSystem
 
+# Root of the installed scymol package; the job outputs are written below it.
+_SCYMOL_ROOT = importlib.resources.files("scymol")
+
+# Files handed over by the frontend for the 'from_previous_lammps' run mode (relative to
+# the directory the backend is started from).
+_TEMP_FILES_DIR = os.path.abspath(os.path.join("front2back", "temp_files"))
+
+# Number of mixture attempts evaluated concurrently by JobRunner.run_trials.
+_MAX_TRIAL_WORKERS = os.cpu_count() or 1
+
+
+def _init_trial_worker(mol_binaries: Dict[str, bytes]) -> None:
+    """
+    Set up a trial worker process.
+
+    The conformers prepared by the parent are loaded into the SMILES cache of Molecule,
+    since a worker does not inherit it under the 'spawn' and 'forkserver' start methods.
+    The numba kernels are limited to a single thread: the trial pool already runs one
+    worker process per core, so letting the parallel LJ kernels of every worker spread
+    over all the cores as well would oversubscribe them.
+
+    :param mol_binaries: The molecules of the parent's SMILES cache, as RDKit binary blobs.
+    :type mol_binaries: Dict[str, bytes]
+    :return: None
+    """
+    Molecule.load_conformers(mol_binaries)
+    numba.set_num_threads(1)
+
+
+def generate_mixture(seed: int) -> Tuple[bool, Optional[Mixture]]:
+    """
+    Generate a mixture of molecules and test its LJ potential energy against a threshold.
+
+    This function runs in the worker processes of JobRunner.run_trials and performs the
+    following steps:
+    1. Seeds NumPy's global random state, which drives the random rotation of the molecules.
+    2. Creates a new Mixture and translates its molecules to the Sobol positions.
+    3. Calculates the Lennard-Jones (LJ) potential energy for the mixture.
+    4. Accepts the mixture if the energy is less than 'inputs.potential_energy_limit'.
+
+    Only accepted mixtures are sent back to the parent process.
+
+    :param seed: The seed of NumPy's global random state for this attempt.
+    :type seed: int
+    :return: Whether the mixture is accepted, and the mixture itself if it is.
+    :rtype: Tuple[bool, Optional[Mixture]]
+    """
+    np.random.seed(seed)
+    mixture = Mixture()
+
+    # Generate Sobol positions for the mixture.
+    mixture.generate_sobol_positions()
+
+    # Translate molecules to Sobol positions.
+    mixture.translate_molecules_to_sobol_positions()
+
+    # Calculate the LJ potential energy for the mixture.
+    mixture.calculate_lj_potential_energy()
+
+    # Return whether the mixture is accepted.
+    return mixture.accepted, mixture if mixture.accepted else None
+
 
 class JobRunner:
     def __init__(self, job_id: str) -> None:
@@ -27,17 +94,20 @@ class JobRunner:
         :return: None
         """
 
+        # Output directory of the job, reused for every path built below it.
+        self._job_out = _SCYMOL_ROOT.joinpath("output", f"{job_id}")
+
         # Setting up job directory
         try:
             # Create the output/ directory for the job.
-            os.makedirs(
-                importlib.resources.files("scymol").joinpath("output", f"{args.id}"),
-                exist_ok=False,
-            )
+            os.mkdir(self._job_out)
         except FileExistsError:
             raise FileExistsError(
-                f"Directory output/{args.id}/ already exists! Cannot submit a job there."
+                f"Directory output/{job_id}/ already exists! Cannot submit a job there."
             )
+        except FileNotFoundError:
+            # The output/ folder itself does not exist yet.
+            os.makedirs(self._job_out)
 
         # Initialize instance variables with default values.
         self.pysimm_working_dir = None
@@ -57,9 +127,7 @@ class JobRunner:
         :rtype: str
         """
         log_file = log_functions.create_log_file(
-            logdir=str(
-                importlib.resources.files("scymol").joinpath("output", f"{self.job_id}")
-            ),
+            logdir=str(self._job_out),
             constant=True,
         )
         return log_file
@@ -77,22 +145,14 @@ class JobRunner:
         if inputs.run_mode == "mixture+pysimm+lammps":
 
             os.makedirs(
-                importlib.resources.files("scymol").joinpath(
-                    "output",
-                    f"{self.job_id}",
-                    f"mixture_{self.nbr_of_mixtures_accepted}",
-                ),
+                self._job_out.joinpath(f"mixture_{self.nbr_of_mixtures_accepted}"),
                 exist_ok=True,
             )
 
         elif inputs.run_mode == "from_previous_lammps":
             # Create directory for 'from_previous_lammps' run mode.
             os.makedirs(
-                importlib.resources.files("scymol").joinpath(
-                    "output",
-                    f"{self.job_id}",
-                    f"mixture_{self.nbr_of_mixtures_accepted}",
-                ),
+                self._job_out.joinpath(f"mixture_{self.nbr_of_mixtures_accepted}"),
                 exist_ok=True,
             )
 
@@ -101,7 +161,7 @@ class JobRunner:
         Generate Pysimm system and LAMMPS inputs for a mixture.
 
         This method performs the following steps:
-        1. Exports molecules in the mixture to *.mol files.
+        1. Converts the molecules in the mixture to MOL file contents, in memory.
         2. Initializes and sets up a Pysimm system.
         3. Generates LAMMPS topologies (e.g., structure.data file) needed for the simulation.
 
@@ -109,20 +169,15 @@ class JobRunner:
         :return: None
         """
         # Create a Pysimm system and set up LAMMPS inputs.
-        pysimm_system = PysimmSystem(
-            mixture=mixture, working_dir=self.pysimm_working_dir
-        )
+        pysimm_system = PysimmSystem(mixture=mixture)
         pysimm_system.initialize_system()
         pysimm_system.load_all_molecules_into_system()
         pysimm_system.set_box_dimensions()
 
         # Generating structure data file for LAMMPS simulation from pysimm_system:
-        ref_dir = os.getcwd()
-        os.chdir(path=f"{self.pysimm_working_dir}/")
-        pysimm_system.generate_lammps_inputs()
-        os.rename(src="temp.lmps", dst="structure.data")
-        os.remove("pysimm.sim.in")
-        os.chdir(path=ref_dir)
+        pysimm_system.generate_lammps_inputs(
+            data_file=os.path.join(self.pysimm_working_dir, "structure.data")
+        )
 
     def generate_and_run_lammps(self) -> None:
         """
@@ -134,15 +189,15 @@ class JobRunner:
 
         :return: None
         """
-        # Store the current working directory for later reference.
-        ref_dir = os.getcwd()
-
-        # Change directory to the LAMMPS working directory.
-        os.chdir(path=f"{self.pysimm_working_dir}/")
-
         # Initialize previous LAMMPS stage as None.
         previous_lammps_stage = None
 
+        # Command of every stage (the input script of stage n is stage_n.in).
+        run_commands = [
+            inputs.run_command.replace("-in stage_1.in", f"-in stage_{stage_nbr}.in")
+            for stage_nbr in range(1, len(inputs.lammps_stages_and_methods) + 1)
+        ]
+
         # Iterate through the LAMMPS stages and methods.
         for stage_nbr, stage in enumerate(inputs.lammps_stages_and_methods):
             if previous_lammps_stage is not None:
@@ -154,13 +209,18 @@ class JobRunner:
                 ) = previous_lammps_stage.parse_last_trajectory()
 
             # Create a new LAMMPS stage and call the specified methods.
-            lammps_stage = LammpsStages(stage_nbr=stage_nbr + 1, logfile=self.logfile)
+            lammps_stage = LammpsStages(
+                stage_nbr=stage_nbr + 1,
+                logfile=self.logfile,
+                working_dir=str(self.pysimm_working_dir),
+            )
             lammps_stage.call_methods(stage)
 
-            # Print messages to the log.
+            # Print messages to the log (written to the file together).
             log_functions.print_to_log(
                 logfile=self.logfile,
                 message=f"LAMMPS stages:\n{json.dumps(stage, indent=4)}\n",
+                flush=False,
             )
             log_functions.print_to_log(
                 logfile=self.logfile,
@@ -168,119 +228,127 @@ class JobRunner:
             )
 
             # Run the LAMMPS stage with the specified settings.
-            lammps_stage.run(
-                run_command=inputs.run_command.replace(
-                    "-in stage_1.in", f"-in stage_{stage_nbr + 1}.in"
-                ),
-            )
-
-            # Update the previous LAMMPS stage for data processing.
-            previous_lammps_stage = copy.deepcopy(lammps_stage)
+            lammps_stage.run(run_command=run_commands[stage_nbr])
 
-        # Change back to the original working directory.
-        os.chdir(path=ref_dir)
+            # Keep the LAMMPS stage for data processing in the next iteration. A new
+            # instance is created for every stage, so a plain reference is enough.
+            previous_lammps_stage = lammps_stage
 
     def run_trials(self) -> None:
         """
         Run a series of trials to create mixtures and perform simulations.
 
         This method iterates through multiple trials, creating mixtures and conducting simulations based
-        on the specified run mode. It also logs the progress and completion time for each trial.
+        on the specified run mode. Mixture attempts are evaluated in batches of up to
+        '_MAX_TRIAL_WORKERS' worker processes. It also logs the progress and completion time for each trial.
 
         :return: None
         """
-        while self.trial_i <= inputs.number_of_trials:
-            # Record the start time of the current trial.
-            trial_start_time = time.time()
+        executor = None
+        if inputs.run_mode == "mixture+pysimm+lammps":
+            # Generate the conformer of every molecule type up front, in parallel.
+            Molecule.prepare_conformers(
+                value["smiles"] for value in inputs.molecules_dictionary.values()
+            )
+            executor = ProcessPoolExecutor(
+                max_workers=_MAX_TRIAL_WORKERS,
+                initializer=_init_trial_worker,
+                initargs=(Molecule.export_conformers(),),
+            )
+        try:
+            while self.trial_i <= inputs.number_of_trials:
+                # Record the start time of the current trial.
+                trial_start_time = time.time()
 
-            if inputs.run_mode == "mixture+pysimm+lammps":
-                # Create a new Mixture instance.
-                mixture = Mixture()
+                if inputs.run_mode == "mixture+pysimm+lammps":
+                    batch_size = min(
+                        _MAX_TRIAL_WORKERS, inputs.number_of_trials - self.trial_i + 1
+                    )
 
-                # Log information about the current mixture.
-                log_functions.print_to_log(
-                    logfile=self.logfile,
-                    message=f"Mixture {self.nbr_of_mixtures_accepted + 1} | Initializing atomic positions (Attempt {self.trial_i})",
-                )
+                    # Log information about the current mixture.
+                    log_functions.print_to_log(
+                        logfile=self.logfile,
+                        message=f"Mixture {self.nbr_of_mixtures_accepted + 1} | Initializing atomic positions "
+                        f"(Attempts {self.trial_i}-{self.trial_i + batch_size - 1})",
+                    )
 
-                # Generate the mixture and proceed if accepted.
-                if self.generate_mixture(mixture):
+                    # Generate the mixtures and proceed with the first one accepted.
+                    mixture = self.run_trial_batch(executor, batch_size)
+                    self.trial_i += batch_size
+                    if mixture is not None:
+                        self.nbr_of_mixtures_accepted += 1
+                        self.trial_i = 1
+                        self.create_directories()
+                        self.pysimm_working_dir = self._job_out.joinpath(
+                            f"mixture_{self.nbr_of_mixtures_accepted}"
+                        )
+                        self.generate_pysimm(mixture)
+                        self.generate_and_run_lammps()
+
+                        # Exit loop if the number_of_mixtures_needed has been reached.
+                        if (
+                            self.nbr_of_mixtures_accepted
+                            == inputs.number_of_mixtures_needed
+                        ):
+                            break
+
+                elif inputs.run_mode == "from_previous_lammps":
                     self.nbr_of_mixtures_accepted += 1
-                    self.trial_i = 0
                     self.create_directories()
-                    self.pysimm_working_dir = importlib.resources.files(
-                        "scymol"
-                    ).joinpath(
-                        "output",
-                        f"{self.job_id}",
-                        f"mixture_{self.nbr_of_mixtures_accepted}",
+                    self.pysimm_working_dir = self._job_out.joinpath(
+                        f"mixture_{self.nbr_of_mixtures_accepted}"
+                    )
+                    shutil.copyfile(
+                        os.path.join(_TEMP_FILES_DIR, "temp.lmps"),
+                        os.path.join(f"{self.pysimm_working_dir}", f"structure.data"),
                     )
-                    self.generate_pysimm(mixture)
-                    self.generate_and_run_lammps()
-
-                    # Exit loop if the number_of_mixtures_needed has been reached.
-                    if (
-                        self.nbr_of_mixtures_accepted
-                        == inputs.number_of_mixtures_needed
-                    ):
-                        break
-
-            elif inputs.run_mode == "from_previous_lammps":
-                self.nbr_of_mixtures_accepted += 1
-                self.create_directories()
-                self.pysimm_working_dir = importlib.resources.files("scymol").joinpath(
-                    "output",
-                    f"{self.job_id}",
-                    f"mixture_{self.nbr_of_mixtures_accepted}",
-                )
-                shutil.copy(
-                    os.path.join("front2back/temp_files", "temp.lmps"),
-                    os.path.join(f"{self.pysimm_working_dir}", f"structure.data"),
-                )
 
-                shutil.copy(
-                    os.path.join("front2back/temp_files", "last.lammpstrj"),
-                    os.path.join(f"{self.pysimm_working_dir}", f"last.lammpstrj"),
-                )
+                    shutil.copyfile(
+                        os.path.join(_TEMP_FILES_DIR, "last.lammpstrj"),
+                        os.path.join(f"{self.pysimm_working_dir}", f"last.lammpstrj"),
+                    )
 
-                self.generate_and_run_lammps()
+                    self.generate_and_run_lammps()
 
-            # Log the completion time for the current trial.
-            log_functions.print_to_log(
-                logfile=self.logfile,
-                message=f"Mixture {self.nbr_of_mixtures_accepted + 1} | "
-                f"Mixture completed after {time.time() - trial_start_time: .2f}s.",
-            )
+                    # Increment the trial counter.
+                    self.trial_i += 1
 
-            # Increment the trial counter.
-            self.trial_i += 1
+                # Log the completion time for the current trial.
+                log_functions.print_to_log(
+                    logfile=self.logfile,
+                    message=f"Mixture {self.nbr_of_mixtures_accepted + 1} | "
+                    f"Mixture completed after {time.time() - trial_start_time: .2f}s.",
+                )
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
 
     @staticmethod
-    def generate_mixture(mixture) -> bool:
+    def run_trial_batch(executor: Executor, batch_size: int) -> Optional[Mixture]:
         """
-        Generate a mixture of molecules and calculate LJ potential energy and return True if its energy is below a threshold.
+        Evaluate a batch of mixture attempts concurrently and return the first one accepted.
 
-        This method generates a mixture of molecules, performs the following steps:
-        1. Generates Sobol positions for the mixture.
-        2. Translates molecules to Sobol positions.
-        3. Calculates the Lennard-Jones (LJ) potential energy for the mixture.
-        4. Returns True if the energy computed is less than 'inputs.potential_energy_limit'.
+        Each attempt gets its own random seed. As soon as one of them is accepted, the
+        attempts that have not started yet are cancelled.
 
-        :param mixture: The mixture of molecules to be generated and analyzed.
-        :return: True if the mixture is accepted, False otherwise.
-        :rtype: bool
+        :param executor: The executor running the attempts.
+        :type executor: Executor
+        :param batch_size: The number of attempts in the batch.
+        :type batch_size: int
+        :return: The first accepted mixture, or None if every attempt was rejected.
+        :rtype: Optional[Mixture]
         """
-        # Generate Sobol positions for the mixture.
-        mixture.generate_sobol_positions()
-
-        # Translate molecules to Sobol positions.
-        mixture.translate_molecules_to_sobol_positions()
-
-        # Calculate the LJ potential energy for the mixture.
-        mixture.calculate_lj_potential_energy()
-
-        # Return whether the mixture is accepted.
-        return mixture.accepted
+        seeds = np.random.SeedSequence().generate_state(batch_size)
+        futures = [executor.submit(generate_mixture, int(seed)) for seed in seeds]
+        try:
+            for future in as_completed(futures):
+                accepted, mixture = future.result()
+                if accepted:
+                    return mixture
+        finally:
+            for future in futures:
+                future.cancel()
+        return None
 
     def run(self) -> None:
         """
@@ -297,12 +365,10 @@ class JobRunner:
         # Record the start time of the program.
         start_time = time.time()
 
-        # Clear the output/ folder associated with the job.
-        backend_static_functions.clear_folder(
-            folder_path=importlib.resources.files("scymol").joinpath(
-                "output", f"{self.job_id}"
-            )
-        )
+        # Clear the output/ folder associated with the job. The log file is removed
+        # along with it, so its handle is closed and reopened on the next message.
+        log_functions.close_logger(self.logfile)
+        backend_static_functions.clear_folder(folder_path=self._job_out)
 
         # Print a log message indicating the start of mixture creation.
         log_functions.print_to_log(
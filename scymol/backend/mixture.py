@@ -1,6 +1,6 @@
-import copy
 import importlib
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 import numpy as np
 from pysimm import forcefield
 from rdkit import Chem
@@ -8,17 +8,29 @@ import scymol.backend.backend_static_functions as backend_static_functions
 import scymol.backend.inputs as inputs
 from scymol.backend.molecule import Molecule
 
+# Cutoff (Angstrom) of the LJ acceptance energy.
+_LJ_RCUT = 10.0
+
+# Number of atoms from which the all-pairs LJ acceptance energy is computed in single
+# precision.
+_LJ_FP32_MIN_ATOMS = 2000
+
+# Number of threads writing Mol files in Mixture.export_molecules.
+_EXPORT_WORKERS = 8
+
 
 class Mixture:
     _id: int = 0  # Class variable to keep track of the number of Mixture instances
+    _forcefield_cache: Dict[str, Any] = {}  # Force fields already loaded, by name
 
     def __init__(self) -> None:
         """
         Initialize a new Mixture instance.
 
         This constructor sets initial attributes, resets molecule counters, populates
-        molecules based on a global dictionary, updates mixture information, generates
-        Sobol positions, and initializes other attributes.
+        molecules based on a global dictionary, updates mixture information, and
+        initializes other attributes. The Sobol positions are generated later by
+        generate_sobol_positions().
 
         Returns:
             None
@@ -40,21 +52,68 @@ class Mixture:
         # Update mixture information
         self.update_mixture_information()
 
-        self.sobol_x = []
-        self.sobol_y = []
-        self.sobol_z = []
+        self.sobol_x: np.ndarray = np.empty(0)
+        self.sobol_y: np.ndarray = np.empty(0)
+        self.sobol_z: np.ndarray = np.empty(0)
 
-        # Generate Sobol positions
-        self.generate_sobol_positions()
+        # (N, 3) buffer with the positions of all atoms, reused by every LJ evaluation
+        self.atom_positions: Optional[np.ndarray] = None
 
         self.accepted = False
 
         # Initialize force field based on inputs
-        self.forcefield = getattr(forcefield, inputs.use_forcefield)()
+        self.forcefield = self._get_forcefield()
 
         # Initialize force field chagres based on inputs
         self.charges = inputs.charges
 
+    @classmethod
+    def _get_forcefield(cls) -> Any:
+        """
+        Return the pysimm force field named in 'inputs.use_forcefield'.
+
+        The force field is loaded (and its parameter file parsed) only once per process;
+        later mixtures share the same instance.
+
+        Returns:
+            Any: The pysimm force field object.
+        """
+        forcefield_name = inputs.use_forcefield
+        if forcefield_name not in cls._forcefield_cache:
+            cls._forcefield_cache[forcefield_name] = getattr(
+                forcefield, forcefield_name
+            )()
+        return cls._forcefield_cache[forcefield_name]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Return the state of the mixture to pickle, e.g., to send it between processes.
+
+        The force field (the whole parameter set) and the LJ position buffer are left out, to
+        keep the pickled mixture small; both are restored or rebuilt by the receiving process.
+
+        Returns:
+            Dict[str, Any]: The attributes of the mixture, without 'forcefield' and
+            'atom_positions'.
+        """
+        state = self.__dict__.copy()
+        del state["forcefield"]
+        state["atom_positions"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Restore a pickled mixture, taking the force field from this process's cache.
+
+        Args:
+            state (Dict[str, Any]): The state returned by __getstate__().
+
+        Returns:
+            None
+        """
+        self.__dict__.update(state)
+        self.forcefield = self._get_forcefield()
+
     def _populate_molecules(self) -> None:
         """
         Populate the list of molecules based on the global dictionary.
@@ -63,16 +122,33 @@ class Mixture:
             None
         """
         for key, value in inputs.molecules_dictionary.items():
-            self.molecules.append(Molecule(name=key, info=value))
-            self.molecules_set.append(self.molecules[-1])
+            molecule = Molecule(name=key, info=value)
+            self._append_molecule(molecule)
+            self.molecules_set.append(molecule)
+            duplicates = []
             for _ in range(value["nbr_of_mols"] - 1):
-                duplicate_molecule = copy.deepcopy(self.molecules[-1])
+                duplicate_molecule = molecule.clone()
                 duplicate_molecule.update_name_and_id()
-                if value["rotate"]:
-                    duplicate_molecule.randomly_rotate_mol()
-                self.molecules.append(duplicate_molecule)
+                duplicates.append(duplicate_molecule)
+                self._append_molecule(duplicate_molecule)
+            if value["rotate"]:
+                Molecule.batch_randomly_rotate(duplicates)
         self.sort_molecules_by_type()
 
+    def _append_molecule(self, molecule: Molecule) -> None:
+        """
+        Append a molecule to the mixture and add it to the weight and number of molecules.
+
+        Args:
+            molecule (Molecule): The molecule to append.
+
+        Returns:
+            None
+        """
+        self.molecules.append(molecule)
+        self.weight += molecule.mw_gmol
+        self.nbr_of_mols += 1
+
     def sort_molecules_by_type(self) -> None:
         """
         Sort molecules in the mixture by their type.
@@ -80,21 +156,26 @@ class Mixture:
         Returns:
             None
         """
-        self.molecules = sorted(self.molecules, key=lambda x: x.type)
+        # Only the few distinct types are sorted; molecules keep their relative order
+        # within a type, as with a stable sort.
+        molecules_by_type: Dict[str, List[Molecule]] = {}
+        for molecule in self.molecules:
+            molecules_by_type.setdefault(molecule.type, []).append(molecule)
+        self.molecules = [
+            molecule
+            for molecule_type in sorted(molecules_by_type)
+            for molecule in molecules_by_type[molecule_type]
+        ]
 
     def update_mixture_information(self) -> None:
         """
-        Update mixture information including weight, number of molecules, molecular weight,
-        and simulation box dimensions.
+        Update mixture information including molecular weight and simulation box
+        dimensions. The weight and number of molecules are accumulated as the molecules
+        are populated.
 
         Returns:
             None
         """
-        # Update weight and number of molecules
-        for molecule in self.molecules:
-            self.weight += molecule.mw_gmol
-            self.nbr_of_mols += 1
-
         # Calculate molecular weight
         self.mw_gmol = self.weight / self.nbr_of_mols
 
@@ -171,7 +252,7 @@ class Mixture:
         )
 
         # Shifting Sobol points in the z dimension to have offsets offset/2 units long:
-        self.sobol_z = [i + inputs.layer_offset / 2 for i in self.sobol_z]
+        self.sobol_z += inputs.layer_offset / 2
 
     def translate_molecules_to_sobol_positions(self) -> None:
         """
@@ -179,17 +260,15 @@ class Mixture:
 
         This function iterates through the molecules and translates each molecule to
         a new position specified by Sobol sequence coordinates (sobol_x, sobol_y, sobol_z).
+        Only the cached coordinates of the molecules are moved; the RDKit conformers are
+        updated when the molecules are exported.
 
         Returns:
             None
         """
-        for index, molecule in enumerate(self.molecules):
-            backend_static_functions.translate_molecule(
-                mol_obj=molecule.mol_obj,
-                x=self.sobol_x[index],
-                y=self.sobol_y[index],
-                z=self.sobol_z[index],
-            )
+        offsets = np.column_stack((self.sobol_x, self.sobol_y, self.sobol_z))
+        for molecule, (x, y, z) in zip(self.molecules, offsets):
+            molecule.translate_molecule(x=x, y=y, z=z)
 
     def calculate_lj_potential_energy(self) -> None:
         """
@@ -202,23 +281,36 @@ class Mixture:
         Returns:
             None
         """
-        # Extracting the atoms' positions:
-        (
-            atoms_pos_x,
-            atoms_pos_y,
-            atoms_pos_z,
-        ) = backend_static_functions.extract_atom_positions_from_mol_obj_list(
-            mol_obj_list=[molecule.mol_obj for molecule in self.molecules]
+        # Gathering the atoms' positions (cached per molecule) into a single buffer:
+        self.atom_positions = np.concatenate(
+            [molecule.get_positions() for molecule in self.molecules],
+            out=self.atom_positions,
         )
 
-        # Calculate Lennard-Jones potential energy:
-        self.potential_energy = backend_static_functions.compute_total_lj_potential(
-            x=np.array(atoms_pos_x),
-            y=np.array(atoms_pos_y),
-            z=np.array(atoms_pos_z),
-            box_dimensions=np.array(self.box_dims),
-            rcut=10,
-        )
+        # Calculate Lennard-Jones potential energy. A linked-cell list is used when the
+        # box spans at least three cutoffs in every dimension; otherwise all pairs are
+        # visited, in single precision for large systems, since the energy is only
+        # compared against a coarse acceptance limit:
+        box_dimensions = np.array(self.box_dims, dtype=np.float64)
+        if backend_static_functions.count_lj_cells(box_dimensions, _LJ_RCUT).min() >= 3:
+            self.potential_energy = (
+                backend_static_functions.compute_total_lj_potential_cell_list(
+                    xyz=self.atom_positions,
+                    box_dimensions=box_dimensions,
+                    rcut=_LJ_RCUT,
+                )
+            )
+        elif len(self.atom_positions) >= _LJ_FP32_MIN_ATOMS:
+            x, y, z = np.ascontiguousarray(self.atom_positions.T, dtype=np.float32)
+            self.potential_energy = (
+                backend_static_functions.compute_total_lj_potential_fp32(
+                    x=x, y=y, z=z, box_dimensions=box_dimensions, rcut=_LJ_RCUT
+                )
+            )
+        else:
+            self.potential_energy = backend_static_functions.compute_total_lj_potential(
+                xyz=self.atom_positions, box_dimensions=box_dimensions, rcut=_LJ_RCUT
+            )
 
         # Determine if the potential energy is accepted based on a limit:
         self.accepted = self.potential_energy < inputs.potential_energy_limit
@@ -236,18 +328,24 @@ class Mixture:
         Returns:
             None
         """
-        for molecule in mixture.molecules:
+        export_dir = importlib.resources.files("scymol").joinpath(
+            "output",
+            f"{job_id}",
+            f"mixture_{nbr_of_mixtures_accepted}",
+            "all",
+        )
+
+        def export_molecule(molecule: Molecule) -> None:
             # Define the filepath for the Mol file
-            filepath = importlib.resources.files("scymol").joinpath(
-                "output",
-                f"{job_id}",
-                f"mixture_{nbr_of_mixtures_accepted}",
-                "all",
-                f"{molecule.name}.mol",
-            )
+            filepath = export_dir.joinpath(f"{molecule.name}.mol")
 
             # Convert the molecule to Mol file format and save it
+            molecule.update_conformer()
             Chem.MolToMolFile(molecule.mol_obj, filepath)
 
             # Call a function to fix the Mol file (assuming backend_static_functions is a valid module)
             backend_static_functions.fix_mol_file(file=filepath)
+
+        # The files are independent, so their disk I/O is overlapped in threads
+        with ThreadPoolExecutor(max_workers=_EXPORT_WORKERS) as executor:
+            list(executor.map(export_molecule, mixture.molecules))
@@ -1,17 +1,24 @@
+import os
 from collections import defaultdict
-from typing import Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
 import numpy as np
 from rdkit import Chem
 from rdkit.Chem import rdMolTransforms, AllChem
-from rdkit.Geometry import Point3D
 from typing import Type
 
 from scipy.stats import special_ortho_group
 
+# Whether this RDKit version reads all conformer coordinates in one call
+_HAS_GET_POSITIONS = hasattr(Chem.Conformer, "GetPositions")
+_IDENTITY_TRANSFORM = np.identity(4)
+
 
 class Molecule:
     global_counter: int = 0
     molecule_counter = defaultdict(lambda: 0)
+    # Molecules with their lowest-energy conformer, by SMILES (never modified)
+    _smiles_cache: Dict[str, Chem.Mol] = {}
 
     def __init__(self, name: str, info: Dict[str, Any]) -> None:
         """Initialize a new Molecule instance.
@@ -29,7 +36,8 @@ class Molecule:
             It increments the global counter and updates the molecule-specific
             counter based on the provided name. It also calculates molecular
             properties such as the molecule's ID, name, SMILES representation,
-            and molecular weight in g/mol.
+            and molecular weight in g/mol. The conformer is generated once per
+            SMILES and process; later instances start from a copy of it.
 
         """
         Molecule.global_counter += 1
@@ -39,9 +47,119 @@ class Molecule:
         self.name: str = f"{self.id[0]}_{self.type}_{self.id[1]}"
         self.smiles: str = info["smiles"]
         self.rotate: str = info["rotate"]
-        self.mol_obj = self._smiles_to_obj_mol(self.smiles)
-        self.generate_lowest_energy_conformer()
+        cached_mol = Molecule._smiles_cache.get(self.smiles)
+        if cached_mol is None:
+            cached_mol = Molecule._smiles_cache[self.smiles] = self._generate_mol(
+                self.smiles
+            )
+        # The conformer generation is seeded, so it would yield the same result again
+        self.mol_obj = Chem.Mol(cached_mol)
         self.mw_gmol: float = Chem.rdMolDescriptors.CalcExactMolWt(self.mol_obj)
+        self._positions: Optional[np.ndarray] = None
+        self._pending_transform: np.ndarray = np.identity(4)
+
+    def get_positions(self) -> np.ndarray:
+        """Return the atomic coordinates of the molecule's conformer.
+
+        Returns:
+            np.ndarray: An (n_atoms, 3) array with the x, y and z coordinates.
+
+        Note:
+            The coordinates are read from RDKit once, with Conformer.GetPositions
+            where available, and cached. The methods of
+            this class that move the molecule keep the cache up to date, so the
+            conformer must not be modified directly. Moves are applied to the
+            cache only; call update_conformer() before using mol_obj's
+            coordinates.
+
+        """
+        if self._positions is None:
+            conf = self.mol_obj.GetConformer()
+            if _HAS_GET_POSITIONS:
+                self._positions = conf.GetPositions()
+            else:
+                self._positions = np.array(
+                    [list(conf.GetAtomPosition(i)) for i in range(conf.GetNumAtoms())]
+                )
+        return self._positions
+
+    def clone(self) -> "Molecule":
+        """Return a copy of the molecule.
+
+        Returns:
+            Molecule: A new instance with the same attributes and its own copy of the
+            RDKit molecule object.
+
+        Note:
+            The attributes are copied shallowly, and the RDKit molecule is copied with
+            its C++ copy constructor. This is much cheaper than copy.deepcopy. The
+            cached coordinates are shared until either molecule is moved, since the
+            methods that move a molecule replace the cache instead of modifying it.
+
+        """
+        new = object.__new__(Molecule)
+        new.__dict__ = self.__dict__.copy()
+        new.mol_obj = Chem.Mol(self.mol_obj)
+        return new
+
+    def update_conformer(self) -> None:
+        """Apply the pending moves to the RDKit conformer.
+
+        Returns:
+            None
+
+        Note:
+            The methods that move the molecule only move the cached coordinates
+            and compose their move into a pending 4x4 affine transform. This
+            method writes it to the conformer in a single TransformConformer
+            call, and must be called before mol_obj is exported (e.g., to a
+            Mol file).
+
+        """
+        if not np.array_equal(self._pending_transform, _IDENTITY_TRANSFORM):
+            rdMolTransforms.TransformConformer(
+                self.mol_obj.GetConformer(), self._pending_transform
+            )
+            self._pending_transform = np.identity(4)
+
+    def _transform(self, transform: np.ndarray) -> None:
+        """Apply a 4x4 affine transform to the coordinate cache.
+
+        Args:
+            transform (np.ndarray): The (4, 4) homogeneous transform, acting on
+                column vectors.
+
+        Returns:
+            None
+
+        Note:
+            The transform is also composed into the pending transform of the
+            conformer, which is applied by update_conformer().
+
+        """
+        self._positions = (
+            self.get_positions() @ transform[:3, :3].T + transform[:3, 3]
+        )
+        self._pending_transform = transform @ self._pending_transform
+
+    @staticmethod
+    def _rotation_about(center: np.ndarray, rotation: np.ndarray) -> np.ndarray:
+        """Build the 4x4 affine transform of a rotation about a point.
+
+        Args:
+            center (np.ndarray): The point the rotation is about.
+            rotation (np.ndarray): A (3, 3) rotation matrix, applied to row
+                vectors (coordinates @ rotation).
+
+        Returns:
+            np.ndarray: The (4, 4) transform that translates center to the
+            origin, rotates, and translates back, as a single matrix.
+
+        """
+        transform = np.identity(4)
+        transform[:3, :3] = rotation.T
+        transform[:3, 3] = center - rotation.T @ center
+        return transform
 
     def update_name_and_id(self) -> None:
         """Update molecule name and ID.
@@ -68,18 +186,12 @@ class Molecule:
             None
 
         Note:
-            This method calculates the centroid of the molecule's conformer
+            This method calculates the centroid of the molecule's coordinates
             and then translates all atom positions to center the molecule
-            at the origin (0, 0, 0) in 3D space.
+            at the origin (0, 0, 0) in 3D space, as a single array operation.
 
         """
-        conf = self.mol_obj.GetConformer()
-        center = rdMolTransforms.ComputeCentroid(conf)
-        for i in range(conf.GetNumAtoms()):
-            pos = conf.GetAtomPosition(i)
-            conf.SetAtomPosition(
-                i, (pos.x - center.x, pos.y - center.y, pos.z - center.z)
-            )
+        self.translate_molecule(*-self.get_positions().mean(axis=0))
 
     def translate_molecule(self, x: float, y: float, z: float) -> None:
         """Translate the molecule in 3D space.
@@ -94,16 +206,16 @@ class Molecule:
 
         Note:
             This method translates the molecule in 3D space by the specified
-            distances along the x, y, and z axes. It updates the positions of
-            all atoms in the molecule accordingly.
+            distances along the x, y, and z axes. It updates the cached
+            positions of all atoms in the molecule accordingly; the RDKit
+            conformer is only updated by update_conformer().
 
         """
-        conformer = self.mol_obj.GetConformer()
-        num_atoms = self.mol_obj.GetNumAtoms()
-        for i in range(num_atoms):
-            position = conformer.GetAtomPosition(i)
-            new_position = Point3D(position.x + x, position.y + y, position.z + z)
-            conformer.SetAtomPosition(i, new_position)
+        offset = np.array((x, y, z), dtype=np.float64)
+        self._positions = self.get_positions() + offset
+        # A translation only adds to the translation column of the transform
+        self._pending_transform = self._pending_transform.copy()
+        self._pending_transform[:3, 3] += offset
 
     def randomly_rotate_mol(self) -> Any:
         """Randomly rotate the molecule object about its center.
@@ -113,104 +225,108 @@ class Molecule:
 
         Note:
             This method performs a random rotation of the molecule in 3D space.
-            It first calculates the center of the molecule and translates it to
-            the origin. Then, it generates random rotation angles around the x, y,
-            and z axes and creates rotation matrices for each axis. The molecule's
-            coordinates are rotated accordingly, and it is translated back to its
-            original center.
+            It draws a rotation matrix uniformly from SO(3) and composes the
+            translation of the molecule's center to the origin, the rotation and
+            the translation back into one 4x4 affine transform, which is applied
+            to the molecule's coordinates in a single matrix product.
 
         """
-        conf = self.mol_obj.GetConformer()
-
-        # Create an array of the coordinates
-        coordinates = np.array(
-            [list(conf.GetAtomPosition(i)) for i in range(conf.GetNumAtoms())]
-        )
-
         # Calculate the center of the molecule
-        center = np.mean(coordinates, axis=0)
-
-        # Translate the molecule so that the center is at the origin
-        translated_coordinates = coordinates - center
-
-        # Generate random angles
-        pi = np.pi
-        angle_x = np.random.uniform(-pi, pi)
-        angle_y = np.random.uniform(-pi, pi)
-        angle_z = np.random.uniform(-pi, pi)
-
-        # Create rotation matrices
-        rot_x = np.array(
-            [
-                [1, 0, 0],
-                [0, np.cos(angle_x), -np.sin(angle_x)],
-                [0, np.sin(angle_x), np.cos(angle_x)],
-            ]
-        )
+        center = np.mean(self.get_positions(), axis=0)
 
-        rot_y = np.array(
-            [
-                [np.cos(angle_y), 0, np.sin(angle_y)],
-                [0, 1, 0],
-                [-np.sin(angle_y), 0, np.cos(angle_y)],
-            ]
-        )
+        # Draw a uniformly distributed random rotation matrix
+        rotation = special_ortho_group.rvs(3)
 
-        rot_z = np.array(
-            [
-                [np.cos(angle_z), -np.sin(angle_z), 0],
-                [np.sin(angle_z), np.cos(angle_z), 0],
-                [0, 0, 1],
-            ]
-        )
+        # Rotate the molecule about its center
+        self._transform(self._rotation_about(center, rotation))
+
+    @classmethod
+    def batch_randomly_rotate(
+        cls: Type["Molecule"], molecules: List["Molecule"]
+    ) -> None:
+        """Randomly rotate several molecule objects about their centers.
 
-        # Perform the rotations
-        rotated_coordinates = np.dot(translated_coordinates, rot_x)
-        rotated_coordinates = np.dot(rotated_coordinates, rot_y)
-        rotated_coordinates = np.dot(rotated_coordinates, rot_z)
+        Args:
+            molecules (List[Molecule]): The molecules to rotate.
 
-        # Translate the molecule back to its original center
-        final_coordinates = rotated_coordinates + center
+        Returns:
+            None
 
-        # Update the molecule's particle coordinates
-        for i, coord in enumerate(final_coordinates):
-            conf.SetAtomPosition(i, tuple(coord))
+        Note:
+            This is the batched form of randomly_rotate_mol(): the rotation
+            matrices of all the molecules are drawn from SO(3) in a single
+            call, as an (M, 3, 3) stack, and each molecule is then rotated
+            about its center with its own matrix.
 
-    def generate_lowest_energy_conformer(self, num_conformers=10, prune_rms_thresh=0.25, max_iterations=5000):
         """
-        Generate multiple diverse conformers, optimize their geometry, and find the lowest-energy one.
+        if not molecules:
+            return
+
+        # Draw one uniformly distributed rotation matrix per molecule
+        rotations = special_ortho_group.rvs(3, size=len(molecules)).reshape(-1, 3, 3)
+
+        for molecule, rotation in zip(molecules, rotations):
+            center = np.mean(molecule.get_positions(), axis=0)
+            molecule._transform(cls._rotation_about(center, rotation))
+
+    def generate_lowest_energy_conformer(
+        self,
+        num_conformers=10,
+        prune_rms_thresh=0.25,
+        max_iterations=5000,
+        optimize=False,
+        num_threads=0,
+    ) -> None:
+        """
+        Generate multiple diverse conformers, rank them by energy, and keep the lowest-energy one.
 
         Parameters:
-        - smiles (str): SMILES string of the molecule.
         - num_conformers (int): Number of conformers to generate.
         - prune_rms_thresh (float): RMSD threshold for pruning similar conformers.
         - max_iterations (int): Maximum iterations for MMFF optimization.
+        - optimize (bool): If True, optimize the conformers with MMFF before ranking them.
+          Otherwise, the ETKDGv3 conformers are ranked by their MMFF single-point energy.
+        - num_threads (int): Number of threads used by RDKit for the embedding and the
+          optimization. 0 uses one thread per core.
 
         Returns:
-        - lowest_energy_mol (Mol): Molecule with the lowest-energy conformation.
-        - energies (list): List of (conformer_id, energy) tuples.
+        - None. Only the lowest-energy conformer is kept in self.mol_obj.
         """
-        # Embed multiple conformers with diversity control
-        conformer_ids = AllChem.EmbedMultipleConfs(
-            self.mol_obj,
-            numConfs=num_conformers,
-            randomSeed=42,
-            pruneRmsThresh=prune_rms_thresh
+        # Embed multiple conformers with ETKDGv3 and diversity control
+        params = AllChem.ETKDGv3()
+        params.randomSeed = 42
+        params.pruneRmsThresh = prune_rms_thresh
+        params.numThreads = num_threads
+        conformer_ids = list(
+            AllChem.EmbedMultipleConfs(self.mol_obj, numConfs=num_conformers, params=params)
         )
 
-        # Initialize MMFF properties
-        mmff_props = AllChem.MMFFGetMoleculeProperties(self.mol_obj)
         energies = []
-
-        for conf_id in conformer_ids:
-            try:
-                # Optimize each conformer using MMFF and calculate its energy
-                ff = AllChem.MMFFGetMoleculeForceField(self.mol_obj, mmff_props, confId=conf_id)
-                ff.Minimize(maxIts=max_iterations, forceTol=0.0001, energyTol=1e-6)
-                energy = ff.CalcEnergy()
+        if optimize:
+            # Optimize all conformers using MMFF in a single call, which returns a
+            # (not_converged, energy) pair per conformer
+            results = AllChem.MMFFOptimizeMoleculeConfs(
+                self.mol_obj,
+                numThreads=num_threads,
+                maxIters=max_iterations,
+                mmffVariant="MMFF94",
+            )
+            for conf_id, (not_converged, energy) in zip(conformer_ids, results):
+                if not_converged == -1:
+                    raise RuntimeError(
+                        f"Failed to process Conformer ID {conf_id}: MMFF force field could not be set up"
+                    )
                 energies.append((conf_id, energy))
-            except Exception as e:
-                raise RuntimeError(f"Failed to process Conformer ID {conf_id}: {e}")
+        else:
+            # Rank the conformers by their MMFF energy, without minimizing them
+            mmff_props = AllChem.MMFFGetMoleculeProperties(self.mol_obj)
+            if mmff_props is None:
+                raise RuntimeError("MMFF properties could not be set up for the molecule!")
+            for conf_id in conformer_ids:
+                ff = AllChem.MMFFGetMoleculeForceField(
+                    self.mol_obj, mmff_props, confId=conf_id
+                )
+                energies.append((conf_id, ff.CalcEnergy()))
 
         if not energies:
             raise RuntimeError("No valid conformers generated or optimized!")
@@ -218,10 +334,10 @@ class Molecule:
         # Find the lowest-energy conformer
         lowest_energy_id, lowest_energy = min(energies, key=lambda x: x[1])
 
-        # Return molecule with the lowest-energy conformer highlighted
-        lowest_energy_mol = Chem.Mol(self.mol_obj)
-
-        return lowest_energy_mol
+        # Keep only the lowest-energy conformer, so it is the one used from now on
+        for conf_id in conformer_ids:
+            if conf_id != lowest_energy_id:
+                self.mol_obj.RemoveConformer(conf_id)
 
     @classmethod
     def reset_counters(cls: Type["Molecule"]) -> None:
@@ -229,6 +345,87 @@ class Molecule:
         cls.global_counter = 0
         cls.molecule_counter = defaultdict(lambda: 0)
 
+    @classmethod
+    def prepare_conformers(cls: Type["Molecule"], smiles_list: Iterable[str]) -> None:
+        """Generate the conformers of several SMILES in parallel processes.
+
+        Args:
+            smiles_list (Iterable[str]): The SMILES whose conformers are needed.
+
+        Returns:
+            None
+
+        Note:
+            The molecules are generated in a process pool, sent back as RDKit
+            binary blobs and stored in the SMILES cache, so the Molecule
+            instances created afterwards in this process start from them. Other
+            processes do not share the cache, whatever the multiprocessing start
+            method; hand it over with export_conformers() and
+            load_conformers(). A single missing SMILES is generated in this
+            process, without a pool.
+
+        """
+        missing = [
+            smiles
+            for smiles in dict.fromkeys(smiles_list)
+            if smiles not in cls._smiles_cache
+        ]
+        if not missing:
+            return
+        if len(missing) == 1:
+            cls._smiles_cache[missing[0]] = cls._generate_mol(missing[0])
+            return
+        with ProcessPoolExecutor(
+            max_workers=min(len(missing), os.cpu_count() or 1)
+        ) as executor:
+            for smiles, mol_binary in zip(missing, executor.map(_prepare_mol, missing)):
+                cls._smiles_cache[smiles] = Chem.Mol(mol_binary)
+
+    @classmethod
+    def export_conformers(cls: Type["Molecule"]) -> Dict[str, bytes]:
+        """Return the cached molecules as RDKit binary blobs, by SMILES.
+
+        Returns:
+            Dict[str, bytes]: The blobs, to be passed to load_conformers() in
+                another process.
+
+        """
+        return {smiles: mol.ToBinary() for smiles, mol in cls._smiles_cache.items()}
+
+    @classmethod
+    def load_conformers(cls: Type["Molecule"], mol_binaries: Dict[str, bytes]) -> None:
+        """Fill the SMILES cache with molecules exported by export_conformers().
+
+        Args:
+            mol_binaries (Dict[str, bytes]): RDKit binary blobs, by SMILES.
+
+        Returns:
+            None
+
+        """
+        for smiles, mol_binary in mol_binaries.items():
+            cls._smiles_cache[smiles] = Chem.Mol(mol_binary)
+
+    @classmethod
+    def _generate_mol(
+        cls: Type["Molecule"], smiles: str, num_threads: int = 0
+    ) -> Chem.Mol:
+        """Convert SMILES to a molecule object with its lowest-energy conformer.
+
+        Args:
+            smiles (str): A SMILES string representing the molecule.
+            num_threads (int): Number of threads used by RDKit to generate the
+                conformer. 0 uses one thread per core.
+
+        Returns:
+            Chem.Mol: The molecule object, with hydrogens and a single conformer.
+
+        """
+        molecule = object.__new__(cls)
+        molecule.mol_obj = cls._smiles_to_obj_mol(smiles)
+        molecule.generate_lowest_energy_conformer(num_threads=num_threads)
+        return molecule.mol_obj
+
     @staticmethod
     def _smiles_to_obj_mol(smiles_string: str) -> Chem.Mol:
         """Convert SMILES to a molecule object.
@@ -256,3 +453,19 @@ class Molecule:
         mol_with_h = Chem.AddHs(mol)
 
         return mol_with_h
+
+
+def _prepare_mol(smiles: str) -> bytes:
+    """Generate the molecule object of a SMILES in a worker process.
+
+    The pool already runs up to one worker process per core, so RDKit is limited to a
+    single thread in each of them.
+
+    Args:
+        smiles (str): A SMILES string representing the molecule.
+
+    Returns:
+        bytes: The molecule with its lowest-energy conformer, as an RDKit binary blob.
+
+    """
+    return Molecule._generate_mol(smiles, num_threads=1).ToBinary()
@@ -1,65 +1,64 @@
-import importlib
-import os
-from pathlib import Path
-
-from pysimm import lmps
+import numpy as np
 from rdkit import Chem
 import pysimm
 import scymol.backend.backend_static_functions as backend_static_functions
-from typing import Optional
+from typing import Dict, Optional
 
 
 class PysimmSystem:
-    def __init__(self, mixture, working_dir: str) -> None:
+    def __init__(self, mixture) -> None:
         """
         Initialize a new pysimm instance.
 
         Args:
             mixture: The mixture to be used in the pysimm instance.
-            working_dir (str): The working directory where temporary files will be stored.
         """
         self.pysimm_system: Optional[object] = None
         self._mixture = mixture
         self._forcefield = mixture.forcefield
         self._charges = mixture.charges
-        self._temp_mol_file = (
-            Path(importlib.resources.files("scymol")) / working_dir / "temp.mol"
-        )
         self.current_mol: Optional[object] = None
         self.current_mol_index: int = 0
-        self._parent_molecule: Optional[object] = None
+        # Force-field-assigned parent molecule of every type loaded so far
+        self._parents: Dict[str, object] = {}
 
-    def _write_temp_mol(self, index: Optional[int] = None) -> None:
+    def _get_mol_block(self, index: Optional[int] = None) -> str:
         """
-        Write the current molecule to a temporary MOL file.
+        Return the (fixed) MOL file contents of the current molecule.
 
         Args:
             index (Optional[int]): The index of the current molecule in the mixture (default is None).
+
+        Returns:
+            str: The contents of the MOL file, ready to be read by pysimm.
         """
         if index is None:
             index = self.current_mol_index
-        self._write_temp_mol_file(
-            self._mixture.molecules[index].mol_obj, self._temp_mol_file
-        )
+        molecule = self._mixture.molecules[index]
+        molecule.update_conformer()
+        return self._mol_obj_to_mol_block(molecule.mol_obj)
 
     def initialize_system(self) -> None:
         """
         Create a new pysimm system.
 
         This method performs the following steps:
-        1. Writes the current molecule to a temporary MOL file.
-        2. Loads the molecule from the MOL file and applies the specified forcefield.
+        1. Converts the current molecule to the contents of a MOL file.
+        2. Loads the molecule from the MOL contents and applies the specified forcefield.
         3. Copies the loaded molecule as the current molecule.
-        4. Copies the current molecule as the parent molecule.
+        4. Keeps the current molecule as the parent molecule of its type.
         """
-        self._write_temp_mol()
         self.pysimm_system = self._load_molecule(
-            mol_file=self._temp_mol_file,
+            mol_file=self._get_mol_block(),
             forcefield=self._forcefield,
             charges=self._charges,
         )
         self.current_mol = self.pysimm_system.copy()
-        self._parent_molecule = self.current_mol.copy()
+        # The first molecule is already in the system and current_mol is only replaced
+        # (never modified or added) afterwards, so it can serve as the parent directly.
+        self._parents[self._mixture.molecules[self.current_mol_index].type] = (
+            self.current_mol
+        )
 
     def load_current_molecule(self, index: int) -> None:
         """
@@ -69,36 +68,44 @@ class PysimmSystem:
             index (int): The index of the molecule to load.
 
         This method performs the following steps:
-        1. Writes the molecule at the specified index to a temporary MOL file.
-        2. Compares the types of the current molecule and the new molecule.
-        3. If the types match, it copies positions from the parent molecule to the current molecule.
-        4. If the types do not match, it loads the new molecule and applies the forcefield.
-        5. Updates the current molecule and current molecule index.
-        """
-        self._write_temp_mol(index)
-        molecule_type_current = self._mixture.molecules[self.current_mol_index].type
-        molecule_type_new = self._mixture.molecules[index].type
-
-        if molecule_type_new == molecule_type_current:
-            # Molecule is a duplicate. Force field types and charges are obtained from the parent molecule.
+        1. Looks up the parent molecule of the new molecule's type.
+        2. If there is one, it copies the new molecule's coordinates to a copy of the parent molecule.
+        3. Otherwise, it converts the new molecule to the contents of a MOL file, loads it, applies
+           the forcefield and keeps it as the parent of its type.
+        4. Updates the current molecule and current molecule index.
+        """
+        molecule = self._mixture.molecules[index]
+        parent = self._parents.get(molecule.type)
+
+        if parent is not None:
+            # Molecule is a duplicate. Force field types and charges are obtained from the parent
+            # molecule, and only the coordinates are taken from the molecule.
             self.current_mol = self._apply_positions(
-                self._parent_molecule.copy(),
-                self._load_molecule(
-                    mol_file=self._temp_mol_file,
-                    forcefield=None,
-                    charges=None,
-                ),
+                parent.copy(), self._load_positions_only(index)
             )
         else:
             self.current_mol = self._load_molecule(
-                mol_file=self._temp_mol_file,
+                mol_file=self._get_mol_block(index),
                 forcefield=self._forcefield,
                 charges=self._charges,
             )
-            self._parent_molecule = self.current_mol.copy()
+            self._parents[molecule.type] = self.current_mol.copy()
 
         self.current_mol_index = index
 
+    def _load_positions_only(self, index: int) -> np.ndarray:
+        """
+        Return the coordinates of the molecule of the specified index, without writing or parsing a MOL file.
+
+        Args:
+            index (int): The index of the molecule in the mixture.
+
+        Returns:
+            np.ndarray: An (n_atoms, 3) array with the coordinates, rounded to the 4 decimals of a MOL
+            file, as if the molecule had been loaded from one.
+        """
+        return np.round(self._mixture.molecules[index].get_positions(), 4)
+
     def add_current_molecule_to_system(self) -> None:
         """Add current molecule to the system."""
         self.pysimm_system.add(self.current_mol, change_dim=True)
@@ -123,32 +130,31 @@ class PysimmSystem:
             self.load_current_molecule(index=index)
             self.add_current_molecule_to_system()
 
-    def generate_lammps_inputs(self) -> None:
+    def generate_lammps_inputs(self, data_file: str) -> None:
         """
         Generate LAMMPS inputs for simulation.
 
-        This method creates a LAMMPS simulation object using the pysimm system,
-        sets the name of the simulation, and attempts to run the simulation,
-        saving the input files.
+        This method writes the pysimm system to a LAMMPS data file. This is the same
+        file that running a pysimm simulation writes as 'temp.lmps' in the current
+        working directory, but the path is given explicitly.
+
+        Args:
+            data_file (str): The path of the LAMMPS data file to write.
         """
-        # Generate LAMMPS simulation
-        simulation = lmps.Simulation(self.pysimm_system, name="my_simulation")
-        try:
-            simulation.run(save_input=True)
-        except TypeError as e:
-            print(f"Warning: TypeError {e} caught and skipped.")
+        self.pysimm_system.write_lammps(data_file)
 
     @staticmethod
-    def _write_temp_mol_file(mol_obj, temp_mol_file: str) -> None:
+    def _mol_obj_to_mol_block(mol_obj) -> str:
         """
-        Write the molecule object to a temporary MOL file.
+        Convert the molecule object to the contents of a MOL file, kept in memory.
 
         Args:
-            mol_obj: The molecule object to be written.
-            temp_mol_file (str): The path to the temporary MOL file.
+            mol_obj: The molecule object to be converted.
+
+        Returns:
+            str: The fixed MOL file contents.
         """
-        Chem.MolToMolFile(mol_obj, temp_mol_file)
-        backend_static_functions.fix_mol_file(file=temp_mol_file)
+        return backend_static_functions.fix_mol_block(Chem.MolToMolBlock(mol_obj))
 
     @staticmethod
     def _load_molecule(
@@ -161,7 +167,7 @@ class PysimmSystem:
         intensive. If the molecule is a duplicate, force field types and charges are obtained from the parent molecule.
 
         Args:
-            mol_file (str): The path to the molecule file to be loaded.
+            mol_file (str): The path to the molecule file to be loaded, or its contents.
             forcefield (Optional[str]): The forcefield to apply to the loaded molecule (default is None).
 
         Returns:
@@ -173,17 +179,17 @@ class PysimmSystem:
         return mol_system
 
     @staticmethod
-    def _apply_positions(system1: object, system2: object) -> object:
+    def _apply_positions(system1: object, positions: np.ndarray) -> object:
         """
-        Copy positions from system2 to system1.
+        Copy positions to the particles of system1.
 
         Args:
             system1 (object): The destination system to which positions will be copied.
-            system2 (object): The source system from which positions will be copied.
+            positions (np.ndarray): An (n_particles, 3) array with the positions, in particle order.
 
         Returns:
             object: The modified destination system with updated positions.
         """
-        for p1, p2 in zip(system1.particles, system2.particles):
-            p1.x, p1.y, p1.z = p2.x, p2.y, p2.z
+        for particle, (x, y, z) in zip(system1.particles, positions.tolist()):
+            particle.x, particle.y, particle.z = x, y, z
         return system1
@@ -2,8 +2,9 @@ import os
 import signal
 import subprocess
 import sys
+import threading
 import time
-from typing import List, Optional
+from typing import IO, List, Optional, TextIO
 import psutil
 
 from PyQt5.QtCore import QThread, pyqtSignal
@@ -39,6 +40,13 @@ class BackendThread(QThread):
 
     @log_function_call
     def run(self) -> None:
+        """
+        Run the command and stream its output while it is running.
+
+        Every line written by the process to stdout or stderr is echoed to the console and
+        emitted through output_signal as soon as it arrives. The stderr lines are also
+        collected and sent with finished_signal when the process exits.
+        """
         stderr_output = []  # List to hold lines of stderr output
         try:
             # Configure subprocess arguments based on the operating system
@@ -47,27 +55,60 @@ class BackendThread(QThread):
             if sys.platform != "win32":
                 popen_args["preexec_fn"] = os.setsid
 
-            self.process = subprocess.Popen(self.command, **popen_args)
-
-            # For debugging, you might want to communicate directly
-            stdout, stderr = self.process.communicate()
-
-            if stderr:
-                stderr_output.append(stderr.decode("utf-8").strip())
-
-            retcode = self.process.poll()
-            if retcode is not None:
-                if stderr_output:  # If there are any stderr lines
-                    self.finished_signal.emit(retcode, "\n".join(stderr_output))
-                else:
-                    self.finished_signal.emit(
-                        retcode, "Process finished without errors."
-                    )
+            self.process = subprocess.Popen(
+                self.command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=1,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                **popen_args,
+            )
+
+            # stderr is read in a helper thread, so neither pipe can fill up and block
+            # the process while the other one is being read.
+            stderr_reader = threading.Thread(
+                target=self._stream_lines,
+                args=(self.process.stderr, sys.stderr, stderr_output),
+                daemon=True,
+            )
+            stderr_reader.start()
+            self._stream_lines(self.process.stdout, sys.stdout)
+            stderr_reader.join()
+
+            retcode = self.process.wait()
+            if stderr_output:  # If there are any stderr lines
+                self.finished_signal.emit(retcode, "".join(stderr_output).strip())
+            else:
+                self.finished_signal.emit(retcode, "Process finished without errors.")
 
         except Exception as e:
             print("Error during simulation:", e)
             self.finished_signal.emit(-1, "Process initialization error.")
 
+    def _stream_lines(
+        self, pipe: IO[str], console: Optional[TextIO], collected: Optional[List[str]] = None
+    ) -> None:
+        """
+        Forward the lines of a pipe of the process until it is closed.
+
+        :param pipe: The stdout or stderr pipe of the process.
+        :type pipe: IO[str]
+        :param console: The stream the lines are echoed to, if any.
+        :type console: Optional[TextIO]
+        :param collected: If given, the lines are also appended to this list.
+        :type collected: Optional[List[str]]
+        """
+        with pipe:
+            for line in pipe:
+                if console is not None:  # e.g., no console under pythonw
+                    console.write(line)
+                    console.flush()
+                self.output_signal.emit(line.rstrip("\n"))
+                if collected is not None:
+                    collected.append(line)
+
     @log_function_call
     def terminate_process(self) -> None:
         """
@@ -1,3 +1,5 @@
+import logging
+
 from PyQt5.QtWidgets import (
     QTextEdit,
     QComboBox,
@@ -6,13 +8,24 @@ from PyQt5.QtWidgets import (
     QDoubleSpinBox,
     QSpinBox,
 )
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Tuple
 
 from scymol.frontend.lammps_flowchart_window.lammps_flowchart_window import (
     LammpsFlowChartWindow,
 )
 from scymol.logging_functions import print_to_log, log_function_call
 
+# Input widget types and the (unbound) method returning their value.
+_WIDGET_EXTRACTORS: Dict[type, Callable[[Any], Any]] = {
+    QTextEdit: QTextEdit.toPlainText,
+    QComboBox: QComboBox.currentText,
+    QLineEdit: QLineEdit.text,
+    QCheckBox: QCheckBox.isChecked,
+    QDoubleSpinBox: QDoubleSpinBox.value,
+    QSpinBox: QSpinBox.value,
+}
+_INPUT_WIDGET_TYPES: Tuple[type, ...] = tuple(_WIDGET_EXTRACTORS)
+
 
 class DataExtractor:
     """
@@ -37,28 +50,53 @@ class DataExtractor:
 
     def extract_widget_data(self, parent: Any, data_dict: Dict[str, Any]) -> None:
         """
-        Recursively extract data from widgets and populate the data_dict.
+        Extract data from the input widgets below parent and populate the data_dict.
+
+        The widgets of each input type are found with Qt's (recursive) findChildren, and read
+        with the extractor of their type from _WIDGET_EXTRACTORS. Widgets
+        that are part of another input widget, such as the line edit inside a spin box, are
+        skipped.
 
         :param parent: The parent widget to start extracting data from.
         :type parent: Any
         :param data_dict: The dictionary to populate with extracted data.
         :type data_dict: Dict[str, Any]
         """
-        for child in parent.children():
-            if isinstance(child, QTextEdit):
-                data_dict[child.objectName()] = child.toPlainText()
-            elif isinstance(child, QComboBox):
-                data_dict[child.objectName()] = child.currentText()
-            elif isinstance(child, QLineEdit):
-                data_dict[child.objectName()] = child.text()
-            elif isinstance(child, QCheckBox):
-                data_dict[child.objectName()] = child.isChecked()
-            elif isinstance(child, QDoubleSpinBox):
-                data_dict[child.objectName()] = child.value()
-            elif isinstance(child, QSpinBox):
-                data_dict[child.objectName()] = child.value()
-            else:
-                self.extract_widget_data(child, data_dict)
+        data_dict.update(self._widget_data(parent))
+
+    def _widget_data(self, parent: Any) -> Dict[str, Any]:
+        """
+        Return the data of the input widgets below parent, as a new dictionary.
+
+        :param parent: The parent widget to start extracting data from.
+        :type parent: Any
+        :return: The values of the input widgets, by object name.
+        :rtype: Dict[str, Any]
+        """
+        return {
+            child.objectName(): extractor(child)
+            for widget_type, extractor in _WIDGET_EXTRACTORS.items()
+            for child in parent.findChildren(widget_type)
+            if not self._is_inside_input_widget(child, parent)
+        }
+
+    def _is_inside_input_widget(self, widget: Any, parent: Any) -> bool:
+        """
+        Check whether a widget is nested in another input widget below parent.
+
+        :param widget: The widget to check.
+        :type widget: Any
+        :param parent: The widget the extraction started from.
+        :type parent: Any
+        :return: True if one of the widget's ancestors below parent is an input widget.
+        :rtype: bool
+        """
+        ancestor = widget.parent()
+        while ancestor is not None and ancestor is not parent:
+            if isinstance(ancestor, _INPUT_WIDGET_TYPES):
+                return True
+            ancestor = ancestor.parent()
+        return False
 
     @log_function_call
     def get_simulation_inputs(self) -> Dict[str, Any]:
@@ -69,19 +107,22 @@ class DataExtractor:
         :rtype: Dict[str, Any]
         """
         self.data = {}
+        # The per-window diagnostics are only formatted if they would be logged
+        debug = logging.getLogger().isEnabledFor(logging.DEBUG)
 
         for fc_key, fc_window in self.stages_list.substage_windows.items():
-            fc_data_dict = {}
-            self.extract_widget_data(fc_window, fc_data_dict)
+            fc_data_dict = self._widget_data(fc_window)
 
-            print(f"Processing window {fc_key} / {fc_window}...")
+            if debug:
+                print_to_log(f"Processing window {fc_key} / {fc_window}...", "debug")
             if isinstance(fc_window, LammpsFlowChartWindow):
-                lammps_data_dict = {}
-                for lammps_key, lammps_window in fc_window.lammpsWindows.items():
-                    lammps_window_data_dict = {}
-                    self.extract_widget_data(lammps_window, lammps_window_data_dict)
-                    print("        >", lammps_window_data_dict)
-                    lammps_data_dict[lammps_key] = lammps_window_data_dict
+                lammps_data_dict = {
+                    lammps_key: self._widget_data(lammps_window)
+                    for lammps_key, lammps_window in fc_window.lammpsWindows.items()
+                }
+                if debug:
+                    for lammps_window_data_dict in lammps_data_dict.values():
+                        print_to_log(f"        > {lammps_window_data_dict}", "debug")
                 fc_data_dict["lammpsWindows"] = lammps_data_dict
             else:
                 raise Exception(
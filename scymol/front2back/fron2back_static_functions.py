@@ -3,7 +3,11 @@ import os
 import re
 from typing import Literal
 from PyQt5.QtWidgets import QMessageBox
-from scymol.logging_functions import print_to_log, log_function_call
+from scymol.logging_functions import (
+    print_to_log,
+    log_function_call,
+    log_hot_function_call,
+)
 
 
 @log_function_call
@@ -32,7 +36,7 @@ def find_files_with_keywords(
     return matched_files
 
 
-@log_function_call
+@log_hot_function_call
 def get_latest_mixture_folder_by_count(output_dir: str) -> str:
     """
     Returns the folder name with the highest integer 'n' by counting the directories in the output directory.
@@ -54,7 +58,7 @@ def get_latest_mixture_folder_by_count(output_dir: str) -> str:
     return latest_mixture_folder_name
 
 
-@log_function_call
+@log_hot_function_call
 def calculate_progress(
     directory: str, list_of_progress: list[list[int]]
 ) -> tuple[float, float]:
@@ -0,0 +1,202 @@
+import os
+from typing import Dict, List, Optional, Tuple
+
+from PyQt5.QtCore import QMutex, QThread, QWaitCondition, pyqtSignal
+import scymol.front2back.fron2back_static_functions as fron2back_static_functions
+from scymol.logging_functions import print_to_log
+
+
+class LogPoller(QThread):
+    """
+    A thread reading the log file and the progress of a running job.
+
+    The thread reads the job files whenever it is woken up (e.g., when they change), or at a
+    fixed interval otherwise, and reports what changed through its signals. All the file I/O
+    happens in this thread, so the GUI does not wait on the disk.
+
+    :ivar log_reset: Signal emitted when the log file was truncated or replaced, before it is read again from the start.
+    :vartype log_reset: pyqtSignal
+    :ivar log_delta: Signal emitted with the text appended to the log file since the last read.
+    :vartype log_delta: pyqtSignal
+    :ivar mixture_progress: Signal emitted with the number of the current mixture when it changes.
+    :vartype mixture_progress: pyqtSignal
+    :ivar lammps_progress: Signal emitted with the progress and the total number of substages of the current mixture.
+    :vartype lammps_progress: pyqtSignal
+    """
+
+    log_reset = pyqtSignal()
+    log_delta = pyqtSignal(str)
+    mixture_progress = pyqtSignal(int)
+    lammps_progress = pyqtSignal(int, int)
+
+    def __init__(
+        self,
+        job_dir: os.PathLike,
+        log_path: os.PathLike,
+        progress_list: List[List[int]],
+        interval_ms: int = 5000,
+    ) -> None:
+        """
+        Initialize a LogPoller instance.
+
+        :param job_dir: The output folder of the job.
+        :type job_dir: os.PathLike
+        :param log_path: The log file of the job.
+        :type log_path: os.PathLike
+        :param progress_list: List containing the substages of each stage.
+        :type progress_list: List[List[int]]
+        :param interval_ms: The time after which the files are read if the thread is not woken up.
+        :type interval_ms: int
+        """
+        super().__init__()
+        self.job_dir = job_dir
+        self.log_path = log_path
+        self.progress_list = progress_list
+        self.interval_ms = interval_ms
+        self.current_mixture: Optional[int] = None
+
+        # Offset up to which log.txt has been read, and the (device, inode) of the file read
+        self._log_off = 0
+        self._log_id: Optional[Tuple[int, int]] = None
+        # mtime_ns of the job folder at its last scan, and of each mixture folder
+        self._job_dir_mtime: Optional[int] = None
+        self._mixture_dir_mtimes: Dict[int, int] = {}
+
+        self._mutex = QMutex()
+        self._condition = QWaitCondition()
+        self._woken = False
+        self._stopping = False
+
+    def run(self) -> None:
+        """
+        Read the job files until the thread is stopped, waiting to be woken up in between.
+
+        The files are read one last time after the thread is asked to stop, so the end of the
+        log is not missed.
+        """
+        while True:
+            self.poll()
+            self._mutex.lock()
+            try:
+                if not self._woken and not self._stopping:
+                    self._condition.wait(self._mutex, self.interval_ms)
+                self._woken = False
+                stopping = self._stopping
+            finally:
+                self._mutex.unlock()
+            if stopping:
+                self.poll()
+                return
+
+    def wake(self) -> None:
+        """
+        Wake the thread up, so it reads the job files now.
+        """
+        self._mutex.lock()
+        self._woken = True
+        self._condition.wakeAll()
+        self._mutex.unlock()
+
+    def stop(self) -> None:
+        """
+        Stop the thread and wait for it to finish.
+        """
+        self._mutex.lock()
+        self._stopping = True
+        self._condition.wakeAll()
+        self._mutex.unlock()
+        self.wait()
+
+    def poll(self) -> None:
+        """
+        Read the new part of the log file and the progress of the job, and emit what changed.
+        """
+        self.read_log_file()
+        self.read_mixture_progress()
+        self.read_lammps_progress()
+
+    def read_log_file(self) -> None:
+        """
+        Read the new part of the log file and emit it.
+
+        Only the text written since the previous call is read. If the log file was truncated or
+        replaced (e.g., when the backend clears the job folder), it is read from the start.
+        """
+        try:
+            with open(
+                self.log_path,
+                "r",
+                encoding="utf-8",
+                errors="replace",
+                buffering=1 << 16,
+            ) as f:
+                stat = os.fstat(f.fileno())
+                log_id = (stat.st_dev, stat.st_ino)
+                if log_id != self._log_id or stat.st_size < self._log_off:
+                    self._log_id = log_id
+                    self._log_off = 0
+                    self.log_reset.emit()
+                f.seek(self._log_off)
+                chunk = f.read()
+                self._log_off = f.tell()
+
+            if chunk:
+                self.log_delta.emit(chunk)
+        except Exception as e:
+            print_to_log(f"Could not read the log file: {e}", "warning")
+
+    def read_mixture_progress(self) -> None:
+        """
+        Find the current mixture from the folders of the job, and emit it if it changed.
+
+        The job folder is only listed if its modification time changed since the last scan.
+        """
+        try:
+            job_dir_mtime = os.stat(self.job_dir).st_mtime_ns
+            if job_dir_mtime == self._job_dir_mtime:
+                # No folder was added to or removed from the job folder since the last scan
+                return
+            current_mixture = int(
+                fron2back_static_functions.get_latest_mixture_folder_by_count(
+                    output_dir=self.job_dir
+                ).split("_")[-1]
+            )
+            self._job_dir_mtime = job_dir_mtime
+        except FileNotFoundError:
+            # The job folder does not exist yet; it is scanned again on the next poll
+            return
+        except (OSError, ValueError) as e:
+            # E.g. a folder pending deletion while the job folder is cleared; the
+            # thread keeps running and the folder is scanned again on the next poll
+            print_to_log(f"Could not read the mixture progress: {e}", "warning")
+            return
+
+        if current_mixture != self.current_mixture:
+            self.current_mixture = current_mixture
+            self.mixture_progress.emit(current_mixture)
+
+    def read_lammps_progress(self) -> None:
+        """
+        Compute the progress of the LAMMPS stages of the current mixture, and emit it.
+
+        The mixture folder is only listed if its modification time changed since the last scan.
+        """
+        if self.current_mixture is None:
+            return
+        try:
+            mixture_dir = os.path.join(self.job_dir, f"mixture_{self.current_mixture}")
+            mixture_dir_mtime = os.stat(mixture_dir).st_mtime_ns
+            if self._mixture_dir_mtimes.get(self.current_mixture) == mixture_dir_mtime:
+                # No substage file was added to the mixture folder since the last scan
+                return
+            (
+                total_progress,
+                total_substages,
+            ) = fron2back_static_functions.calculate_progress(
+                directory=mixture_dir,
+                list_of_progress=self.progress_list,
+            )
+            self._mixture_dir_mtimes[self.current_mixture] = mixture_dir_mtime
+            self.lammps_progress.emit(total_progress, total_substages)
+        except Exception as e:
+            print_to_log(f"Could not read the LAMMPS progress: {e}", "warning")
@@ -3,19 +3,22 @@ import os
 import platform
 import subprocess
 
-from PyQt5 import uic
-from PyQt5.QtCore import QTimer
+from PyQt5.QtCore import QFileSystemWatcher, QTimer
 from PyQt5.QtGui import QTextCursor
 from PyQt5.QtWidgets import QDialog, QMessageBox
-import scymol.front2back.fron2back_static_functions as fron2back_static_functions
+from scymol.front2back.log_poller import LogPoller
 from scymol.logging_functions import print_to_log, log_function_call
+from scymol.frontend._ui_cache import load_ui
 
-# Resolve the full path to the .ui file
-ui_path = importlib.resources.files("scymol.frontend.uis").joinpath("process_dialog.ui")
+_SYSTEM = platform.system()
 
-# Open the .ui file as a file object and load it with uic.loadUiType
-with ui_path.open("r", encoding="utf8") as f:
-    Ui_ProcessDialog, _ = uic.loadUiType(f)
+# Text of the LAMMPS stage progress bar
+_SUBSTAGE_FMT = "Substage %d of %d (%.2f%%)"
+
+# Command opening a folder in the file explorer of this platform (None if unknown)
+_OPENER = {"Windows": ["explorer"], "Linux": ["xdg-open"], "Darwin": ["open"]}.get(
+    _SYSTEM
+)
 
 
 class RunningProcessDialog(QDialog):
@@ -25,6 +28,14 @@ class RunningProcessDialog(QDialog):
     This dialog provides a graphical interface to display the output log of a running backend process.
     """
 
+    # Final status label, by (job failed, user terminated the job)
+    _END_LABELS = {
+        (True, True): "User terminated the job.",
+        (True, False): "Job terminated due to an error with code {code}.",
+        (False, False): "Job terminated successfully.",
+        (False, True): "Job terminated successfully.",
+    }
+
     @log_function_call
     def __init__(
         self, parent: object, backend_thread: object, job_id: int, progress_list: list
@@ -43,96 +54,111 @@ class RunningProcessDialog(QDialog):
         self.files_list = None
         self.user_terminated = False
         self.job_id = job_id
+        # Paths of the job's output, resolved once
+        self._scymol_root = importlib.resources.files("scymol")
+        self._job_dir = self._scymol_root.joinpath("output", f"{job_id}")
+        self._log_path = self._job_dir.joinpath("log.txt")
+        self._mixture_dir = None
+        self._mixture_dir_of = None
         if not backend_thread:
             raise Exception(
                 "No thread connected to window. Please pass backend_thread argument."
             )
         super(RunningProcessDialog, self).__init__(parent)
         self.number_of_mixtures_needed = parent.spinbox_nbr_of_mixtures_needed.value()
+        # Text of the mixture progress bar, with the (fixed) number of mixtures filled in
+        self._mix_fmt = f"Mixture {{}} of {self.number_of_mixtures_needed}"
+        # Values last shown by the progress bars, so unchanged values are not set again
+        self._last_mix = -1
+        self._last_sub = (-1, -1)
         self.progress_list = progress_list
-        self.ui = Ui_ProcessDialog()
+        self.ui = load_ui("process_dialog.ui")()
         self.ui.setupUi(self)
+        # Only the last lines of the log are kept, so the displayed document stays bounded
+        self.ui.textedit_logout.document().setMaximumBlockCount(5000)
         self.backend_thread = backend_thread  # store a reference to the backend thread
 
-        # Timer to read log file
+        # The log file and the progress are read in a separate thread, which is woken up when
+        # the watched files and folders change. Changes are coalesced, so a burst of them
+        # triggers a single refresh.
+        self._log_poller = LogPoller(
+            job_dir=self._job_dir, log_path=self._log_path, progress_list=progress_list
+        )
+        self._watcher = QFileSystemWatcher(self)
+        self._update_watched_paths()
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(250)
+
+        # Timer as a fallback, in case a change notification is missed
         self.timer = QTimer()
-        self.timer.start(1000)  # Every 1000 milliseconds (1 second)
+        self.timer.start(5000)  # Every 5000 milliseconds (5 seconds)
         self.time_elapsed = 0
         self.ui.progressBar_2.setMaximum(self.number_of_mixtures_needed)
 
         # Connect signals
         self.connect_signals()
 
-    def update_mixture_progress_bar(self) -> None:
+    def update_mixture_progress_bar(self, current_mixture: int) -> None:
         """
         Update the progress bar based on the mixture processing stage.
 
         This method updates the progress bar to reflect the current stage of mixture processing,
-        waiting for the necessary folder to appear if it doesn't exist immediately.
+        and starts watching the folder of the new mixture.
 
+        :param current_mixture: The number of the mixture being processed.
+        :type current_mixture: int
         :return: None
         :rtype: None
         """
-        import time
-
-        # Poll for the latest mixture folder by count with a timeout.
-        timeout = 10  # Timeout in seconds
-        poll_interval = 0.1  # Polling interval in seconds
-        start_time = time.time()
-
-        while True:
-            try:
-                self.current_mixture = int(
-                    (
-                        fron2back_static_functions.get_latest_mixture_folder_by_count(
-                            output_dir=importlib.resources.files("scymol").joinpath(
-                                "output", f"{self.job_id}"
-                            )
-                        )
-                    ).split("_")[-1]
-                )
-                break  # Exit loop if successful
-            except FileNotFoundError:
-                if time.time() - start_time > timeout:
-                    raise TimeoutError("Timed out waiting for mixture folder.")
-                time.sleep(poll_interval)
+        if current_mixture == self._last_mix:
+            return
+        self._last_mix = current_mixture
+        self.current_mixture = current_mixture
 
         # Update the progress bar's value.
         self.ui.progressBar_2.setValue(self.current_mixture)
-        progress_text = (
-            f"Mixture {self.current_mixture} of {self.number_of_mixtures_needed}"
-        )
-        self.ui.progressBar_2.setFormat(progress_text)
+        self.ui.progressBar_2.setFormat(self._mix_fmt.format(self.current_mixture))
+        self._update_watched_paths()
+
+    def _current_mixture_dir(self) -> object:
+        """
+        Return the folder of the current mixture, building its path only when the mixture changes.
+
+        :return: The path of the current mixture's folder.
+        :rtype: object
+        """
+        if self._mixture_dir is None or self._mixture_dir_of != self.current_mixture:
+            self._mixture_dir = self._job_dir.joinpath(f"mixture_{self.current_mixture}")
+            self._mixture_dir_of = self.current_mixture
+        return self._mixture_dir
 
-    def update_lammps_stage_progress_bar(self) -> None:
+    def update_lammps_stage_progress_bar(
+        self, total_progress: int, total_substages: int
+    ) -> None:
         """
         Update the LAMMPS stage progress bar.
 
         This method updates the progress bar based on the progress of the LAMMPS simulation stages.
 
+        :param total_progress: The number of substages reached in the current mixture.
+        :type total_progress: int
+        :param total_substages: The total number of substages.
+        :type total_substages: int
         :return: None
         :rtype: None
         """
-
-        try:
-            (
-                total_progress,
-                total_substages,
-            ) = fron2back_static_functions.calculate_progress(
-                directory=importlib.resources.files("scymol").joinpath(
-                    "output", f"{self.job_id}", f"mixture_{self.current_mixture}"
-                ),
-                list_of_progress=self.progress_list,
-            )
-            progress_percentage = (total_progress / total_substages) * 100
-
-            self.ui.progressBar.setMaximum(total_substages)
-            self.ui.progressBar.setValue(total_progress)
-            self.ui.progressBar.setFormat(
-                f"Substage {total_progress} of {total_substages} ({progress_percentage:.2f}%)"
-            )
-        except Exception as e:
-            print(e)
+        key = (total_progress, total_substages)
+        if key == self._last_sub:
+            return
+        self._last_sub = key
+        progress_percentage = (total_progress / total_substages) * 100
+
+        self.ui.progressBar.setMaximum(total_substages)
+        self.ui.progressBar.setValue(total_progress)
+        self.ui.progressBar.setFormat(
+            _SUBSTAGE_FMT % (total_progress, total_substages, progress_percentage)
+        )
 
     @log_function_call
     def connect_signals(self) -> None:
@@ -147,10 +173,72 @@ class RunningProcessDialog(QDialog):
         self.ui.pushButton_2.clicked.connect(self.explore_output_folder)
 
         self.backend_thread.finished_signal.connect(self.display_simulation_errors)
-        self.timer.timeout.connect(self.read_log_file)
-        self.timer.timeout.connect(self.update_time_elapsed)
-        self.timer.timeout.connect(self.update_mixture_progress_bar)
-        self.timer.timeout.connect(self.update_lammps_stage_progress_bar)
+        self._watcher.fileChanged.connect(self._schedule_refresh)
+        self._watcher.directoryChanged.connect(self._schedule_refresh)
+        self._refresh_timer.timeout.connect(self.refresh)
+        self.timer.timeout.connect(self.refresh)
+
+        self._log_poller.log_reset.connect(self.ui.textedit_logout.clear)
+        self._log_poller.log_delta.connect(self.append_log)
+        self._log_poller.mixture_progress.connect(self.update_mixture_progress_bar)
+        self._log_poller.lammps_progress.connect(self.update_lammps_stage_progress_bar)
+        self.finished.connect(self._stop_polling)
+        self._log_poller.start()
+
+    def _update_watched_paths(self) -> None:
+        """
+        Watch the job folder, its log file and the folder of the current mixture.
+
+        Paths that do not exist yet are skipped, and are added by a later call once they do.
+        Qt also stops watching a file when it is replaced, so this is called after every change.
+
+        :return: None
+        :rtype: None
+        """
+        paths = [str(self._job_dir), str(self._log_path)]
+        if self.current_mixture is not None:
+            paths.append(str(self._current_mixture_dir()))
+
+        watched = set(self._watcher.files()) | set(self._watcher.directories())
+        for path in paths:
+            if path not in watched and os.path.exists(path):
+                self._watcher.addPath(path)
+
+    def _schedule_refresh(self, path: str) -> None:
+        """
+        Schedule a refresh when a watched file or folder changes, unless one is already pending.
+
+        :param path: The path of the file or folder that changed.
+        :type path: str
+        :return: None
+        :rtype: None
+        """
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def refresh(self) -> None:
+        """
+        Update the watched paths, and wake the log poller up to read the log and the progress.
+
+        :return: None
+        :rtype: None
+        """
+        self._update_watched_paths()
+        self._log_poller.wake()
+
+    def _stop_polling(self, result: int = 0) -> None:
+        """
+        Stop the log poller (after a last read) and the refresh timers.
+
+        :param result: The result code of the dialog, when it is finished.
+        :type result: int
+        :return: None
+        :rtype: None
+        """
+        self.timer.stop()
+        self._refresh_timer.stop()
+        if self._log_poller.isRunning():
+            self._log_poller.stop()
 
     def display_simulation_errors(self, code: int, message: str) -> None:
         """
@@ -163,20 +251,17 @@ class RunningProcessDialog(QDialog):
         :rtype: None
         """
 
+        failed = code != 0
         self.ui.textedit_strerror.append(message)
-        if code != 0:
-            if self.user_terminated:
-                self.ui.textedit_strerror.append("User terminated the job")
-                self.ui.label.setText(f"User terminated the job.")
-            else:
-                self.ui.label.setText(
-                    f"Job terminated due to an error with code {code}."
-                )
+        if failed and self.user_terminated:
+            self.ui.textedit_strerror.append("User terminated the job")
+        self.ui.label.setText(
+            self._END_LABELS[(failed, self.user_terminated)].format(code=code)
+        )
+        if failed:
             self.ui.tabWidget.setCurrentIndex(1)
-        else:
-            self.ui.label.setText(f"Job terminated successfully.")
         self.ui.pushButton.setEnabled(False)
-        self.timer.stop()
+        self._stop_polling()
 
     def update_time_elapsed(self) -> None:
         """
@@ -187,28 +272,17 @@ class RunningProcessDialog(QDialog):
         :rtype: None
         """
 
-    def read_log_file(self) -> None:
+    def append_log(self, chunk: str) -> None:
         """
-        Read the log file and update the displayed content.
+        Append new text of the log file to the displayed content.
+
+        :param chunk: The text appended to the log file since it was last read.
+        :type chunk: str
         :return: None
         :rtype: None
         """
-
-        try:
-            with open(
-                importlib.resources.files("scymol").joinpath(
-                    "output", str(self.job_id), "log.txt"
-                ),
-                "r",
-            ) as f:
-                content = f.read()
-            self.ui.textedit_logout.setPlainText(content)
-
-            text_cursor = self.ui.textedit_logout.textCursor()
-            text_cursor.movePosition(QTextCursor.End)
-            self.ui.textedit_logout.setTextCursor(text_cursor)
-        except Exception as e:
-            print(f"An error occurred: {e}")
+        self.ui.textedit_logout.moveCursor(QTextCursor.End)
+        self.ui.textedit_logout.insertPlainText(chunk)
 
     @log_function_call
     def explore_output_folder(self) -> None:
@@ -218,23 +292,14 @@ class RunningProcessDialog(QDialog):
         :rtype: None
         """
 
-        current_job_directory = importlib.resources.files("scymol").joinpath(
-            "output", f"{self.job_id}"
-        )
-        system_platform = platform.system()
-
-        if system_platform == "Windows":
-            subprocess.Popen(["explorer", current_job_directory])
-        elif system_platform == "Linux":
-            subprocess.Popen(["xdg-open", current_job_directory])
-        elif system_platform == "Darwin":
-            subprocess.Popen(["open", current_job_directory])
-        else:
+        if _OPENER is None:
             error_dialog = QMessageBox()
             error_dialog.setIcon(QMessageBox.Critical)
             error_dialog.setText(f"Cannot open files explorer.")
-            error_dialog.setWindowTitle()
+            error_dialog.setWindowTitle("Error")
             error_dialog.exec_()
+            return
+        subprocess.Popen([*_OPENER, str(self._job_dir)])
 
     @log_function_call
     def closeEvent(self, event: object) -> None:
@@ -251,7 +316,10 @@ class RunningProcessDialog(QDialog):
         super(RunningProcessDialog, self).closeEvent(
             event
         )  # call the superclass method to actually close the dialog
-        self.timer.stop()  # Stop the timer when the dialog is closed
+        self._stop_polling()  # Stop the timers and the log poller when the dialog is closed
+        watched = self._watcher.files() + self._watcher.directories()
+        if watched:
+            self._watcher.removePaths(watched)  # Stop watching the job files
 
     @log_function_call
     def terminate_job(self) -> None:
@@ -264,6 +332,6 @@ class RunningProcessDialog(QDialog):
         if self.backend_thread is not None:
             self.backend_thread.terminate_process()  # terminate the process when dialog is closed
 
-        self.timer.stop()  # Stop the timer when the job is terminated
+        self._stop_polling()  # Stop the timers and the log poller when the job is terminated
         self.ui.pushButton.setEnabled(False)
         self.user_terminated = True
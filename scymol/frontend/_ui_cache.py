@@ -0,0 +1,22 @@
+import functools
+import importlib.resources
+
+from PyQt5 import uic
+
+
+@functools.lru_cache(maxsize=None)
+def load_ui(name: str) -> type:
+    """
+    Load the form class generated from a .ui file of scymol.frontend.uis, once per file.
+
+    :param name: The name of the .ui file, e.g., "smiles_window.ui".
+    :type name: str
+    :return: The generated form class, providing setupUi().
+    :rtype: type
+    """
+    ui_path = importlib.resources.files("scymol.frontend.uis").joinpath(name)
+
+    # Open the .ui file as a file object and load it with uic.loadUiType
+    with ui_path.open("r", encoding="utf8") as f:
+        form_class, _ = uic.loadUiType(f)
+    return form_class
@@ -5,9 +5,13 @@ from PyQt5.QtWidgets import (
     QSpinBox,
     QCheckBox,
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 import scymol.static_functions as static_functions
-from scymol.logging_functions import print_to_log, log_function_call
+from scymol.logging_functions import (
+    print_to_log,
+    log_function_call,
+    log_hot_function_call,
+)
 
 
 class MixtureTableWidget(QTableWidget):
@@ -39,6 +43,13 @@ class MixtureTableWidget(QTableWidget):
         self.main_window.tabWidget.currentChanged.connect(
             self.update_mixture_table_on_tab_change
         )
+        # Recomputes the mixture information once a burst of spin box changes is over
+        self._recalc_timer = QTimer(self)
+        self._recalc_timer.setSingleShot(True)
+        self._recalc_timer.setInterval(50)
+        self._recalc_timer.timeout.connect(self.generate_mixture_information)
+        # Inputs the mixture information label was last generated from
+        self._last_info_key = None
 
     @log_function_call
     def update_mixture_table_on_tab_change(self, index: int) -> None:
@@ -51,13 +62,40 @@ class MixtureTableWidget(QTableWidget):
         if index != 1:
             return
 
-        self.setRowCount(0)
-
-        for row in range(self.main_window.tab1.moleculeList.count()):
-            item = self.main_window.tab1.moleculeList.item(row)
-            name = item.text()
-            data = self.main_window.mixture_table[name]
-            self.update_mixture_table(name, data["number"], data["rotate"])
+        # Update the rows with updates, signals and sorting disabled, so the table is laid
+        # out and the mixture information is computed only once.
+        molecule_list = self.main_window.tab1.moleculeList
+        names = [molecule_list.item(row).text() for row in range(molecule_list.count())]
+        sorting_enabled = self.isSortingEnabled()
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        self.setSortingEnabled(False)
+        try:
+            # Remove the rows of molecules that are no longer in the list
+            names_set = set(names)
+            for row in reversed(range(self.rowCount())):
+                if self.item(row, 0).text() not in names_set:
+                    self.removeRow(row)
+
+            # The remaining rows are kept (with their widgets) if they are in list order.
+            # Otherwise, the table is rebuilt.
+            kept_names = [self.item(row, 0).text() for row in range(self.rowCount())]
+            if kept_names != names[: len(kept_names)]:
+                self.setRowCount(0)
+                kept_names = []
+
+            self.setRowCount(len(names))
+            for row, name in enumerate(names):
+                data = self.main_window.mixture_table[name]
+                if row < len(kept_names):
+                    self._update_row(row, data["number"], data["rotate"])
+                else:
+                    self._fill_row(row, name, data["number"], data["rotate"])
+        finally:
+            self.setSortingEnabled(sorting_enabled)
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
+        self.generate_mixture_information()
 
     @log_function_call
     def update_mixture_table(self, name: str, number: int, rotate: bool) -> None:
@@ -73,26 +111,76 @@ class MixtureTableWidget(QTableWidget):
         """
         row_position = self.rowCount()
         self.insertRow(row_position)
+        self._fill_row(row_position, name, number, rotate)
+        self.generate_mixture_information()
+
+    def _fill_row(self, row_position: int, name: str, number: int, rotate: bool) -> None:
+        """
+        Fill an existing row of the mixture table with the given data.
+
+        :param row_position: The index of the row to fill.
+        :type row_position: int
+        :param name: The name of the molecule.
+        :type name: str
+        :param number: The number of molecules.
+        :type number: int
+        :param rotate: Whether to rotate the molecule.
+        :type rotate: bool
+        """
         self.setItem(row_position, 0, QTableWidgetItem(name))
         spin_box = QSpinBox()
         spin_box.setMaximum(9999999)
         spin_box.setValue(number)
-        spin_box.valueChanged.connect(
-            lambda n, name=name: (
-                self.update_number(name, n),
-                self.generate_mixture_information(),
-            )
-        )
+        # The slots shared by all rows find the molecule from the sender's "mol_name" property
+        spin_box.setProperty("mol_name", name)
+        spin_box.valueChanged.connect(self._on_spin_changed)
         self.setCellWidget(row_position, 1, spin_box)
         rotate_checkbox = QCheckBox("Rotate")
         rotate_checkbox.setChecked(rotate)
-        rotate_checkbox.stateChanged.connect(
-            lambda state, name=name: self.update_rotate(name, state)
-        )
+        rotate_checkbox.setProperty("mol_name", name)
+        rotate_checkbox.stateChanged.connect(self._on_rotate_changed)
         self.setCellWidget(row_position, 2, rotate_checkbox)
-        self.generate_mixture_information()
 
-    @log_function_call
+    def _update_row(self, row_position: int, number: int, rotate: bool) -> None:
+        """
+        Set the values of the widgets of an existing row, without emitting their signals.
+
+        :param row_position: The index of the row to update.
+        :type row_position: int
+        :param number: The number of molecules.
+        :type number: int
+        :param rotate: Whether to rotate the molecule.
+        :type rotate: bool
+        """
+        spin_box = self.cellWidget(row_position, 1)
+        spin_box.blockSignals(True)
+        spin_box.setValue(number)
+        spin_box.blockSignals(False)
+        rotate_checkbox = self.cellWidget(row_position, 2)
+        rotate_checkbox.blockSignals(True)
+        rotate_checkbox.setChecked(rotate)
+        rotate_checkbox.blockSignals(False)
+
+    def _on_spin_changed(self, number: int) -> None:
+        """
+        Update the number of molecules of the row whose spin box changed.
+
+        :param number: The new number of molecules.
+        :type number: int
+        """
+        self.update_number(self.sender().property("mol_name"), number)
+        self._recalc_timer.start()
+
+    def _on_rotate_changed(self, state: int) -> None:
+        """
+        Update the rotation state of the row whose check box changed.
+
+        :param state: The rotation state (0 for unchecked, 2 for checked).
+        :type state: int
+        """
+        self.update_rotate(self.sender().property("mol_name"), state)
+
+    @log_hot_function_call
     def update_number(self, name: str, number: int) -> None:
         """
         Update the number of molecules for a given name.
@@ -104,7 +192,7 @@ class MixtureTableWidget(QTableWidget):
         """
         self.main_window.mixture_table[name]["number"] = number
 
-    @log_function_call
+    @log_hot_function_call
     def update_rotate(self, name: str, state: int) -> None:
         """
         Update the rotation state for a given name.
@@ -122,14 +210,23 @@ class MixtureTableWidget(QTableWidget):
         Generate and update the mixture information label.
 
         This method computes the mixture information based on the current state of the mixture table
-        and updates the relevant label in the main application window.
+        and updates the relevant label in the main application window. Nothing is done if the
+        mixture table and the molecule objects are the same as the last time.
 
         :return: None
         :rtype: None
         """
+        molecules_objects = self.main_window.molecules_objects
+        key = tuple(
+            (name, data["number"], data["rotate"], molecules_objects.get(name))
+            for name, data in self.main_window.mixture_table.items()
+        )
+        if key == self._last_info_key:
+            return
         self.main_window.label_mixture_info.setText(
             static_functions.generate_mixture_information(
                 mixture_table=self.main_window.mixture_table,
-                molecules_objects=self.main_window.molecules_objects,
+                molecules_objects=molecules_objects,
             )
         )
+        self._last_info_key = key
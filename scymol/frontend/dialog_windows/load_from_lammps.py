@@ -1,18 +1,7 @@
-import importlib
-
-from PyQt5 import uic
 from PyQt5.QtWidgets import QDialog, QFileDialog, QWidget
 from typing import Tuple, Optional
 from scymol.logging_functions import print_to_log, log_function_call
-
-# Resolve the full path to the .ui file
-ui_path = importlib.resources.files("scymol.frontend.uis").joinpath(
-    "load_from_lammps_dialog.ui"
-)
-
-# Open the .ui file as a file object and load it with uic.loadUiType
-with ui_path.open("r", encoding="utf8") as f:
-    Ui_LoadFromLammpsDialog, _ = uic.loadUiType(f)
+from scymol.frontend._ui_cache import load_ui
 
 
 class LoadFromLammpsDialog(QDialog):
@@ -31,7 +20,7 @@ class LoadFromLammpsDialog(QDialog):
         :type parent: QWidget, optional
         """
         super(LoadFromLammpsDialog, self).__init__(parent)
-        self.ui = Ui_LoadFromLammpsDialog()
+        self.ui = load_ui("load_from_lammps_dialog.ui")()
         self.ui.setupUi(self)
         self.connect_signals()
 
@@ -1,23 +1,36 @@
-import importlib
+import functools
 
-from PyQt5 import uic
+from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import QDialog, QWidget
 from typing import Optional
-from scymol.logging_functions import print_to_log, log_function_call
+from scymol.logging_functions import (
+    print_to_log,
+    log_function_call,
+    log_hot_function_call,
+)
+from scymol.frontend._ui_cache import load_ui
 
-# Resolve the full path to the .ui file
-ui_path = importlib.resources.files("scymol.frontend.uis").joinpath("smiles_window.ui")
 
-# Open the .ui file as a file object and load it with uic.loadUiType
-with ui_path.open("r", encoding="utf8") as f:
-    Ui_SmilesWindow, _ = uic.loadUiType(f)
+@functools.lru_cache(maxsize=1024)
+def _smiles_is_valid(name: str, smiles: str) -> bool:
+    """
+    Check whether a name and a SMILES string can be accepted, memoized by the input texts.
+
+    :param name: The name of the molecule.
+    :type name: str
+    :param smiles: The SMILES string of the molecule.
+    :type smiles: str
+    :return: True if both the name and the SMILES string are given.
+    :rtype: bool
+    """
+    return bool(name and smiles)
 
 
-class SmilesWindow(QDialog, Ui_SmilesWindow):
+class SmilesWindow(QDialog):
     """
     A dialog window for entering SMILES string and name of a molecule.
 
-    Inherits from QDialog and the generated Ui_SmilesWindow.
+    Inherits from QDialog.
 
     :param parent: The parent widget, defaults to None.
     :type parent: QWidget, optional
@@ -34,14 +47,21 @@ class SmilesWindow(QDialog, Ui_SmilesWindow):
         super(SmilesWindow, self).__init__(parent)
         self.input_name: Optional[str] = None
         self.input_smiles: Optional[str] = None
-        self.setupUi(self)  # Sets up the UI elements on the QDialog
+        self.ui = load_ui("smiles_window.ui")()
+        self.ui.setupUi(self)  # Sets up the UI elements on the QDialog
 
-        self.pushButton.clicked.connect(self.close_window)
-        self.lineedit_name.textChanged.connect(self.validate_inputs)
-        self.lineedit_smiles.textChanged.connect(self.validate_inputs)
-        self.pushButton.setEnabled(False)
+        # The inputs are validated once the user stops typing for 100 ms
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(100)
+        self._validate_timer.timeout.connect(self.validate_inputs)
 
-    @log_function_call
+        self.ui.pushButton.clicked.connect(self.close_window)
+        self.ui.lineedit_name.textChanged.connect(lambda _: self._validate_timer.start())
+        self.ui.lineedit_smiles.textChanged.connect(lambda _: self._validate_timer.start())
+        self.ui.pushButton.setEnabled(False)
+
+    @log_hot_function_call
     def validate_inputs(self) -> None:
         """
         Validate the inputs in the line edits and enable/disable the OK button accordingly.
@@ -49,9 +69,9 @@ class SmilesWindow(QDialog, Ui_SmilesWindow):
         :return: None
         :rtype: None
         """
-        name_text = self.lineedit_name.text()
-        smiles_text = self.lineedit_smiles.text()
-        self.pushButton.setEnabled(bool(name_text and smiles_text))
+        name_text = self.ui.lineedit_name.text()
+        smiles_text = self.ui.lineedit_smiles.text()
+        self.ui.pushButton.setEnabled(_smiles_is_valid(name_text, smiles_text))
 
     @log_function_call
     def close_window(self) -> None:
@@ -61,6 +81,10 @@ class SmilesWindow(QDialog, Ui_SmilesWindow):
         :return: None
         :rtype: None
         """
-        self.input_smiles = self.lineedit_smiles.text()
-        self.input_name = self.lineedit_name.text()
+        self.input_smiles = self.ui.lineedit_smiles.text()
+        self.input_name = self.ui.lineedit_name.text()
+        # The button may still be enabled from before the last (not yet validated) edit
+        if not _smiles_is_valid(self.input_name, self.input_smiles):
+            self.validate_inputs()
+            return
         self.accept()  # Sets the dialog result to Accepted
@@ -1,17 +1,6 @@
-import importlib
-
-from PyQt5 import uic
 from PyQt5.QtWidgets import QMainWindow
 from scymol.logging_functions import print_to_log, log_function_call
-
-# Resolve the full path to the .ui file
-ui_path = importlib.resources.files("scymol.frontend.uis").joinpath(
-    "lmpstage_initialize.ui"
-)
-
-# Open the .ui file as a file object and load it with uic.loadUiType
-with ui_path.open("r", encoding="utf8") as f:
-    Ui_InitializeWindow, _ = uic.loadUiType(f)
+from scymol.frontend._ui_cache import load_ui
 
 
 class LammpsInitializeSubstage(QMainWindow):
@@ -36,7 +25,7 @@ class LammpsInitializeSubstage(QMainWindow):
         :rtype: None
         """
         super(LammpsInitializeSubstage, self).__init__()
-        self.ui = Ui_InitializeWindow()
+        self.ui = load_ui("lmpstage_initialize.ui")()
         self.ui.setupUi(self)
         self.setWindowTitle("Initialize Properties")
 
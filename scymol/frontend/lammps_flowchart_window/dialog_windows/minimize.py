@@ -1,17 +1,6 @@
-import importlib
-
-from PyQt5 import uic
 from PyQt5.QtWidgets import QMainWindow
 from scymol.logging_functions import print_to_log, log_function_call
-
-# Resolve the full path to the .ui file
-ui_path = importlib.resources.files("scymol.frontend.uis").joinpath(
-    "lmpstage_minimize.ui"
-)
-
-# Open the .ui file as a file object and load it with uic.loadUiType
-with ui_path.open("r", encoding="utf8") as f:
-    Ui_MinimizeWindow, _ = uic.loadUiType(f)
+from scymol.frontend._ui_cache import load_ui
 
 
 class LammpsMinimizeSubstage(QMainWindow):
@@ -37,7 +26,7 @@ class LammpsMinimizeSubstage(QMainWindow):
         :rtype: None
         """
         super(LammpsMinimizeSubstage, self).__init__()
-        self.ui = Ui_MinimizeWindow()
+        self.ui = load_ui("lmpstage_minimize.ui")()
         self.ui.setupUi(self)
         self.setWindowTitle("Minimize Properties")
 
@@ -1,15 +1,7 @@
-from PyQt5 import uic
 from PyQt5.QtWidgets import QMainWindow
-import importlib
 
 from scymol.logging_functions import print_to_log, log_function_call
-
-# Resolve the full path to the .ui file
-ui_path = importlib.resources.files("scymol.frontend.uis").joinpath("lmpstage_nve.ui")
-
-# Open the .ui file as a file object and load it with uic.loadUiType
-with ui_path.open("r", encoding="utf8") as f:
-    Ui_NveWindow, _ = uic.loadUiType(f)
+from scymol.frontend._ui_cache import load_ui
 
 
 class LammpsNveSubstage(QMainWindow):
@@ -36,7 +28,7 @@ class LammpsNveSubstage(QMainWindow):
         :rtype: None
         """
         super(LammpsNveSubstage, self).__init__()
-        self.ui = Ui_NveWindow()
+        self.ui = load_ui("lmpstage_nve.ui")()
         self.ui.setupUi(self)
         self.setWindowTitle("NVE Properties Editor")
 
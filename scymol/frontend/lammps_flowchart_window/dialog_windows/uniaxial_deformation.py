@@ -1,17 +1,6 @@
-import importlib
-
-from PyQt5 import uic
 from PyQt5.QtWidgets import QMainWindow
 from scymol.logging_functions import print_to_log, log_function_call
-
-# Resolve the full path to the .ui file
-ui_path = importlib.resources.files("scymol.frontend.uis").joinpath(
-    "lmpstage_uniaxialdeformation.ui"
-)
-
-# Open the .ui file as a file object and load it with uic.loadUiType
-with ui_path.open("r", encoding="utf8") as f:
-    Ui_UniaxialDeformationWindow, _ = uic.loadUiType(f)
+from scymol.frontend._ui_cache import load_ui
 
 
 class LammpsUniaxialDeformation(QMainWindow):
@@ -38,7 +27,7 @@ class LammpsUniaxialDeformation(QMainWindow):
         :rtype: None
         """
         super(LammpsUniaxialDeformation, self).__init__()
-        self.ui = Ui_UniaxialDeformationWindow()
+        self.ui = load_ui("lmpstage_uniaxialdeformation.ui")()
         self.ui.setupUi(self)
         self.setWindowTitle("Uniaxial Deformation")
 
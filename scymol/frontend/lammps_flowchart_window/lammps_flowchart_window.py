@@ -1,6 +1,3 @@
-import importlib
-
-from PyQt5 import uic
 from PyQt5.QtCore import Qt, QPoint
 from PyQt5.QtWidgets import QListWidget, QMenu, QAction, QMainWindow, QListWidgetItem
 from scymol.frontend.custom_qtwidgets.list_of_lammps_substages import (
@@ -21,14 +18,7 @@ from scymol.frontend.lammps_flowchart_window.dialog_windows.nve import LammpsNve
 from scymol.frontend.lammps_flowchart_window.dialog_windows.uniaxial_deformation import (
     LammpsUniaxialDeformation,
 )
-
-
-# Resolve the full path to the .ui file
-ui_path = importlib.resources.files("scymol.frontend.uis").joinpath("pop_window.ui")
-
-# Open the .ui file as a file object and load it with uic.loadUiType
-with ui_path.open("r", encoding="utf8") as f:
-    Ui_FlowChartWindow, _ = uic.loadUiType(f)
+from scymol.frontend._ui_cache import load_ui
 
 
 class LammpsFlowChartWindow(QMainWindow):
@@ -53,7 +43,7 @@ class LammpsFlowChartWindow(QMainWindow):
             parent (QWidget, optional): The parent widget. Defaults to None.
         """
         super(LammpsFlowChartWindow, self).__init__(parent)
-        self.ui = Ui_FlowChartWindow()
+        self.ui = load_ui("pop_window.ui")()
         self.ui.setupUi(self)
         self.setWindowTitle(stageName)
         layout = self.ui.horizontalLayout
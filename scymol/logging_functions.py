@@ -10,6 +10,9 @@ logging.basicConfig(
     filemode="w",
 )
 
+# Whether log_hot_function_call logs the calls of the (frequently called) functions it decorates
+LOG_HOT = False
+
 
 def print_to_log(message: str, level: str = "info"):
     """
@@ -17,10 +20,12 @@ def print_to_log(message: str, level: str = "info"):
 
     :param message: The message to be logged.
     :type message: str
-    :param level: The log level ('info', 'warning', 'critical').
+    :param level: The log level ('debug', 'info', 'warning', 'critical').
     :type level: str
     """
-    if level.lower() == "warning":
+    if level.lower() == "debug":
+        logging.debug(message)
+    elif level.lower() == "warning":
         logging.warning(message)
     elif level.lower() == "critical":
         logging.critical(message)
@@ -61,3 +66,19 @@ def log_function_call(func: Callable) -> Callable:
         return func(*args, **kwargs)
 
     return wrapper
+
+
+def log_hot_function_call(func: Callable) -> Callable:
+    """
+    Decorator like log_function_call, for functions called on every timer tick or keystroke.
+
+    The calls are only logged if LOG_HOT is True when the function is defined. Otherwise, the
+    function is returned undecorated, so it runs without the overhead of the wrapper.
+
+    :param func: The function to be wrapped.
+    :type func: Callable
+
+    :return: The wrapped function, or func itself.
+    :rtype: Callable
+    """
+    return log_function_call(func) if LOG_HOT else func